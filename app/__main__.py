@@ -1,13 +1,32 @@
 import sys
 
+from PyQt5.QtCore import QTimer
+
 from app.context import AppContext
+from app.utils.profiling import startup_profiler
+
+
+def report_startup_profile():
+    startup_profiler.mark("first event loop iteration")
+    print(startup_profiler.report(), file=sys.stderr)
 
 
-def run(*args, **kwargs):
-    context = AppContext(*args, **kwargs)
-    context.main_win.show()
+def run(*args, profile_startup=False, **kwargs):
+    if profile_startup:
+        startup_profiler.enable()
+    with startup_profiler.phase("startup"):
+        context = AppContext(*args, **kwargs)
+        with startup_profiler.phase("main window"):
+            main_win = context.main_win
+        with startup_profiler.phase("show"):
+            main_win.show()
+    if profile_startup:
+        QTimer.singleShot(0, report_startup_profile)
     sys.exit(context.app.exec_())
 
 
 if __name__ == "__main__":
-    run(files=sys.argv[1:])
+    args = sys.argv[1:]
+    profile_startup = "--profile-startup" in args
+    files = [a for a in args if a != "--profile-startup"]
+    run(files=files, profile_startup=profile_startup)
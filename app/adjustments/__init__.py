@@ -32,8 +32,11 @@ class OpenMediaPlayerAdjustmentsWindowAction(PopupWindowAction):
         super().__init__(
             icon=gui.icons.get("open_media_player_adjustments"),
             text="Media Player Adjustments",
-            widget=MediaPlayerAdjustmentsWindow(
-                main_win=main_win, media_player=media_player, parent=main_win
-            ),
             main_win=main_win,
         )
+        self.media_player = media_player
+
+    def create(self):
+        return MediaPlayerAdjustmentsWindow(
+            main_win=self.main_win, media_player=self.media_player, parent=self.main_win
+        )
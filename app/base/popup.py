@@ -46,15 +46,39 @@ class PopupWindowWidget(QWidget):
 
 
 class PopupWindowAction(QAction):
-    def __init__(self, icon, text, widget: PopupWindowWidget, main_win):
+    """Action that toggles a popup window.
+
+    Subclasses may pass `widget=None` and implement `create()` instead, to build the
+    window the first time it is needed.
+    """
+
+    def __init__(self, icon, text, main_win, widget: PopupWindowWidget = None):
         super().__init__(icon, text)
         self.main_win = main_win
-        self.widget = widget
+        self._widget = None
         self.widget_pos = None
         self.setCheckable(True)
         self.setChecked(False)
         self.triggered.connect(self.on_triggered)
-        self.widget.hiddenchanged.connect(self.on_win_hiddenchanged)
+        if widget:
+            self._set_widget(widget)
+
+    def create(self) -> PopupWindowWidget:
+        """Must return a PopupWindowWidget if no widget was given on init"""
+        raise NotImplementedError
+
+    def create_widget(self) -> PopupWindowWidget:
+        if not self._widget:
+            self._set_widget(self.create())
+        return self._widget
+
+    @property
+    def widget(self) -> PopupWindowWidget:
+        return self.create_widget()
+
+    def _set_widget(self, widget):
+        self._widget = widget
+        self._widget.hiddenchanged.connect(self.on_win_hiddenchanged)
 
     def on_triggered(self, checked):
         if checked:
@@ -0,0 +1,180 @@
+import logging
+from collections import OrderedDict
+from typing import Callable, Dict, NamedTuple
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from app.utils.logs import span
+
+log = logging.getLogger(__name__)
+
+
+class CommandError(Exception):
+    pass
+
+
+class CommandSpec(NamedTuple):
+    method: str
+    args: Dict[str, type]
+
+
+# Command name -> dispatcher method and required argument types
+COMMANDS = {
+    "load_playlist": CommandSpec("load_playlist", {"paths": list}),
+    "select_index": CommandSpec("select_index", {"index": int}),
+    "play": CommandSpec("play", {}),
+    "pause": CommandSpec("pause", {}),
+    "stop": CommandSpec("stop", {}),
+    "seek": CommandSpec("seek", {"time_ms": int}),
+    "skip_next": CommandSpec("skip_next", {}),
+    "skip_previous": CommandSpec("skip_previous", {}),
+    "set_volume": CommandSpec("set_volume", {"volume": int}),
+    "set_loop_mode": CommandSpec("set_loop_mode", {"mode": str}),
+}
+
+
+def validate_args(name: str, args: dict) -> dict:
+    if not isinstance(name, str):
+        raise CommandError("Command name must be str")
+    try:
+        spec = COMMANDS[name]
+    except KeyError:
+        raise CommandError(f"Unknown command '{name}'")
+    if not isinstance(args, dict):
+        raise CommandError("Command args must be dict")
+    for arg_name, arg_type in spec.args.items():
+        if arg_name not in args:
+            raise CommandError(f"Missing argument '{arg_name}'")
+        value = args[arg_name]
+        if isinstance(value, bool) or not isinstance(value, arg_type):
+            raise CommandError(f"Argument '{arg_name}' must be {arg_type.__name__}")
+    unexpected = set(args) - set(spec.args)
+    if unexpected:
+        raise CommandError(f"Unexpected arguments {sorted(unexpected)}")
+    return args
+
+
+class CommandDispatcher(QObject):
+    """Run playlist and transport commands sent by an operator console.
+
+    The server sends a 'commands' message holding a batch of commands, each with a
+    unique 'id'. Commands run in order and a single 'ack' message with a result per
+    command is sent back. Results are remembered for the last `history_size` ids, so a
+    command that is resent after a lost ack is acknowledged again without running
+    twice.
+    """
+
+    commandexecuted = pyqtSignal(str, bool)
+
+    def __init__(
+        self,
+        io_ctrlr,
+        listplayer,
+        media_player,
+        playlist_widget,
+        vol_mngr,
+        loop_mode_mngr,
+        history_size: int = 256,
+    ):
+        super().__init__()
+        self.io_ctrlr = io_ctrlr
+        self.lp = listplayer
+        self.mp = media_player
+        self.playlist_widget = playlist_widget
+        self.vol_mngr = vol_mngr
+        self.loop_mode_mngr = loop_mode_mngr
+        self.history_size = history_size
+        self._results: OrderedDict = OrderedDict()
+        self.io_ctrlr.add_message_handler("commands", self.on_commands)
+
+    def on_commands(self, message: dict):
+        commands = message.get("commands")
+        if not isinstance(commands, list):
+            log.error("Malformed commands message: %.200s", message)
+            return
+        results = [self.execute(command) for command in commands]
+        self.io_ctrlr.send_message("ack", results=results)
+
+    def execute(self, command: dict) -> dict:
+        command_id = command.get("id") if isinstance(command, dict) else None
+        if command_id is None:
+            return {"id": None, "ok": False, "error": "Missing command id"}
+        if isinstance(command_id, bool) or not isinstance(command_id, (str, int)):
+            log.error("Malformed command id: %.200s", command_id)
+            return {"id": None, "ok": False, "error": "Command id must be str or int"}
+        if command_id in self._results:
+            self._results.move_to_end(command_id)
+            return self._results[command_id]
+
+        name = command.get("name")
+        args = command.get("args")
+        try:
+            args = validate_args(name, {} if args is None else args)
+            method: Callable = getattr(self, COMMANDS[name].method)
+            method(**args)
+        except (CommandError, ValueError) as e:
+            result = {"id": command_id, "ok": False, "error": str(e)}
+            log.error(f"COMMAND FAILED id={command_id} name={name} error={e}")
+        except Exception as e:
+            # A malformed command must not escape the socket's message slot
+            result = {"id": command_id, "ok": False, "error": "Internal error"}
+            log.exception(f"COMMAND FAILED id={command_id} name={name} error={e}")
+        else:
+            result = {"id": command_id, "ok": True}
+            log.debug("COMMAND id=%s name=%s args=%s", command_id, name, args)
+
+        self._results[command_id] = result
+        if len(self._results) > self.history_size:
+            self._results.popitem(last=False)
+        self.commandexecuted.emit(str(name), result["ok"])
+        return result
+
+    def load_playlist(self, paths: list):
+        if not all(isinstance(path, str) for path in paths):
+            raise CommandError("Argument 'paths' must be a list of str")
+        model = self.playlist_widget.view.model()
+        if model.rowCount():
+            self.mp.stop()
+            model.removeRows(0, model.rowCount())
+        self.playlist_widget.add_media(paths)
+        if not model.rowCount():
+            raise CommandError("No media found")
+
+    def select_index(self, index: int):
+        model = self.playlist_widget.view.model()
+        if not 0 <= index < model.rowCount():
+            raise CommandError(f"No playlist item at index {index}")
+        self.lp.load_media(model.index(index, 0))
+
+    def play(self):
+        self.mp.play()
+
+    def pause(self):
+        self.mp.set_pause(1)
+
+    def stop(self):
+        self.mp.stop()
+
+    def seek(self, time_ms: int):
+        if not self.mp.has_media():
+            raise CommandError("No media loaded")
+        with span(log, "seek", source="command", time_ms=time_ms):
+            self.mp.set_time(max(0, time_ms))
+
+    def skip_next(self):
+        if not self.lp.item():
+            raise CommandError("No media loaded")
+        self.lp.skip_next()
+
+    def skip_previous(self):
+        if not self.lp.item():
+            raise CommandError("No media loaded")
+        self.lp.skip_previous()
+
+    def set_volume(self, volume: int):
+        if not 0 <= volume <= 100:
+            raise CommandError("Volume must be between 0 and 100")
+        self.vol_mngr.set_volume(volume)
+
+    def set_loop_mode(self, mode: str):
+        self.loop_mode_mngr.set_mode(mode)
@@ -15,8 +15,31 @@ class ClientSettingsDialog(base.modal.BaseModalSettingsDialog):
         self.server_url_edit.setText(config.state.url)
         form_lo.addRow(self.tr("Server URL"), self.server_url_edit)
 
+        self.telemetry_checkbox = QtWidgets.QCheckBox()
+        self.telemetry_checkbox.setChecked(config.state.telemetry_enable)
+        form_lo.addRow(self.tr("Send playback telemetry"), self.telemetry_checkbox)
+
+        self.sync_checkbox = QtWidgets.QCheckBox()
+        self.sync_checkbox.setChecked(config.state.sync_enable)
+        form_lo.addRow(self.tr("Sync playback to server clock"), self.sync_checkbox)
+
+        self.sync_tolerance_spinbox = QtWidgets.QSpinBox()
+        self.sync_tolerance_spinbox.setSuffix(" ms")
+        self.sync_tolerance_spinbox.setRange(
+            config.schema["sync_tolerance_ms"]["min"],
+            config.schema["sync_tolerance_ms"]["max"],
+        )
+        self.sync_tolerance_spinbox.setValue(config.state.sync_tolerance_ms)
+        form_lo.addRow(self.tr("Sync tolerance"), self.sync_tolerance_spinbox)
+
     def save(self):
         config.state.url = self.server_url_edit.text()
+        config.state.telemetry_enable = self.telemetry_checkbox.isChecked()
+        self.main_win.telemetry.set_enabled(config.state.telemetry_enable)
+        config.state.sync_enable = self.sync_checkbox.isChecked()
+        config.state.sync_tolerance_ms = self.sync_tolerance_spinbox.value()
+        self.main_win.synchronizer.tolerance_ms = config.state.sync_tolerance_ms
+        self.main_win.synchronizer.set_enabled(config.state.sync_enable)
 
 
 class OpenClientSettingsDialogAction(base.modal.BaseOpenModalSettingsDialogAction):
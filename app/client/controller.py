@@ -1,6 +1,10 @@
+import json
 import logging
+import time
 from array import array
+from typing import Callable, Dict
 
+from PyQt5 import QtNetwork
 from PyQt5.QtCore import QByteArray
 from PyQt5.QtWebSockets import QWebSocket
 
@@ -11,18 +15,43 @@ class IOController:
     def __init__(self, socket: QWebSocket):
         self.socket = socket
         self.motion_state = None
+        self.motion_packets = 0
+        self.motion_received_at = None
         self.state_changed = False
 
         self._curr_motion_state = QByteArray()
         self._last_motion_state = QByteArray()
+        self._message_handlers: Dict[str, Callable[[dict], None]] = {}
 
         self.socket.binaryMessageReceived.connect(self.received_bytes)
+        self.socket.textMessageReceived.connect(self.received_text)
 
     def received_bytes(self, qbytearray):
         self._curr_motion_state = qbytearray
+        self.motion_packets += 1
+        self.motion_received_at = time.monotonic()
 
     def get_new_motion_state(self):
         if self._curr_motion_state == self._last_motion_state:
             return None
         motion_state_array = array("d", self._curr_motion_state.data())
         return motion_state_array
+
+    def add_message_handler(self, message_type: str, handler: Callable[[dict], None]):
+        """Call `handler(message)` for each received text message of `message_type`"""
+        self._message_handlers[message_type] = handler
+
+    def received_text(self, text: str):
+        try:
+            message = json.loads(text)
+            handler = self._message_handlers[message["type"]]
+        except (ValueError, TypeError, KeyError):
+            log.error("Unhandled text message: %.200s", text)
+            return
+        handler(message)
+
+    def send_message(self, message_type: str, **fields):
+        if self.socket.state() != QtNetwork.QAbstractSocket.ConnectedState:
+            return False
+        self.socket.sendTextMessage(json.dumps({"type": message_type, **fields}))
+        return True
@@ -20,10 +20,10 @@ class ClientSocketBase(QWebSocket):
 
     def __connected(self):
         self.peeraddr = self.peerAddress().toString()
-        log.info(f"CONNECTED peer_address={getattr(self, 'peeraddr', '')}")
+        log.info("CONNECTED peer_address=%s", getattr(self, "peeraddr", ""))
 
     def __disconnected(self):
-        log.info(f"DISCONNECTED peer_address={getattr(self, 'peeraddr', '')}")
+        log.info("DISCONNECTED peer_address=%s", getattr(self, "peeraddr", ""))
         self.peeraddr = None
 
     def _pong(self, elapsed_time, payload):
@@ -82,10 +82,13 @@ class AutoReconnectSocket(ClientSocketBase):
 
     def _attempt_open(self):
         self.connect_timer.singleShot(0, lambda: self.open(self.qurl))
-        log.info(f"SOCKET OPEN ATTEMPT qurl={self.qurl}")
+        log.info("SOCKET OPEN ATTEMPT qurl=%s", self.qurl)
 
     def _on_state_changed(self, state: QtNetwork.QAbstractSocket.SocketState):
-        log.info(f"SOCKET STATE CHANGED state={self.state_str()} qurl={self.qurl}")
+        if log.isEnabledFor(logging.INFO):  # state_str() is not free
+            log.info(
+                "SOCKET STATE CHANGED state=%s qurl=%s", self.state_str(), self.qurl
+            )
         if state == QtNetwork.QAbstractSocket.UnconnectedState:
             if self.__connection_expected:
                 self._attempt_open()
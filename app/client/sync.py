@@ -0,0 +1,225 @@
+import logging
+import math
+import time
+from collections import deque
+from typing import Optional
+
+from PyQt5.QtCore import QObject, Qt, QTimer, pyqtSignal, pyqtSlot
+
+from app.utils.logs import span
+
+log = logging.getLogger(__name__)
+
+
+def local_time_ms() -> float:
+    return time.monotonic() * 1000
+
+
+class ClockOffsetEstimator:
+    """NTP-style estimate of the offset between the local and server clocks.
+
+    Each exchange gives t0 (client send), t1 (server receive), t2 (server send) and
+    t3 (client receive). Of the last `window` exchanges, the one with the smallest
+    round-trip delay is trusted, since queueing delay only ever adds error.
+    """
+
+    def __init__(self, window: int = 8):
+        self.samples: deque = deque(maxlen=window)
+
+    def add_exchange(self, t0, t1, t2, t3):
+        delay = (t3 - t0) - (t2 - t1)
+        offset = ((t1 - t0) + (t2 - t3)) / 2
+        self.samples.append((delay, offset))
+
+    def has_estimate(self) -> bool:
+        return bool(self.samples)
+
+    def offset(self) -> float:
+        return min(self.samples)[1]
+
+    def delay(self) -> float:
+        return min(self.samples)[0]
+
+    def server_time(self, local_ms: Optional[float] = None) -> float:
+        local_ms = local_time_ms() if local_ms is None else local_ms
+        return local_ms + self.offset()
+
+
+class DriftStatistics:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.last = 0.0
+        self.max_abs = 0.0
+        self.seeks = 0
+        self.rate_adjustments = 0
+        self._sum = 0.0
+        self._sum_squares = 0.0
+
+    def add(self, drift: float):
+        self.count += 1
+        self.last = drift
+        self.max_abs = max(self.max_abs, abs(drift))
+        self._sum += drift
+        self._sum_squares += drift * drift
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self.count if self.count else 0.0
+
+    @property
+    def rms(self) -> float:
+        return math.sqrt(self._sum_squares / self.count) if self.count else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "last": round(self.last, 1),
+            "mean": round(self.mean, 1),
+            "rms": round(self.rms, 1),
+            "max_abs": round(self.max_abs, 1),
+            "seeks": self.seeks,
+            "rate_adjustments": self.rate_adjustments,
+        }
+
+
+class PlaybackSynchronizer(QObject):
+    """Keep the media player on a master clock broadcast by the control server.
+
+    The server sends 'master_clock' messages with the media time at a given server
+    time. Small drift is corrected by nudging the playback rate, and drift beyond
+    `seek_threshold_ms` is corrected with a seek.
+    """
+
+    driftchanged = pyqtSignal(float)
+
+    def __init__(
+        self,
+        io_ctrlr,
+        media_player,
+        tolerance_ms: float = 40,
+        seek_threshold_ms: float = 1000,
+        max_rate_adjustment: float = 0.05,
+        correction_period_ms: float = 2000,
+        check_interval_ms: int = 250,
+        sync_interval_ms: int = 2000,
+    ):
+        super().__init__()
+        self.io_ctrlr = io_ctrlr
+        self.mp = media_player
+        self.tolerance_ms = tolerance_ms
+        self.seek_threshold_ms = seek_threshold_ms
+        self.max_rate_adjustment = max_rate_adjustment
+        self.correction_period_ms = correction_period_ms
+
+        self.clock = ClockOffsetEstimator()
+        self.stats = DriftStatistics()
+        self.master: Optional[dict] = None
+        self._enabled = False
+        self._burst_remaining = 0
+        self._rate = 1.0
+
+        self.check_timer = QTimer(self)
+        self.check_timer.setTimerType(Qt.PreciseTimer)
+        self.check_timer.setInterval(check_interval_ms)
+        self.check_timer.timeout.connect(self.correct)
+
+        self.sync_timer = QTimer(self)
+        self.sync_timer.setTimerType(Qt.CoarseTimer)
+        self.sync_timer.setInterval(sync_interval_ms)
+        self.sync_timer.timeout.connect(self.request_sync)
+
+        self.io_ctrlr.add_message_handler("sync_response", self.on_sync_response)
+        self.io_ctrlr.add_message_handler("master_clock", self.on_master_clock)
+        self.io_ctrlr.socket.connected.connect(self.on_connected)
+        self.io_ctrlr.socket.disconnected.connect(self.on_disconnected)
+
+    def is_enabled(self):
+        return self._enabled
+
+    def set_enabled(self, enabled: bool):
+        self._enabled = enabled
+        if enabled:
+            self.on_connected()
+        else:
+            self.on_disconnected()
+
+    @pyqtSlot()
+    def on_connected(self):
+        if not self._enabled:
+            return
+        # Fill the estimator window quickly, then keep it fresh at a low rate
+        self._burst_remaining = self.clock.samples.maxlen
+        self.request_sync()
+        self.sync_timer.start()
+        self.check_timer.start()
+
+    @pyqtSlot()
+    def on_disconnected(self):
+        self.sync_timer.stop()
+        self.check_timer.stop()
+        self.master = None
+        self._set_rate(1.0)
+
+    @pyqtSlot()
+    def request_sync(self):
+        self.io_ctrlr.send_message("sync_request", t0=local_time_ms())
+
+    def on_sync_response(self, message: dict):
+        t3 = local_time_ms()
+        self.clock.add_exchange(message["t0"], message["t1"], message["t2"], t3)
+        if self._burst_remaining > 0:
+            self._burst_remaining -= 1
+            QTimer.singleShot(50, self.request_sync)
+
+    def on_master_clock(self, message: dict):
+        self.master = message
+        if not self._enabled:
+            return
+        playing = message.get("playing", True)
+        if playing and not self.mp.is_playing():
+            self.mp.play()
+        elif not playing and self.mp.is_playing():
+            self.mp.set_pause(1)
+
+    def expected_time(self) -> Optional[float]:
+        """Media time the master clock expects right now, in ms"""
+        if not self.master or not self.clock.has_estimate():
+            return None
+        elapsed = self.clock.server_time() - self.master["server_time"]
+        if not self.master.get("playing", True):
+            elapsed = 0
+        return self.master["media_time"] + elapsed * self.master.get("rate", 1.0)
+
+    @pyqtSlot()
+    def correct(self):
+        expected = self.expected_time()
+        if expected is None or not self.mp.is_playing():
+            return
+        drift = self.mp.get_time() - expected
+        self.stats.add(drift)
+        self.driftchanged.emit(drift)
+
+        master_rate = self.master.get("rate", 1.0)
+        if abs(drift) >= self.seek_threshold_ms:
+            with span(log, "seek", source="sync", time_ms=int(expected)):
+                self.mp.set_time(int(expected))
+            self.stats.seeks += 1
+            self._set_rate(master_rate)
+            log.info("SYNC SEEK drift=%.0f stats=%s", drift, self.stats.as_dict())
+        elif abs(drift) > self.tolerance_ms:
+            adjustment = drift / self.correction_period_ms
+            adjustment = max(-self.max_rate_adjustment, adjustment)
+            adjustment = min(self.max_rate_adjustment, adjustment)
+            self._set_rate(master_rate * (1 - adjustment))
+        else:
+            self._set_rate(master_rate)
+
+    def _set_rate(self, rate: float):
+        if rate == self._rate:
+            return
+        self.stats.rate_adjustments += 1
+        self._rate = rate
+        self.mp.set_rate(rate)
@@ -0,0 +1,240 @@
+import logging
+import struct
+import time
+from collections import deque
+from typing import List, NamedTuple
+
+from PyQt5.QtCore import QByteArray, QObject, Qt, QTimer, pyqtSlot
+
+from app import vlcqt
+
+log = logging.getLogger(__name__)
+
+
+TELEMETRY_MAGIC = b"UT"
+TELEMETRY_VERSION = 1
+
+# magic, version, sample count
+BATCH_HEADER = struct.Struct("<2sBB")
+
+# elapsed ms, playback time ms, player state, buffering %, fps x100, dropped frames,
+# yaw/pitch/roll x100, cpu % x10
+SAMPLE = struct.Struct("<IiBBHHhhhH")
+
+MAX_BATCH_SAMPLES = 255
+
+
+class TelemetrySample(NamedTuple):
+    elapsed_ms: int
+    time_ms: int
+    state: int
+    buffering: int
+    fps: float
+    dropped_frames: int
+    yaw: float
+    pitch: float
+    roll: float
+    cpu: float
+
+
+def _clamp(value, low, high):
+    return max(low, min(high, value))
+
+
+def encode_sample(sample: TelemetrySample) -> bytes:
+    return SAMPLE.pack(
+        _clamp(int(sample.elapsed_ms), 0, 0xFFFFFFFF),
+        _clamp(int(sample.time_ms), -0x80000000, 0x7FFFFFFF),
+        _clamp(int(sample.state), 0, 0xFF),
+        _clamp(int(sample.buffering), 0, 100),
+        _clamp(round(sample.fps * 100), 0, 0xFFFF),
+        _clamp(int(sample.dropped_frames), 0, 0xFFFF),
+        _clamp(round(sample.yaw * 100), -0x8000, 0x7FFF),
+        _clamp(round(sample.pitch * 100), -0x8000, 0x7FFF),
+        _clamp(round(sample.roll * 100), -0x8000, 0x7FFF),
+        _clamp(round(sample.cpu * 10), 0, 0xFFFF),
+    )
+
+
+def encode_batch(samples: List[TelemetrySample]) -> bytes:
+    if len(samples) > MAX_BATCH_SAMPLES:
+        raise ValueError(f"Batch exceeds {MAX_BATCH_SAMPLES} samples")
+    header = BATCH_HEADER.pack(TELEMETRY_MAGIC, TELEMETRY_VERSION, len(samples))
+    return header + b"".join(encode_sample(s) for s in samples)
+
+
+def decode_batch(payload: bytes) -> List[TelemetrySample]:
+    magic, version, count = BATCH_HEADER.unpack_from(payload)
+    if magic != TELEMETRY_MAGIC:
+        raise ValueError("Not a telemetry batch")
+    if version != TELEMETRY_VERSION:
+        raise ValueError(f"Unsupported telemetry version: {version}")
+    samples = []
+    for index in range(count):
+        values = SAMPLE.unpack_from(payload, BATCH_HEADER.size + index * SAMPLE.size)
+        samples.append(
+            TelemetrySample(
+                elapsed_ms=values[0],
+                time_ms=values[1],
+                state=values[2],
+                buffering=values[3],
+                fps=values[4] / 100,
+                dropped_frames=values[5],
+                yaw=values[6] / 100,
+                pitch=values[7] / 100,
+                roll=values[8] / 100,
+                cpu=values[9] / 10,
+            )
+        )
+    return samples
+
+
+class TelemetryReporter(QObject):
+    """Sample player health at a fixed rate and send it to the server in batches.
+
+    Samples are only queued while connected. If the socket has more than
+    `max_pending_bytes` waiting to be written, batches are held back and the oldest
+    queued samples are dropped once `max_queued_samples` is reached.
+    """
+
+    def __init__(
+        self,
+        socket,
+        media_player,
+        viewpoint_mngr,
+        sample_rate: int = 10,
+        flush_interval: int = 1000,
+        max_pending_bytes: int = 16384,
+        max_queued_samples: int = 1024,
+    ):
+        super().__init__()
+        self.socket = socket
+        self.mp = media_player
+        self.viewpoint_mngr = viewpoint_mngr
+        self.max_pending_bytes = max_pending_bytes
+
+        self.samples: deque = deque(maxlen=max_queued_samples)
+        self.dropped_samples = 0
+        self.sent_batches = 0
+        self.pending_bytes = 0
+
+        self._enabled = False
+        self._start_time = time.monotonic()
+        self._last_wall = self._start_time
+        self._last_cpu = time.process_time()
+        self._last_displayed = None
+        self._last_lost = None
+        self._buffering = 100
+        self._viewpoint = (0.0, 0.0, 0.0)
+        self._stats = vlcqt.MediaStats()
+
+        self.sample_timer = QTimer(self)
+        self.sample_timer.setTimerType(Qt.CoarseTimer)
+        self.sample_timer.setInterval(int(1000 / sample_rate))
+        self.sample_timer.timeout.connect(self.sample)
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setTimerType(Qt.CoarseTimer)
+        self.flush_timer.setInterval(flush_interval)
+        self.flush_timer.timeout.connect(self.flush)
+
+        self.mp.buffering.connect(self.on_buffering)
+        self.viewpoint_mngr.updatedviewpoint.connect(self.on_updatedviewpoint)
+        self.socket.bytesWritten.connect(self.on_bytesWritten)
+        self.socket.connected.connect(self.on_connected)
+        self.socket.disconnected.connect(self.on_disconnected)
+
+    def set_enabled(self, enabled: bool):
+        if not enabled:
+            self.sample_timer.stop()
+            self.flush_timer.stop()
+            self.samples.clear()
+        elif self.socket.state() == self.socket.ConnectedState:
+            self.sample_timer.start()
+            self.flush_timer.start()
+        self._enabled = enabled
+
+    def is_enabled(self):
+        return self._enabled
+
+    @pyqtSlot()
+    def on_connected(self):
+        self.pending_bytes = 0
+        if self.is_enabled():
+            self.sample_timer.start()
+            self.flush_timer.start()
+
+    @pyqtSlot()
+    def on_disconnected(self):
+        self.sample_timer.stop()
+        self.flush_timer.stop()
+
+    def on_buffering(self, e):
+        self._buffering = e.value
+
+    @pyqtSlot(float, float, float)
+    def on_updatedviewpoint(self, yaw, pitch, roll):
+        self._viewpoint = (yaw, pitch, roll)
+
+    def on_bytesWritten(self, count):
+        self.pending_bytes = max(0, self.pending_bytes - count)
+
+    def _frame_stats(self, elapsed_s):
+        """Return displayed fps and newly dropped frames since the last sample"""
+        media = self.mp.get_media()
+        if not media or not media.get_stats(self._stats):
+            self._last_displayed = self._last_lost = None
+            return 0.0, 0
+        displayed = self._stats.displayed_pictures
+        lost = self._stats.lost_pictures
+        if self._last_displayed is None or elapsed_s <= 0:
+            fps, dropped = 0.0, 0
+        else:
+            fps = max(0, displayed - self._last_displayed) / elapsed_s
+            dropped = max(0, lost - self._last_lost)
+        self._last_displayed, self._last_lost = displayed, lost
+        return fps, dropped
+
+    @pyqtSlot()
+    def sample(self):
+        now = time.monotonic()
+        cpu = time.process_time()
+        elapsed_s = now - self._last_wall
+        cpu_percent = (cpu - self._last_cpu) / elapsed_s * 100 if elapsed_s else 0.0
+        self._last_wall, self._last_cpu = now, cpu
+        fps, dropped = self._frame_stats(elapsed_s)
+
+        if len(self.samples) == self.samples.maxlen:
+            self.dropped_samples += 1
+        self.samples.append(
+            TelemetrySample(
+                elapsed_ms=int((now - self._start_time) * 1000),
+                time_ms=self.mp.get_time(),
+                state=int(self.mp.get_state()),
+                buffering=int(self._buffering),
+                fps=fps,
+                dropped_frames=dropped,
+                yaw=self._viewpoint[0],
+                pitch=self._viewpoint[1],
+                roll=self._viewpoint[2],
+                cpu=cpu_percent,
+            )
+        )
+
+    @pyqtSlot()
+    def flush(self):
+        if self.socket.state() != self.socket.ConnectedState:
+            return
+        while self.samples and self.pending_bytes < self.max_pending_bytes:
+            count = min(len(self.samples), MAX_BATCH_SAMPLES)
+            batch = [self.samples.popleft() for _ in range(count)]
+            payload = encode_batch(batch)
+            self.pending_bytes += self.socket.sendBinaryMessage(QByteArray(payload))
+            self.sent_batches += 1
+        if self.samples:
+            log.debug(
+                "TELEMETRY BACK-PRESSURE pending_bytes=%s queued=%s dropped=%s",
+                self.pending_bytes,
+                len(self.samples),
+                self.dropped_samples,
+            )
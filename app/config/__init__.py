@@ -16,13 +16,25 @@ SCHEMA = {
         "default": "wss://seevr.herokuapp.com/mediaplayer",
         "options": None,
     },
+    "telemetry_enable": {"type": bool, "default": False, "options": (True, False)},
+    "telemetry_rate": {"type": int, "default": 10, "min": 1, "max": 60},
+    "sync_enable": {"type": bool, "default": False, "options": (True, False)},
+    "sync_tolerance_ms": {"type": int, "default": 40, "min": 5, "max": 1000},
     "volume": {"type": int, "default": 50, "min": 1, "max": 100},
+    "frame_clock": {"type": str, "default": "timer", "options": ("timer", "decoder")},
+    "hud_enable": {"type": bool, "default": False, "options": (True, False)},
+    "hud_rate": {"type": int, "default": 4, "min": 1, "max": 30},
     "tool_bar_area": {"type": str, "default": "bottom", "options": ("top", "bottom")},
     "meta_tags": {
         "type": list,
         "default": [
             "title",
             "duration",
+            "resolution",
+            "fps",
+            "bitrate",
+            "codec",
+            "projection",
             "artist",
             "genre",
             "album",
@@ -60,7 +72,16 @@ SCHEMA = {
     "audio_eq_selected_user_preset": {"type": str, "default": None, "options": ([])},
     "audio_eq_user_presets": {"type": dict, "default": {}, "options": ([])},
     # VLC options
-    "hw_accel": {"type": bool, "default": True, "options": (True, False)},
+    "decode_profile": {
+        "type": str,
+        "default": "auto",
+        "options": ("auto", "software", "vaapi", "vdpau"),
+    },
+    "vlc_avcodec_threads": {"type": int, "default": 0, "min": 0, "max": 64},
+    "vlc_skip_loop_filter": {"type": int, "default": 0, "options": (0, 1, 2, 3, 4)},
+    "media_caching_auto": {"type": bool, "default": True, "options": (True, False)},
+    "vlc_file_caching": {"type": int, "default": 1000, "min": 0, "max": 60000},
+    "vlc_network_caching": {"type": int, "default": 1000, "min": 0, "max": 60000},
 }
 
 
@@ -1,40 +1,106 @@
 import sys
 
-from PyQt5.QtCore import QSettings
+from PyQt5.QtCore import QObject, QSettings, QTimer, pyqtSignal
 
 from app.config import SCHEMA
 
 
+def _coerce(value, value_type):
+    """Convert `value` to `value_type` as QSettings does when it reads values"""
+    if value is None:
+        return value_type()
+    if isinstance(value, value_type):
+        return value
+    if value_type is bool and isinstance(value, str):
+        return value.strip().lower() not in ("", "0", "false")
+    if value_type is list and isinstance(value, str):
+        return [value]
+    return value_type(value)
+
+
+class _KeySignal(QObject):
+    changed = pyqtSignal(object)
+
+
 class _State:
-    _handlers: dict = {}
+    """Settings values cached in memory and written through to QSettings.
+
+    Reads are served from the cache after the first lookup of each key. Writes update
+    the cache and QSettings immediately, while the sync to disk is deferred so that
+    bursts of writes are saved together.
+    """
+
+    _cache: dict = {}
 
-    _state: dict = {}
+    _signals: dict = {}
+
+    _sync_timer = None
+
+    sync_delay = 500
 
     def load(self, settings: QSettings):
-        for key in SCHEMA.keys():
-            val = settings.value(key)
-            if val:
-                self._state[key] = val
+        self._cache.clear()
         super().__setattr__("settings", settings)
 
     def __setattr__(self, key, value):
+        # Cache the value as QSettings would return it. None is stored as is.
+        if value is not None:
+            value = _coerce(value, SCHEMA[key]["type"])
         options = SCHEMA[key].get("options")  # Never throws error
         if options and value not in options:
             raise ValueError("Invalid value for this configuration setting")
+        changed = key not in self._cache or self._cache[key] != value
+        self._cache[key] = value
         self.settings.setValue(key, value)
+        self._schedule_sync()
+        if changed and key in self._signals:
+            self._signals[key].changed.emit(value)
 
     def __getattr__(self, key):
-        value = self.settings.value(
-            key,
-            defaultValue=SCHEMA[key]["default"],
-            type=SCHEMA[key]["type"],
-        )
-        options = SCHEMA[key].get("options")
-        if options and value not in options:
-            default = SCHEMA[key]["default"]
-            self.settings.setValue(key, default)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        default = SCHEMA[key]["default"]
+        value = self.settings.value(key, defaultValue=default)
+        try:
+            if value is not None or default is not None:
+                value = _coerce(value, SCHEMA[key]["type"])
+        except (TypeError, ValueError):
+            valid = False
+        else:
+            options = SCHEMA[key].get("options")
+            valid = not options or value in options
+        if not valid:
+            value = default
+            self.settings.setValue(key, value)
+        self._cache[key] = value
         return value
 
+    def signal(self, key) -> pyqtSignal:
+        """Return a signal emitted with the new value whenever `key` changes"""
+        if key not in SCHEMA:
+            raise KeyError(key)
+        if key not in self._signals:
+            self._signals[key] = _KeySignal()
+        return self._signals[key].changed
+
+    def sync(self):
+        """Write pending changes to disk now"""
+        if self._sync_timer:
+            self._sync_timer.stop()
+        self.settings.sync()
+
+    def _schedule_sync(self):
+        if self._sync_timer is None:
+            timer = QTimer()
+            timer.setSingleShot(True)
+            timer.timeout.connect(self.sync)
+            super().__setattr__("_sync_timer", timer)
+        self._sync_timer.setInterval(self.sync_delay)
+        if not self._sync_timer.isActive():
+            self._sync_timer.start()
+
 
 # See here for explanation from Guido about why this is acceptable:
 # https://mail.python.org/pipermail/python-ideas/2012-May/014969.html
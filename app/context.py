@@ -3,12 +3,16 @@ import os
 import sys
 from typing import List
 
+from PyQt5.QtCore import QStandardPaths, Qt
 from PyQt5.QtWidgets import QApplication
 
 from app import config
 
 from .info import BuildInformation
 from .utils import cached_property
+from .utils.logs import JsonFormatter, start_queue_logging
+from .utils.profiling import startup_profiler
+from .utils.watchdog import StallWatchdog
 
 log = logging.getLogger(__name__)
 
@@ -39,24 +43,32 @@ class AppContext(BaseAppContext):
     ):
         super().__init__()
         self.files = files
-        self.app = QApplication(qtargs)
+        with startup_profiler.phase("qapplication"):
+            # Lets multi-screen views share one texture of each decoded frame
+            QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+            self.app = QApplication(qtargs)
         self.app.setOrganizationName(self.build_info["organization"])
         self.app.setApplicationName(self.build_info["name"])
         self.init_logging()
+        self.init_watchdog()
         log.info(
             f"Launching: {self.app.organizationName()}/{self.app.applicationName()}"
         )
-        self.init_settings()
-        self.init_vlc()
+        with startup_profiler.phase("settings"):
+            self.init_settings()
+        with startup_profiler.phase("vlc"):
+            self.init_vlc()
+        with startup_profiler.phase("style"):
+            self.init_style()
 
     @cached_property
     def main_win(self):
-        from .mainwindow import MainWindow
+        with startup_profiler.phase("import mainwindow"):
+            from .mainwindow import MainWindow
+        with startup_profiler.phase("media player"):
+            media_player = self.media_player
 
-        window = MainWindow(
-            media_player=self.media_player,
-            stylesheet=self.stylesheet,
-        )
+        window = MainWindow(media_player=media_player)
         if self.files:
             window.load_media(self.files)
 
@@ -67,15 +79,26 @@ class AppContext(BaseAppContext):
         return BuildInformation(self.get_resource("build.json"))
 
     def init_logging(self):
+        handlers = []
         # Set player log file
         player_log_file = os.getenv("VR_PLAYER_LOG_FILE", None)
         if player_log_file:
             dirpath, filename = os.path.split(player_log_file)
             if dirpath:
                 os.makedirs(os.path.dirname(dirpath), exist_ok=True)
-            logger = logging.getLogger()
-            logger.addHandler(logging.FileHandler(player_log_file))
-            logger.info("INIT LOGGING")
+            handlers.append(logging.FileHandler(player_log_file))
+
+        # Set player log format
+        if os.getenv("VR_PLAYER_LOG_FORMAT", "text") == "json":
+            handlers = handlers or [logging.StreamHandler()]
+            for handler in handlers:
+                handler.setFormatter(JsonFormatter())
+
+        # Handlers write from a listener thread, off the GUI thread
+        if handlers:
+            self.log_listener = start_queue_logging(handlers)
+            self.app.aboutToQuit.connect(self.log_listener.stop)
+            logging.getLogger().info("INIT LOGGING")
 
         # Set player log levels
         player_log_levels = os.getenv("VR_PLAYER_LOG_LEVELS", "")
@@ -84,18 +107,48 @@ class AppContext(BaseAppContext):
             logger.setLevel(level)
             logger.info(f"SET LOGGER LOG LEVEL name={name} level={level}")
 
+    @cached_property
+    def log_dir(self):
+        player_log_file = os.getenv("VR_PLAYER_LOG_FILE", None)
+        if player_log_file:
+            return os.path.dirname(os.path.abspath(player_log_file))
+        data_dir = QStandardPaths.writableLocation(QStandardPaths.AppLocalDataLocation)
+        return os.path.join(data_dir, "logs")
+
+    def init_watchdog(self):
+        threshold_ms = int(os.getenv("VR_PLAYER_STALL_MS", 1000))
+        if threshold_ms <= 0:
+            return
+        self.watchdog = StallWatchdog(self.log_dir, threshold_ms=threshold_ms)
+        self.watchdog.start()
+        self.app.aboutToQuit.connect(self.watchdog.stop)
+
     def init_settings(self):
         settings = config.Settings(
             self.app.organizationName(), self.app.applicationName()
         )
         log.info(f"Configuration file: {settings.fileName()}")
         config.state.load(settings)
+        self.app.aboutToQuit.connect(config.state.sync)
 
     def init_vlc(self):
-        import vlc
+        from app import vlcqt
+
+        options = vlcqt.InstanceOptions(
+            decode_profile=config.state.decode_profile,
+            avcodec_threads=config.state.vlc_avcodec_threads,
+            skip_loop_filter=config.state.vlc_skip_loop_filter,
+            file_caching_ms=config.state.vlc_file_caching,
+            network_caching_ms=config.state.vlc_network_caching,
+            extra_args=tuple(os.environ.get("VLC_ARGS", default="").split()),
+        )
+        self.vlc_instance = vlcqt.create_instance(options)
+
+    def init_style(self):
+        from .gui.style import initialize_style
 
-        vlc_args = os.environ.get("VLC_ARGS", default="").split()
-        vlc.Instance(vlc_args)
+        # Styled before any widget exists, so that no widget is polished twice
+        initialize_style(self.app, self.stylesheet)
 
     @cached_property
     def media_player(self):
@@ -105,6 +158,6 @@ class AppContext(BaseAppContext):
 
     @cached_property
     def stylesheet(self):
-        qss_path = self.get_resource("style", "dark.qss")
-        with open(qss_path) as stylesheet:
-            return stylesheet.read()
+        from .gui.style import load_stylesheet
+
+        return load_stylesheet(self.get_resource("style"), "dark")
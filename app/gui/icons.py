@@ -1,13 +1,23 @@
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
 import qtawesome as qta
-from PyQt5.QtGui import QColor, QPalette
+from PyQt5.QtCore import QRect
+from PyQt5.QtGui import QColor, QIcon, QIconEngine, QPainter, QPalette, QPixmap
 from PyQt5.QtWidgets import QApplication
 
+log = logging.getLogger(__name__)
+
 APPLICATION_PALETTE = None
 
 
 def initialize_icon_defaults_light(app_palette: QPalette):
     global APPLICATION_PALETTE
     APPLICATION_PALETTE = app_palette
+    pixmap_cache.set_theme(app_palette)
 
 
 def initialize_icon_defaults_dark(app_palette: QPalette):
@@ -20,9 +30,100 @@ def initialize_icon_defaults_dark(app_palette: QPalette):
     d["color_off_active"] = d["color"].lighter()
     d["color_disabled"] = palette.color(QPalette.Disabled, QPalette.ButtonText)
     qta.set_global_defaults(**d)
+    pixmap_cache.set_theme(app_palette)
+
+
+class IconPixmapCache:
+    """Rendered icon pixmaps keyed by (name, width, height, mode, state, ratio).
+
+    With a `directory`, pixmaps are also saved as PNGs and loaded in later runs. Saved
+    pixmaps are grouped by a theme key, so that a palette or qtawesome change does not
+    load stale pixmaps.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = Path(directory) if directory else None
+        self.theme_key = "default"
+        self.hits = self.misses = self.disk_hits = 0
+        self._pixmaps = {}
+
+    def set_theme(self, palette: QPalette):
+        roles = range(QPalette.NColorRoles)
+        colors = ",".join(palette.color(role).name() for role in roles)
+        digest = hashlib.sha1(f"{qta.__version__}:{colors}".encode()).hexdigest()
+        self.theme_key = digest[:12]
+        self._pixmaps.clear()
+
+    def pixmap(self, icon_name, icon, size, mode, state, ratio) -> QPixmap:
+        key = (icon_name, size.width(), size.height(), int(mode), int(state), ratio)
+        try:
+            pixmap = self._pixmaps[key]
+        except KeyError:
+            self.misses += 1
+        else:
+            self.hits += 1
+            return pixmap
+        path = self._path(key)
+        pixmap = QPixmap()
+        if path and pixmap.load(str(path)):
+            self.disk_hits += 1
+        else:
+            pixmap = icon.pixmap(size * ratio, mode, state)
+            if path:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                pixmap.save(str(path), "PNG")
+        pixmap.setDevicePixelRatio(ratio)
+        self._pixmaps[key] = pixmap
+        return pixmap
+
+    def clear(self):
+        self._pixmaps.clear()
+
+    def _path(self, key) -> Optional[Path]:
+        if not self.directory:
+            return None
+        name, width, height, mode, state, ratio = key
+        filename = f"{name}-{width}x{height}-{mode}-{state}@{ratio:g}x.png"
+        return self.directory / self.theme_key / filename
+
+
+pixmap_cache = IconPixmapCache(directory=os.getenv("VR_PLAYER_ICON_CACHE_DIR"))
+
+
+class CachedIconEngine(QIconEngine):
+    """Paint a qtawesome icon from cached pixmaps instead of re-rendering glyphs"""
+
+    def __init__(self, icon_name: str, icon: QIcon, cache: IconPixmapCache):
+        super().__init__()
+        self.icon_name = icon_name
+        self.icon = icon
+        self.cache = cache
+
+    def pixmap(self, size, mode, state):
+        return self.cache.pixmap(self.icon_name, self.icon, size, mode, state, 1.0)
+
+    def paint(self, painter: QPainter, rect: QRect, mode, state):
+        ratio = painter.device().devicePixelRatioF()
+        pixmap = self.cache.pixmap(
+            self.icon_name, self.icon, rect.size(), mode, state, ratio
+        )
+        painter.drawPixmap(rect, pixmap)
+
+    def clone(self):
+        return CachedIconEngine(self.icon_name, self.icon, self.cache)
+
+
+def cached_icon(icon_name: str, icon: QIcon) -> QIcon:
+    return QIcon(CachedIconEngine(icon_name, icon, pixmap_cache))
 
 
 class AppIcons:
+    """Icon factories. Each icon is built on its first `get`."""
+
+    open_file_bg_scale = 0.8
+    open_many_bg_scale = 0.8
+    bg_fg_multiplier = 0.7
+
     def __init__(self):
         global APPLICATION_PALETTE
         if APPLICATION_PALETTE:
@@ -31,40 +132,77 @@ class AppIcons:
             qapp = QApplication.instance()
             self.palette = qapp.palette()
 
-        self.fullscreen_menu_bttn = qta.icon("mdi.fullscreen", offset=(0, -0.06))
-        self.fullscreen = qta.icon("mdi.fullscreen", scale_factor=1.1)
-        self.fullscreen_exit = qta.icon("mdi.fullscreen-exit")
-        self.fullscreen_enter = qta.icon("mdi.fullscreen")
-        self.display_screen = qta.icon("mdi.desktop-mac")
-        self.loop_mode_off = qta.icon("mdi.repeat-off")
-        self.loop_mode_one = qta.icon("mdi.repeat-once")
-        self.loop_mode_all = qta.icon("mdi.repeat")
-        self.play_pause = qta.icon(
+    def fullscreen_menu_bttn(self):
+        return qta.icon("mdi.fullscreen", offset=(0, -0.06))
+
+    def fullscreen(self):
+        return qta.icon("mdi.fullscreen", scale_factor=1.1)
+
+    def fullscreen_exit(self):
+        return qta.icon("mdi.fullscreen-exit")
+
+    def fullscreen_enter(self):
+        return qta.icon("mdi.fullscreen")
+
+    def display_screen(self):
+        return qta.icon("mdi.desktop-mac")
+
+    def loop_mode_off(self):
+        return qta.icon("mdi.repeat-off")
+
+    def loop_mode_one(self):
+        return qta.icon("mdi.repeat-once")
+
+    def loop_mode_all(self):
+        return qta.icon("mdi.repeat")
+
+    def play_pause(self):
+        return qta.icon(
             "mdi.play",
             on="mdi.pause",
             off="mdi.play",
             on_active="mdi.pause",
             off_active="mdi.play",
         )
-        self.main_menu_button = qta.icon("mdi.dots-vertical")
-        self.stop = qta.icon("mdi.stop")
-        self.next_media = qta.icon("mdi.skip-forward")
-        self.previous_media = qta.icon("mdi.skip-backward")
-        self.zoom_in_button = qta.icon("mdi.magnify-plus-outline")
-        self.zoom_out_button = qta.icon("mdi.magnify-minus-outline")
-        self.zoom_menu_button = qta.icon(
-            "mdi.magnify", scale_factor=0.9, offset=(0, -0.05)
-        )
-        self.zoom_in_menu_item = qta.icon("mdi.magnify-plus")
-        self.zoom_out_menu_item = qta.icon("mdi.magnify-minus")
-        self.connect_to_server_hovered = qta.icon(
+
+    def main_menu_button(self):
+        return qta.icon("mdi.dots-vertical")
+
+    def stop(self):
+        return qta.icon("mdi.stop")
+
+    def next_media(self):
+        return qta.icon("mdi.skip-forward")
+
+    def previous_media(self):
+        return qta.icon("mdi.skip-backward")
+
+    def zoom_in_button(self):
+        return qta.icon("mdi.magnify-plus-outline")
+
+    def zoom_out_button(self):
+        return qta.icon("mdi.magnify-minus-outline")
+
+    def zoom_menu_button(self):
+        return qta.icon("mdi.magnify", scale_factor=0.9, offset=(0, -0.05))
+
+    def zoom_in_menu_item(self):
+        return qta.icon("mdi.magnify-plus")
+
+    def zoom_out_menu_item(self):
+        return qta.icon("mdi.magnify-minus")
+
+    def connect_to_server_hovered(self):
+        return qta.icon(
             "mdi.server-network",
             on="mdi.server-network",
             off="mdi.server-network-off",
             color_on="green",
             color_off="red",
         )
-        self.connect_to_server_status = qta.icon(
+
+    def connect_to_server_status(self):
+        return qta.icon(
             "mdi.server-network",
             on="mdi.server-network",
             off="mdi.server-network-off",
@@ -76,17 +214,18 @@ class AppIcons:
             color_off="crimson",
             color_disabled="gray",
         )
-        self.server_disconnected = qta.icon("mdi.server-network-off")
-        open_file_bg_scale = 0.8
-        open_many_bg_scale = 0.8
-        bg_fg_multiplier = 0.7
-        self.open_file = qta.icon(
+
+    def server_disconnected(self):
+        return qta.icon("mdi.server-network-off")
+
+    def open_file(self):
+        return qta.icon(
             "mdi.file",
             "mdi.play",
             options=[
-                {"scale_factor": open_file_bg_scale},
+                {"scale_factor": self.open_file_bg_scale},
                 {
-                    "scale_factor": open_file_bg_scale * bg_fg_multiplier,
+                    "scale_factor": self.open_file_bg_scale * self.bg_fg_multiplier,
                     "color": self.palette.window(),
                     "color_on_active": self.palette.window(),
                     "color_off_active": self.palette.window(),
@@ -94,13 +233,15 @@ class AppIcons:
                 },
             ],
         )
-        self.open_multiple = qta.icon(
+
+    def open_multiple(self):
+        return qta.icon(
             "mdi.file-multiple",
             "mdi.play",
             options=[
-                {"scale_factor": open_many_bg_scale},
+                {"scale_factor": self.open_many_bg_scale},
                 {
-                    "scale_factor": open_many_bg_scale * bg_fg_multiplier,
+                    "scale_factor": self.open_many_bg_scale * self.bg_fg_multiplier,
                     "color": self.palette.window(),
                     "color_on_active": self.palette.window(),
                     "color_off_active": self.palette.window(),
@@ -108,38 +249,66 @@ class AppIcons:
                 },
             ],
         )
-        self.open_file_menu = qta.icon(
-            "mdi.file-plus", scale_factor=0.70, offset=(0, -0.06)
-        )
-        self.volume_button = {
+
+    def open_file_menu(self):
+        return qta.icon("mdi.file-plus", scale_factor=0.70, offset=(0, -0.06))
+
+    def volume_button(self):
+        return {
             "mute": qta.icon("mdi.volume-mute", disabled="mdi.volume-off"),
             "low": qta.icon("mdi.volume-low", disabled="mdi.volume-off"),
             "medium": qta.icon("mdi.volume-medium", disabled="mdi.volume-off"),
             "high": qta.icon("mdi.volume-high", disabled="mdi.volume-off"),
         }
-        self.always_on_top = qta.icon("mdi.window-restore", scale_factor=1)
-        self.open_playlist = qta.icon("mdi.format-list-bulleted")
-        self.open_split_view = qta.icon("mdi.view-split-vertical")
-        # self.open_settings = qta.icon("mdi.cogs")
-        self.toolbar_ext_bttn = qta.icon("mdi.menu-right-outline")
-        self.virtual_reality = qta.icon("mdi.virtual-reality")
-        self.file_remove = qta.icon("mdi.file-remove")
-        self.open_media_player_adjustments = qta.icon(
-            "fa5s.sliders-h", scale_factor=0.70
-        )
-        self.open_media_player_preferences = qta.icon("fa5s.cog", scale_factor=0.70)
-        self.open_client_settings = qta.icon("fa5s.user-cog", scale_factor=0.70)
+
+    def always_on_top(self):
+        return qta.icon("mdi.window-restore", scale_factor=1)
+
+    def open_playlist(self):
+        return qta.icon("mdi.format-list-bulleted")
+
+    def open_split_view(self):
+        return qta.icon("mdi.view-split-vertical")
+
+    # def open_settings(self):
+    #     return qta.icon("mdi.cogs")
+
+    def toolbar_ext_bttn(self):
+        return qta.icon("mdi.menu-right-outline")
+
+    def virtual_reality(self):
+        return qta.icon("mdi.virtual-reality")
+
+    def file_remove(self):
+        return qta.icon("mdi.file-remove")
+
+    def open_media_player_adjustments(self):
+        return qta.icon("fa5s.sliders-h", scale_factor=0.70)
+
+    def open_media_player_preferences(self):
+        return qta.icon("fa5s.cog", scale_factor=0.70)
+
+    def open_client_settings(self):
+        return qta.icon("fa5s.user-cog", scale_factor=0.70)
 
 
 _APP_ICONS = None
 
+_icons = {}
+
 
 def get(name: str):
     global _APP_ICONS
-    try:  # If QApplication is needed but not loaded, reinstantialize
-        return getattr(_APP_ICONS, name)
-    except AttributeError:
-        if _APP_ICONS:
-            raise
+    try:
+        return _icons[name]
+    except KeyError:
+        pass
+    if _APP_ICONS is None:  # QApplication is needed, so create on first use
         _APP_ICONS = AppIcons()
-        return getattr(_APP_ICONS, name)
+    icon = getattr(_APP_ICONS, name)()
+    if isinstance(icon, dict):
+        icon = {k: cached_icon(f"{name}.{k}", v) for k, v in icon.items()}
+    else:
+        icon = cached_icon(name, icon)
+    _icons[name] = icon
+    return icon
@@ -1,7 +1,147 @@
+import logging
+import os
+import re
+from typing import Iterable, List, Optional, Set, Tuple
+
+from PyQt5 import QtCore, QtGui, QtWidgets
 from PyQt5.QtGui import QColor, QPalette
 
 from app.gui import icons
 
+log = logging.getLogger(__name__)
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_TYPE_NAME = re.compile(r"(?:^|[\s>+~,])([A-Z]\w*)")
+_ATTRIBUTE = re.compile(r"""\[(?:"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|[^\]"'])*\]""")
+
+
+class StyleSheetError(ValueError):
+    pass
+
+
+def _split(text: str, separator: str) -> List[str]:
+    """Split at `separator` outside of quoted strings and attribute selectors"""
+    parts = []
+    start = depth = 0
+    quote = None
+    escaped = False
+    for index, char in enumerate(text):
+        if quote:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "[":
+            depth += 1
+        elif char == "]":
+            depth = max(0, depth - 1)
+        elif char == separator and not depth:
+            parts.append(text[start:index])
+            start = index + 1
+    if quote:
+        raise StyleSheetError(f"Unterminated string in '{' '.join(text.split())}'")
+    parts.append(text[start:])
+    return parts
+
+
+def _parse_rules(source: str) -> List[Tuple[str, List[str]]]:
+    source = _COMMENT.sub("", source)
+    if "/*" in source:
+        raise StyleSheetError("Unterminated comment")
+    rules = []
+    position = 0
+    while True:
+        start = source.find("{", position)
+        if start == -1:
+            if source[position:].strip():
+                raise StyleSheetError(f"Trailing text '{source[position:].strip()}'")
+            return rules
+        end = source.find("}", start)
+        selector = " ".join(source[position:start].split())
+        if end == -1 or "{" in source[start + 1 : end]:
+            raise StyleSheetError(f"Unbalanced braces in rule '{selector}'")
+        if not selector or "}" in selector:
+            raise StyleSheetError(f"Missing selector before '{{' at {start}")
+        declarations = []
+        for declaration in _split(source[start + 1 : end], ";"):
+            declaration = " ".join(declaration.split())
+            if not declaration:
+                continue
+            name, colon, value = declaration.partition(":")
+            if not colon or not name.strip() or not value.strip():
+                raise StyleSheetError(f"Invalid declaration '{declaration}'")
+            declarations.append(f"{name.strip()}:{value.strip()}")
+        rules.append((selector, declarations))
+        position = end + 1
+
+
+def _widget_subclass_names() -> Set[str]:
+    """Names of the imported Python subclasses of QWidget, e.g. the app's widgets"""
+    names = set()
+    classes = [QtWidgets.QWidget]
+    while classes:
+        for cls in classes.pop().__subclasses__():
+            names.add(cls.__name__)
+            classes.append(cls)
+    return names
+
+
+def _qt_class(name: str) -> Optional[type]:
+    for module in (QtWidgets, QtGui, QtCore):
+        cls = getattr(module, name, None)
+        if isinstance(cls, type):
+            return cls
+    return None
+
+
+def compile_stylesheet(source: str, known_types: Iterable[str] = ()) -> str:
+    """Validate and minify a stylesheet.
+
+    Comments, whitespace and empty rules are removed. Rules whose selectors only name
+    Qt classes that are not widgets, such as QAction, can never match, so they are
+    dropped with a warning. Other type names that are not Qt widgets, imported widget
+    subclasses or in `known_types` may belong to widgets that are not imported yet, so
+    their rules are kept with a warning.
+    """
+    known_types = set(known_types) | _widget_subclass_names()
+    compiled = []
+    for selector, declarations in _parse_rules(source):
+        if not declarations:
+            continue
+        live = []
+        for s in (s.strip() for s in _split(selector, ",")):
+            names = _TYPE_NAME.findall(_ATTRIBUTE.sub("", s))
+            unknown = [n for n in names if n not in known_types]
+            classes = [_qt_class(n) for n in unknown]
+            if any(c and not issubclass(c, QtWidgets.QWidget) for c in classes):
+                continue
+            if any(c is None for c in classes):
+                log.warning(f"Stylesheet rule for unknown widgets '{s}'")
+            live.append(s)
+        if not live:
+            log.warning(f"Dropped stylesheet rule for non-widget types '{selector}'")
+            continue
+        compiled.append(f"{','.join(live)}{{{';'.join(declarations)}}}")
+    return "\n".join(compiled)
+
+
+def load_stylesheet(style_dir: str, name: str) -> str:
+    """Return the compiled stylesheet, compiling the source if it is out of date"""
+    source_path = os.path.join(style_dir, f"{name}.qss")
+    compiled_path = os.path.join(style_dir, f"{name}.min.qss")
+    if os.path.exists(compiled_path) and (
+        not os.path.exists(source_path)
+        or os.path.getmtime(compiled_path) >= os.path.getmtime(source_path)
+    ):
+        with open(compiled_path) as f:
+            return f.read()
+    with open(source_path) as f:
+        return compile_stylesheet(f.read())
+
 
 def dark_palette():
     p = QPalette()
@@ -2,7 +2,7 @@ import logging
 from typing import Tuple
 
 from PyQt5 import QtGui, QtWidgets
-from PyQt5.QtCore import QSize, Qt, pyqtSignal
+from PyQt5.QtCore import QSize, Qt, QTimer, pyqtSignal
 from PyQt5.QtWidgets import (
     QApplication,
     QGridLayout,
@@ -13,16 +13,21 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
+from . import config, vlcqt
 from .adjustments import OpenMediaPlayerAdjustmentsWindowAction
 from .base.docking import DockableWidget, ToolBar
+from .client.commands import CommandDispatcher
 from .client.configure import OpenClientSettingsDialogAction
 from .client.connect import ConnectStatusLabel, ConnectWideButtonBuilder
 from .client.controller import IOController
 from .client.socks import AutoReconnectSocket
+from .client.sync import PlaybackSynchronizer
+from .client.telemetry import TelemetryReporter
 from .gui.ontop import AlwaysOnTopAction
-from .gui.style import initialize_style
 from .output.frame import MediaPlayerContentFrame
 from .output.fullscreen import FullscreenManager, FullscreenMenu, FullscreenStatusLabel
+from .output.hud import PerformanceMonitor, PerformanceOverlay, PerformanceOverlayAction
+from .output.multiscreen import MultiScreenOutput
 from .output.orientation import OrientationStatusLabel, ViewpointManager
 from .output.playback import (
     FrameResolutionTimeSlider,
@@ -38,10 +43,12 @@ from .output.size import (
     ZoomOutAction,
 )
 from .output.sound import VolumeManager, VolumePopupButton
+from .playlist.caching import BufferingMonitor
 from .playlist.files import OpenMediaMenu
 from .playlist.player import MediaListPlayer
 from .playlist.view import DockablePlaylist, PlaylistWidget
 from .preferences import OpenMediaPlayerPreferencesWindowAction
+from .utils.profiling import startup_profiler
 
 log = logging.getLogger(__name__)
 
@@ -50,22 +57,27 @@ class MainWindow(QMainWindow):
     initialized = pyqtSignal()
     centralwidgetresized = pyqtSignal()
 
-    def __init__(self, media_player, stylesheet, flags=None):
+    def __init__(self, media_player, flags=None):
         QMainWindow.__init__(self, flags)
         self._window_state = None
+        self._size_hint = None
         self.qapp = QApplication.instance()
-        initialize_style(self.qapp, stylesheet)
 
         self.media_player = media_player
 
         self.setDockNestingEnabled(True)
 
-        self.create_interface()
-        self.create_status_bar()
-        self.create_playback_components()
-        self.create_other_components()
-        self.create_gui_layout()
-        self.create_window_shortcuts()
+        for create in (
+            self.create_interface,
+            self.create_status_bar,
+            self.create_playback_components,
+            self.create_other_components,
+            self.create_gui_layout,
+            self.create_window_shortcuts,
+        ):
+            with startup_profiler.phase(create.__name__):
+                create()
+        QTimer.singleShot(0, self.create_deferred_components)
 
         self.initialized.emit()
 
@@ -94,13 +106,34 @@ class MainWindow(QMainWindow):
         self.viewpoint_mngr = ViewpointManager(
             io_ctrlr=self.io_ctrlr, media_player=self.media_player
         )
+        self.telemetry = TelemetryReporter(
+            socket=self.socket,
+            media_player=self.media_player,
+            viewpoint_mngr=self.viewpoint_mngr,
+            sample_rate=config.state.telemetry_rate,
+        )
+        self.telemetry.set_enabled(config.state.telemetry_enable)
+        self.synchronizer = PlaybackSynchronizer(
+            io_ctrlr=self.io_ctrlr,
+            media_player=self.media_player,
+            tolerance_ms=config.state.sync_tolerance_ms,
+        )
+        self.synchronizer.set_enabled(config.state.sync_enable)
         self.loop_mode_mngr = LoopModeManager(parent=self)
+        if config.state.frame_clock == "decoder":
+            self.frame_callbacks = vlcqt.FrameCallbacks(media_player=self.media_player)
+        else:
+            self.frame_callbacks = None
         self.listplayer = MediaListPlayer(
             viewpoint_mngr=self.viewpoint_mngr,
             loop_mode_mngr=self.loop_mode_mngr,
             media_player=self.media_player,
+            frame_callbacks=self.frame_callbacks,
         )
         self.listplayer.newframe.connect(self.viewpoint_mngr.on_newframe)
+        self.buffering_monitor = BufferingMonitor(
+            listplayer=self.listplayer, media_player=self.media_player
+        )
         self.frame_size_mngr = FrameSizeManager(
             main_win=self,
             viewpoint_mngr=self.viewpoint_mngr,
@@ -110,17 +143,42 @@ class MainWindow(QMainWindow):
             main_win=self,
             frame_size_mngr=self.frame_size_mngr,
             media_player=self.media_player,
+            frame_callbacks=self.frame_callbacks,
+            viewpoint_mngr=self.viewpoint_mngr,
+        )
+        self.listplayer.mediachanged.connect(
+            self.media_player_content_frame.on_mediachanged
         )
         self.setCentralWidget(self.media_player_content_frame)
+        self.perf_monitor = PerformanceMonitor(
+            media_player=self.media_player,
+            io_ctrlr=self.io_ctrlr,
+            viewpoint_mngr=self.viewpoint_mngr,
+            rate=config.state.hud_rate,
+        )
+        self.perf_overlay = PerformanceOverlay(
+            perf_monitor=self.perf_monitor,
+            parent=self.media_player_content_frame,
+            native=not self.frame_callbacks,
+        )
+        self.media_player_content_frame.add_overlay(self.perf_overlay)
         self.zoom_ctrl_mngr = ZoomControlManager(
             main_win=self,
             frame_size_mngr=self.frame_size_mngr,
             media_player=self.media_player,
         )
+        if self.frame_callbacks:
+            self.multiscreen = MultiScreenOutput(
+                frame_callbacks=self.frame_callbacks,
+                viewpoint_mngr=self.viewpoint_mngr,
+            )
+        else:
+            self.multiscreen = None
         self.fullscreen_mngr = FullscreenManager(
             main_win=self,
             main_content_frame=self.media_player_content_frame,
             viewpoint_mngr=self.viewpoint_mngr,
+            multiscreen=self.multiscreen,
         )
 
     def create_playback_components(self):
@@ -147,6 +205,10 @@ class MainWindow(QMainWindow):
             parent=self, loop_mode_mngr=self.loop_mode_mngr
         )
         self.always_on_top_act = AlwaysOnTopAction(main_win=self)
+        self.perf_overlay_act = PerformanceOverlayAction(
+            main_win=self, overlay=self.perf_overlay
+        )
+        self.addAction(self.perf_overlay_act)
 
         self.zoom_in_act = ZoomInAction(parent=self, zoom_ctrl_mngr=self.zoom_ctrl_mngr)
         self.zoom_out_act = ZoomOutAction(
@@ -174,6 +236,14 @@ class MainWindow(QMainWindow):
             main_win=self, fullscreen_mngr=self.fullscreen_mngr
         )
         self.vol_popup_bttn = VolumePopupButton(parent=self, vol_mngr=self.vol_mngr)
+        self.command_dispatcher = CommandDispatcher(
+            io_ctrlr=self.io_ctrlr,
+            listplayer=self.listplayer,
+            media_player=self.media_player,
+            playlist_widget=self.playlist_widget,
+            vol_mngr=self.vol_mngr,
+            loop_mode_mngr=self.loop_mode_mngr,
+        )
 
         self.connect_wide_button_builder = ConnectWideButtonBuilder(
             parent=self, socket=self.socket
@@ -283,6 +353,12 @@ class MainWindow(QMainWindow):
         self.addDockWidget(Qt.RightDockWidgetArea, self.dockable_playlist)
         self.addDockWidget(Qt.BottomDockWidgetArea, self.playback_ctrls_dock_widget)
 
+    def create_deferred_components(self):
+        """Build windows that are not needed for the first frame, once it is shown"""
+        with startup_profiler.phase("create_deferred_components"):
+            # Building the adjustments window applies the stored effects to the player
+            self.open_adjustments_act.create_widget()
+
     def create_window_shortcuts(self):
         # Close window
         self.shortcut_exit = QtWidgets.QShortcut(
@@ -321,35 +397,31 @@ class MainWindow(QMainWindow):
 
     def _get_win_size(self, media_w, media_h, scale) -> Tuple[int, int]:
         """Calculate total window resize values from current compoment displacement"""
-        layout_h = self.layout().totalSizeHint().height()
-        return media_w * scale, media_h * scale + layout_h
+        central = self.centralWidget()
+        if self.isVisible() and central:
+            # Everything around the central widget, including docks, keeps its size
+            extra_w = self.width() - central.width()
+            extra_h = self.height() - central.height()
+        else:
+            extra_w, extra_h = 0, self.layout().totalSizeHint().height()
+        return int(media_w * scale) + extra_w, int(media_h * scale) + extra_h
 
     def resize_to_media(self, media_w, media_h, scale):
-        playlist_is_visible = self.dockable_playlist.isVisible()
-        if playlist_is_visible:
-            self.dockable_playlist.setVisible(False)
-
         win_w, win_h = self._get_win_size(media_w, media_h, scale)
+        self._size_hint = QSize(win_w, win_h)
+        self.updateGeometry()
         self.resize(win_w, win_h)
 
-        if playlist_is_visible:
-            self.dockable_playlist.setVisible(True)
-
     def showEvent(self, e):
-        scale = self.frame_size_mngr.get_media_scale()
-        media_w, media_h = self.frame_size_mngr.get_media_size()
-        self.resize_to_media(media_w, media_h, scale)
+        self.frame_size_mngr.update_frame_size()
         return super().showEvent(e)
 
     def sizeHint(self):
-        try:
-            return self._size_hint
-        except AttributeError:
+        if self._size_hint is None:
             scale = self.frame_size_mngr.get_media_scale()
             media_w, media_h = self.frame_size_mngr.get_media_size()
             self._size_hint = QSize(*self._get_win_size(media_w, media_h, scale))
-        finally:
-            return self._size_hint
+        return self._size_hint
 
     def closeEvent(self, e):
         self.fullscreen_mngr.stop()
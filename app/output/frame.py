@@ -1,9 +1,18 @@
 import logging
 import sys
 
-from PyQt5.QtCore import QSize, Qt
-from PyQt5.QtGui import QColor, QPalette
-from PyQt5.QtWidgets import QFrame, QSizePolicy, QSplitter
+from PyQt5.QtCore import QPoint, QRect, QSize, Qt, pyqtSlot
+from PyQt5.QtGui import QColor, QPainter, QPalette, QWindow
+from PyQt5.QtWidgets import (
+    QFrame,
+    QLabel,
+    QSizePolicy,
+    QSplitter,
+    QStackedLayout,
+    QWidget,
+)
+
+from app.output.multiscreen import FrameTexture, SphericalView, ViewOffset
 
 log = logging.getLogger(__name__)
 
@@ -27,32 +36,155 @@ class BaseContentFrame(QFrame):
         self.setPalette(p)
 
 
+class VideoSurface(QWindow):
+    """Native window that libvlc renders into.
+
+    Reparenting a QWindow moves its native window rather than recreating it, so the
+    video output stays alive when the surface moves in and out of fullscreen.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.setFlags(self.flags() | Qt.FramelessWindowHint)
+        self.create()
+
+
+class FramePainter(SphericalView):
+    """Paint frames rendered into memory by the decoder frame clock.
+
+    libvlc does not project frames rendered through video callbacks, so spherical
+    media is projected here for the user's viewpoint, and other media is drawn flat.
+    """
+
+    def __init__(self, frame_callbacks, viewpoint_mngr, parent=None):
+        super().__init__(
+            frame_texture=FrameTexture(frame_callbacks),
+            viewpoint_mngr=viewpoint_mngr,
+            offset=ViewOffset(),
+            parent=parent,
+        )
+        self.frame_callbacks = frame_callbacks
+        self.spherical = False
+        self.frame_callbacks.framedisplayed.connect(self.update)
+        self.viewpoint_mngr.updatedviewpoint.connect(self.on_updatedviewpoint)
+
+    def set_spherical(self, spherical: bool):
+        self.spherical = spherical
+        self.update()
+
+    @pyqtSlot(float, float, float)
+    def on_updatedviewpoint(self, yaw, pitch, roll):
+        if self.spherical:
+            self.update()
+
+    def initializeGL(self):
+        super().initializeGL()
+        # Reparenting in and out of fullscreen replaces the context
+        self.context().aboutToBeDestroyed.connect(self.destroy_texture)
+
+    def destroy_texture(self):
+        self.makeCurrent()
+        self.frame_texture.destroy()
+        self.doneCurrent()
+
+    def paintGL(self):
+        if self.spherical:
+            return super().paintGL()
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), Qt.black)
+        with self.frame_callbacks.pinned() as frame:
+            if frame is not None:
+                image = self.frame_callbacks.image(frame)
+                size = image.size().scaled(self.size(), Qt.KeepAspectRatio)
+                target = QRect(0, 0, size.width(), size.height())
+                target.moveCenter(self.rect().center())
+                painter.drawImage(target, image)
+        painter.end()
+
+
+def _show_fullscreen(window, qscreen):
+    window.setGeometry(qscreen.geometry())
+    # TODO: On mac, check if qscreen is main OS screen w/ dock + top bar. If so,
+    # use fullscreen instead of maximized.
+    if sys.platform == "darwin":
+        window.showMaximized()
+    else:
+        window.showFullScreen()
+
+
 class MediaPlayerContentFrame(BaseContentFrame):
-    def __init__(self, main_win, frame_size_mngr, media_player):
+    def __init__(
+        self,
+        main_win,
+        frame_size_mngr,
+        media_player,
+        frame_callbacks=None,
+        viewpoint_mngr=None,
+    ):
         super().__init__(parent=main_win)
-        self.setWindowFlags(self.windowFlags() | Qt.FramelessWindowHint)
         self.main_win = main_win
         self.frame_size_mngr = frame_size_mngr
         self.mp = media_player
-        self.mp.set_output_widget(self)
+        self.frame_callbacks = frame_callbacks
         self.content_qsize = QSize()
 
-    def start_fullscreen(self, qscreen):
-        self.setParent(None)
-        self.setGeometry(qscreen.geometry())
-        # TODO: On mac, check if qscreen is main OS screen w/ dock + top bar. If so,
-        # use fullscreen instead of maximized.
-        if sys.platform == "darwin":
-            self.setWindowState(Qt.WindowMaximized)
-            self.showMaximized()
+        if self.frame_callbacks:
+            self.video_surface = None
+            self.output_widget = FramePainter(
+                frame_callbacks, viewpoint_mngr=viewpoint_mngr, parent=self
+            )
         else:
-            self.setWindowState(Qt.WindowFullScreen)
-            self.showFullScreen()
+            self.video_surface = VideoSurface()
+            self.output_widget = QWidget.createWindowContainer(
+                self.video_surface, parent=self
+            )
+            self.mp.set_output_widget(self.video_surface)
+
+        self.fullscreen_label = QLabel(parent=self)
+        self.fullscreen_label.setAlignment(Qt.AlignCenter)
+        self.setLayout(QStackedLayout())
+        self.layout().addWidget(self.output_widget)
+        self.layout().addWidget(self.fullscreen_label)
+        self.overlays = []
+
+    def on_mediachanged(self, media_item):
+        if self.frame_callbacks:
+            self.output_widget.set_spherical(media_item.is_spherical())
+
+    def add_overlay(self, widget: QWidget):
+        """Keep `widget` above the video output. Overlays are not laid out."""
+        widget.setParent(self)
+        self.overlays.append(widget)
+        widget.raise_()
+
+    def start_fullscreen(self, qscreen, text=""):
+        """Move the video output to `qscreen` and show `text` in its place"""
+        self.fullscreen_label.setText(text)
+        self.layout().setCurrentWidget(self.fullscreen_label)
+        if self.video_surface:
+            self.video_surface.setParent(None)
+            self.video_surface.setScreen(qscreen)
+            _show_fullscreen(self.video_surface, qscreen)
+        else:
+            self.layout().removeWidget(self.output_widget)
+            self.output_widget.setParent(None)
+            _show_fullscreen(self.output_widget, qscreen)
 
     def stop_fullscreen(self):
-        self.hide()
-        self.main_win.setCentralWidget(self)
-        self.show()
+        if self.video_surface:
+            self.video_surface.setWindowState(Qt.WindowNoState)
+            self.video_surface.setParent(self.window().windowHandle())
+            origin = self.output_widget.mapTo(self.window(), QPoint())
+            self.video_surface.setGeometry(QRect(origin, self.output_widget.size()))
+            self.video_surface.show()
+        else:
+            self.output_widget.hide()
+            self.output_widget.setWindowState(Qt.WindowNoState)
+            self.layout().insertWidget(0, self.output_widget)
+            self.output_widget.show()
+        self.layout().setCurrentWidget(self.output_widget)
+        for overlay in self.overlays:
+            overlay.raise_()
 
 
 class SplitView(QSplitter):
@@ -1,60 +1,64 @@
 import logging
 import os
 
-from PyQt5 import QtCore, QtWidgets
 from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QAction, QActionGroup, QApplication, QMenu
 
 from app.gui import icons
+from app.output import multiscreen
 from app.output.status import IconStatusLabel
 
-from .frame import BaseContentFrame
-
 log = logging.getLogger(__name__)
 
 
 def get_qscreen_at(widget):
     qguiapp = QApplication.instance()
-    # return qguiapp.screenAt(widget.geometry().center())
-    return qguiapp.screens()[0]
+    qscreen = qguiapp.screenAt(widget.frameGeometry().center())
+    return qscreen or qguiapp.primaryScreen()
 
 
 class FullscreenManager(QObject):
     fullscreenstarted = pyqtSignal(QAction)
     fullscreenstopped = pyqtSignal()
 
-    def __init__(self, main_win, main_content_frame, viewpoint_mngr):
+    def __init__(self, main_win, main_content_frame, viewpoint_mngr, multiscreen=None):
         super().__init__()
         self.main_win = main_win
         self.viewpoint_mngr = viewpoint_mngr
         self.main_content_frame = main_content_frame
+        self.multiscreen = multiscreen
 
         self._is_fullscreen = False
 
     def start(self, action):
+        self.stop()
         qscreen = action.qscreen
-        self.main_content_frame.start_fullscreen(qscreen)
+        description = qscreen_description_string(qscreen)
+        # Only the video output moves, with a notification left in its place
+        self.main_content_frame.start_fullscreen(
+            qscreen, text=f"- Fullscreen Mode -{os.linesep}{description}"
+        )
         self._is_fullscreen = True
         self.fullscreenstarted.emit(action)
 
-        # Set a temp frame with a notification in empty window space
-        temp_frame = BaseContentFrame()
-        temp_frame.setLayout(QtWidgets.QVBoxLayout())
-        temp_label = QtWidgets.QLabel(
-            f"""- Fullscreen Mode -{os.linesep}{qscreen_description_string(qscreen)}"""
-        )
-        temp_label.setAlignment(QtCore.Qt.AlignCenter)
-        temp_frame.layout().addWidget(temp_label)
-        self.main_win.setCentralWidget(temp_frame)
-
         # Give focus to main window
         self.main_win.activateWindow()
 
+    def start_multiscreen(self, action):
+        self.stop()
+        self.multiscreen.start(QApplication.instance().screens(), mode=action.mode)
+        self._is_fullscreen = True
+        self.fullscreenstarted.emit(action)
+        self.main_win.activateWindow()
+
     def stop(self):
         if not self._is_fullscreen:
             return
-        self.main_content_frame.stop_fullscreen()
+        if self.multiscreen and self.multiscreen.is_active():
+            self.multiscreen.stop()
+        else:
+            self.main_content_frame.stop_fullscreen()
         self._is_fullscreen = False
         self.fullscreenstopped.emit()
 
@@ -126,6 +130,22 @@ class StartFullscreenAction(QAction):
         super().setText(text)
 
 
+class StartMultiScreenAction(QAction):
+    mode_texts = {"mirror": "Mirror on All Screens", "span": "Span Across All Screens"}
+
+    def __init__(self, mode, fullscreen_mngr, main_win=None):
+        super().__init__(parent=main_win)
+        self.mode = mode
+        self.fullscreen_mngr = fullscreen_mngr
+        self.setText(self.mode_texts[mode])
+        # Views are rendered from decoded frames, so the decoder frame clock is needed
+        self.setEnabled(fullscreen_mngr.multiscreen is not None)
+        self.triggered.connect(self.on_triggered)
+
+    def on_triggered(self, arg):
+        self.fullscreen_mngr.start_multiscreen(self)
+
+
 class StopFullscreenAction(QAction):
     def __init__(self, parent, fullscreen_mngr):
         super().__init__(parent=parent)
@@ -180,6 +200,14 @@ class FullscreenMenu(QMenu):
             action.setIcon(icons.get("display_screen"))
             self.action_group.addAction(action)
 
+        for mode in multiscreen.MODES:
+            action = StartMultiScreenAction(
+                mode=mode, fullscreen_mngr=self.fullscreen_mngr, main_win=self.main_win
+            )
+            action.setCheckable(True)
+            action.setIcon(icons.get("display_screen"))
+            self.action_group.addAction(action)
+
         self.action_group.addAction(self.stop_fs_action)
         self.addActions(self.action_group.actions())
 
@@ -0,0 +1,201 @@
+import logging
+import time
+from typing import List, NamedTuple, Optional
+
+from PyQt5.QtCore import QObject, QRect, Qt, QTimer, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QColor, QKeySequence, QPainter
+from PyQt5.QtWidgets import QAction, QWidget
+
+from app import config, vlcqt
+from app.gui import fonts
+
+log = logging.getLogger(__name__)
+
+
+class PerformanceSample(NamedTuple):
+    decode_fps: float
+    display_fps: float
+    dropped_frames: int  # lost pictures since the media was loaded
+    buffering: float  # %
+    motion_rate: float  # packets/s
+    motion_latency_ms: Optional[float]
+    loop_lag_ms: float
+
+    def lines(self) -> List[str]:
+        if self.motion_latency_ms is None:
+            latency = "     -"
+        else:
+            latency = f"{self.motion_latency_ms:6.1f}"
+        return [
+            f"decode   {self.decode_fps:6.1f} fps",
+            f"display  {self.display_fps:6.1f} fps",
+            f"dropped  {self.dropped_frames:6d}",
+            f"buffer   {self.buffering:6.0f} %",
+            f"motion   {self.motion_rate:6.1f} /s",
+            f"latency  {latency} ms",
+            f"loop lag {self.loop_lag_ms:6.1f} ms",
+        ]
+
+
+class PerformanceMonitor(QObject):
+    """Sample playback health `rate` times a second while started.
+
+    Frame counts come from libvlc's media stats, so sampling costs one stats call per
+    tick. Event loop lag is how late each tick fires, so a busy GUI thread shows up
+    without any extra timers.
+    """
+
+    sampled = pyqtSignal(object)
+
+    def __init__(self, media_player, io_ctrlr, viewpoint_mngr, rate: int = 4):
+        super().__init__()
+        self.mp = media_player
+        self.io_ctrlr = io_ctrlr
+        self.viewpoint_mngr = viewpoint_mngr
+        self.latest: Optional[PerformanceSample] = None
+
+        self._stats = vlcqt.MediaStats()
+        self._buffering = 100.0
+        self._last_tick = None
+        self._last_counts = None
+
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.sample)
+        self.set_rate(rate)
+
+    def set_rate(self, rate: int):
+        self.timer.setInterval(int(1000 / rate))
+
+    def start(self):
+        if self.timer.isActive():
+            return
+        self._last_tick = self._last_counts = None
+        self.mp.buffering.connect(self.on_buffering)
+        self.timer.start()
+
+    def stop(self):
+        if not self.timer.isActive():
+            return
+        self.timer.stop()
+        self.mp.buffering.disconnect(self.on_buffering)
+
+    def is_active(self) -> bool:
+        return self.timer.isActive()
+
+    def on_buffering(self, e):
+        self._buffering = e.value
+
+    def _counts(self):
+        """Decoded, displayed and lost pictures, and motion packets received"""
+        media = self.mp.get_media()
+        if media and media.get_stats(self._stats):
+            pictures = (
+                self._stats.decoded_video,
+                self._stats.displayed_pictures,
+                self._stats.lost_pictures,
+            )
+        else:
+            pictures = (0, 0, 0)
+        return (*pictures, self.io_ctrlr.motion_packets)
+
+    @pyqtSlot()
+    def sample(self):
+        now = time.monotonic()
+        counts = self._counts()
+        if self._last_tick is None:
+            self._last_tick, self._last_counts = now, counts
+            return
+        elapsed = now - self._last_tick
+        lag_ms = max(0.0, elapsed * 1000 - self.timer.interval())
+        decoded, displayed, _, packets = (
+            max(0, new - old) / elapsed for new, old in zip(counts, self._last_counts)
+        )
+        self._last_tick, self._last_counts = now, counts
+        self.latest = PerformanceSample(
+            decode_fps=decoded,
+            display_fps=displayed,
+            dropped_frames=counts[2],
+            buffering=self._buffering,
+            motion_rate=packets,
+            motion_latency_ms=self.viewpoint_mngr.motion_latency_ms,
+            loop_lag_ms=lag_ms,
+        )
+        self.sampled.emit(self.latest)
+
+
+class PerformanceOverlay(QWidget):
+    """Show the monitor's latest sample in the corner of the video frame.
+
+    Repaints only when a sample arrives, so the update rate is bounded by the monitor.
+    """
+
+    margin = 8
+    padding = 6
+
+    def __init__(self, perf_monitor: PerformanceMonitor, parent, native=False):
+        super().__init__(parent)
+        self.perf_monitor = perf_monitor
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        if native:
+            # Native video windows cover sibling widgets unless they are native too
+            self.setAttribute(Qt.WA_DontCreateNativeAncestors)
+            self.setAttribute(Qt.WA_NativeWindow)
+        self.setFont(fonts.get_fixed_pitch_font())
+        self.background = QColor(0, 0, 0, 160)
+        self._lines: List[str] = []
+        self.hide()
+        self.perf_monitor.sampled.connect(self.on_sampled)
+
+    def set_enabled(self, enabled: bool):
+        if enabled:
+            self.perf_monitor.start()
+            self.raise_()
+        else:
+            self.perf_monitor.stop()
+        self.setVisible(enabled)
+
+    @pyqtSlot(object)
+    def on_sampled(self, sample: PerformanceSample):
+        self._lines = sample.lines()
+        metrics = self.fontMetrics()
+        width = max(metrics.width(line) for line in self._lines)
+        height = metrics.lineSpacing() * len(self._lines)
+        pad = self.padding
+        self.setGeometry(self.margin, self.margin, width + pad * 2, height + pad * 2)
+        self.update()
+
+    def paintEvent(self, e):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.background)
+        painter.setPen(Qt.white)
+        line_height = self.fontMetrics().lineSpacing()
+        for index, line in enumerate(self._lines):
+            rect = QRect(
+                self.padding,
+                self.padding + index * line_height,
+                self.width() - self.padding * 2,
+                line_height,
+            )
+            painter.drawText(rect, Qt.AlignLeft | Qt.AlignVCenter, line)
+        painter.end()
+
+
+class PerformanceOverlayAction(QAction):
+    def __init__(self, main_win, overlay: PerformanceOverlay):
+        super().__init__(text="Performance Overlay", parent=main_win)
+        self.main_win = main_win
+        self.overlay = overlay
+
+        self.setCheckable(True)
+        self.setShortcut(QKeySequence("Ctrl+Shift+P"))
+
+        self.triggered.connect(self.on_triggered)
+        self.main_win.initialized.connect(
+            lambda: self.triggered.emit(config.state.hud_enable)
+        )
+
+    def on_triggered(self, checked):
+        self.overlay.set_enabled(checked)
+        config.state.hud_enable = checked
+        self.setChecked(checked)
@@ -0,0 +1,223 @@
+import logging
+import math
+from typing import List, NamedTuple, Tuple
+
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, Qt, pyqtSlot
+from PyQt5.QtGui import (
+    QOpenGLShader,
+    QOpenGLShaderProgram,
+    QOpenGLTexture,
+    QScreen,
+    QVector2D,
+)
+from PyQt5.QtWidgets import QOpenGLWidget
+
+log = logging.getLogger(__name__)
+
+MODES = ("mirror", "span")
+
+GL_TRIANGLE_STRIP = 0x0005
+
+VERTEX_SHADER = """
+attribute vec2 position;
+varying vec2 ndc;
+void main() {
+    ndc = position;
+    gl_Position = vec4(position, 0.0, 1.0);
+}
+"""
+
+# Sample an equirectangular frame along each pixel's view direction
+FRAGMENT_SHADER = """
+uniform sampler2D frame;
+uniform vec3 angles;
+uniform vec2 tan_half_fov;
+varying vec2 ndc;
+const float PI = 3.14159265358979;
+void main() {
+    vec3 d = normalize(vec3(ndc * tan_half_fov, -1.0));
+    float cr = cos(angles.z), sr = sin(angles.z);
+    d = vec3(cr * d.x - sr * d.y, sr * d.x + cr * d.y, d.z);
+    float cp = cos(angles.y), sp = sin(angles.y);
+    d = vec3(d.x, cp * d.y - sp * d.z, sp * d.y + cp * d.z);
+    float cy = cos(angles.x), sy = sin(angles.x);
+    d = vec3(cy * d.x - sy * d.z, d.y, sy * d.x + cy * d.z);
+    float lon = atan(d.x, -d.z);
+    float lat = asin(clamp(d.y, -1.0, 1.0));
+    gl_FragColor = texture2D(frame, vec2(lon / (2.0 * PI) + 0.5, 0.5 - lat / PI));
+}
+"""
+
+
+class ViewOffset(NamedTuple):
+    yaw: float = 0.0
+    pitch: float = 0.0
+    roll: float = 0.0
+
+
+def screen_views(
+    screens: List[QScreen], mode: str, fov: float
+) -> List[Tuple[QScreen, ViewOffset]]:
+    """Pair each screen with its view offset, ordered left to right.
+
+    'mirror' shows the same view on every screen. 'span' turns each screen by one
+    field of view from its neighbour, centered on the user's viewpoint.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown multi-screen mode '{mode}'")
+    screens = sorted(screens, key=lambda s: (s.geometry().x(), s.geometry().y()))
+    center = (len(screens) - 1) / 2
+    views = []
+    for index, screen in enumerate(screens):
+        yaw = (index - center) * fov if mode == "span" else 0.0
+        views.append((screen, ViewOffset(yaw=yaw)))
+    return views
+
+
+class FrameTexture:
+    """One texture shared by all views' GL contexts.
+
+    The latest decoded frame is uploaded by whichever view paints first, and other
+    views sample the same texture.
+    """
+
+    def __init__(self, frame_callbacks):
+        self.frame_callbacks = frame_callbacks
+        self.texture = None
+        self._uploaded = None
+
+    def bind(self) -> bool:
+        with self.frame_callbacks.pinned() as frame:
+            if frame is None:
+                return False
+            self._upload(frame)
+        self.texture.bind()
+        return True
+
+    def _upload(self, frame):
+        size = frame.width, frame.height
+        texture = self.texture
+        if texture is None or size != (texture.width(), texture.height()):
+            self.destroy()
+            self.texture = QOpenGLTexture(QOpenGLTexture.Target2D)
+            self.texture.setSize(*size)
+            self.texture.setFormat(QOpenGLTexture.RGBA8_UNorm)
+            self.texture.allocateStorage(QOpenGLTexture.BGRA, QOpenGLTexture.UInt8)
+            self.texture.setMinMagFilters(QOpenGLTexture.Linear, QOpenGLTexture.Linear)
+            self.texture.setWrapMode(QOpenGLTexture.DirectionS, QOpenGLTexture.Repeat)
+            self.texture.setWrapMode(
+                QOpenGLTexture.DirectionT, QOpenGLTexture.ClampToEdge
+            )
+        key = frame.pts_us, frame.buffer
+        if key != self._uploaded:
+            address = self.frame_callbacks.buffers.address(frame.buffer)
+            self.texture.setData(
+                QOpenGLTexture.BGRA, QOpenGLTexture.UInt8, sip.voidptr(address)
+            )
+            self._uploaded = key
+
+    def destroy(self):
+        if self.texture is not None:
+            self.texture.destroy()
+        self.texture = None
+        self._uploaded = None
+
+
+class SphericalView(QOpenGLWidget):
+    """Project the shared equirectangular frame for the user's viewpoint plus an
+    offset.
+    """
+
+    def __init__(self, frame_texture, viewpoint_mngr, offset: ViewOffset, parent=None):
+        super().__init__(parent)
+        self.setWindowFlags(self.windowFlags() | Qt.FramelessWindowHint)
+        self.frame_texture = frame_texture
+        self.viewpoint_mngr = viewpoint_mngr
+        self.offset = offset
+        self.program = None
+
+    def initializeGL(self):
+        self.program = QOpenGLShaderProgram(self)
+        self.program.addShaderFromSourceCode(QOpenGLShader.Vertex, VERTEX_SHADER)
+        self.program.addShaderFromSourceCode(QOpenGLShader.Fragment, FRAGMENT_SHADER)
+        if not self.program.link():
+            log.error(f"Could not link spherical view shader: {self.program.log()}")
+
+    def paintGL(self):
+        gl = self.context().functions()
+        gl.glClearColor(0, 0, 0, 1)
+        gl.glClear(0x4000)  # GL_COLOR_BUFFER_BIT
+        if not self.frame_texture.bind():
+            return
+        vp = self.viewpoint_mngr.user_vp
+        fov = math.radians(vp.field_of_view)
+        aspect = self.width() / max(self.height(), 1)
+        self.program.bind()
+        self.program.setUniformValue("frame", 0)
+        self.program.setUniformValue(
+            "angles",
+            math.radians(self.offset.yaw - vp.yaw),
+            math.radians(self.offset.pitch - vp.pitch),
+            math.radians(self.offset.roll - vp.roll),
+        )
+        tan_half_fov = math.tan(fov / 2)
+        self.program.setUniformValue(
+            "tan_half_fov", tan_half_fov, tan_half_fov / aspect
+        )
+        self.program.enableAttributeArray("position")
+        self.program.setAttributeArray(
+            "position",
+            [QVector2D(-1, -1), QVector2D(1, -1), QVector2D(-1, 1), QVector2D(1, 1)],
+        )
+        gl.glDrawArrays(GL_TRIANGLE_STRIP, 0, 4)
+        self.program.disableAttributeArray("position")
+        self.program.release()
+
+
+class MultiScreenOutput(QObject):
+    """Show views of the one decoded stream fullscreen on several screens.
+
+    Frames come from the decoder frame clock, so there is one player and one decoder
+    however many screens are used, and each frame is uploaded to the GPU once.
+    """
+
+    def __init__(self, frame_callbacks, viewpoint_mngr):
+        super().__init__()
+        self.frame_callbacks = frame_callbacks
+        self.viewpoint_mngr = viewpoint_mngr
+        self.frame_texture = FrameTexture(frame_callbacks)
+        self.views: List[SphericalView] = []
+
+    def start(self, screens: List[QScreen], mode: str):
+        self.stop()
+        fov = self.viewpoint_mngr.user_vp.field_of_view
+        for screen, offset in screen_views(screens, mode, fov):
+            view = SphericalView(self.frame_texture, self.viewpoint_mngr, offset)
+            view.setGeometry(screen.geometry())
+            view.showFullScreen()
+            self.views.append(view)
+        self.frame_callbacks.framedisplayed.connect(self.on_framedisplayed)
+        self.viewpoint_mngr.updatedviewpoint.connect(self.on_framedisplayed)
+        log.info(f"MULTI-SCREEN START mode={mode} screens={len(self.views)}")
+
+    def stop(self):
+        if not self.views:
+            return
+        self.frame_callbacks.framedisplayed.disconnect(self.on_framedisplayed)
+        self.viewpoint_mngr.updatedviewpoint.disconnect(self.on_framedisplayed)
+        self.views[0].makeCurrent()
+        self.frame_texture.destroy()
+        self.views[0].doneCurrent()
+        for view in self.views:
+            view.close()
+            view.deleteLater()
+        self.views = []
+
+    def is_active(self) -> bool:
+        return bool(self.views)
+
+    @pyqtSlot()
+    def on_framedisplayed(self):
+        for view in self.views:
+            view.update()
@@ -1,4 +1,5 @@
 import logging
+import time
 from itertools import cycle
 
 from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
@@ -8,6 +9,7 @@ from PyQt5.QtWidgets import QStatusBar
 from app import vlcqt
 from app.gui import fonts, icons
 from app.output.status import IconStatusLabel
+from app.utils.logs import span
 
 log = logging.getLogger(__name__)
 
@@ -39,6 +41,10 @@ class ViewpointManager(QObject):
         self.param_indexes_cycle = cycle((0, 1, 2))
         self.is_enabled = False
 
+        # Delay from receiving a motion packet to applying it for the next frame
+        self.motion_latency_ms = None
+        self._applied_packets = 0
+
         # self.mp.newframe.connect(self.on_newframe) # Signal connected in MainWindow
         self.mp.vout.connect(self.trigger_redraw)  # Not needed if updating per frame
 
@@ -54,14 +60,19 @@ class ViewpointManager(QObject):
         new_motion_state = self.io_ctrlr.get_new_motion_state()
         if new_motion_state:
             self.set_new_user_viewpoint(*new_motion_state)
+            if self.io_ctrlr.motion_packets != self._applied_packets:
+                self._applied_packets = self.io_ctrlr.motion_packets
+                received_at = self.io_ctrlr.motion_received_at
+                self.motion_latency_ms = (time.monotonic() - received_at) * 1000
         else:
             self.trigger_redraw()
 
     def _update_viewpoint(self, viewpoint):
         """Update given viewpoint in player"""
-        errorcode = self.mp.video_update_viewpoint(
-            p_viewpoint=viewpoint, b_absolute=True
-        )
+        with span(log, "viewpoint_update"):
+            errorcode = self.mp.video_update_viewpoint(
+                p_viewpoint=viewpoint, b_absolute=True
+            )
         if errorcode != 0:
             log.error("Error setting viewpoint")
         self.updatedviewpoint.emit(
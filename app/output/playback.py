@@ -6,6 +6,7 @@ from PyQt5.QtWidgets import QAction, QActionGroup, QSlider
 from app import config
 from app.gui import icons
 from app.playlist.model import MediaItem
+from app.utils.logs import span
 
 log = logging.getLogger(__name__)
 
@@ -35,6 +36,14 @@ class LoopModeManager(QObject):
     def get_mode(self):
         return self.option_names[0]
 
+    def set_mode(self, option_name: str):
+        if option_name not in self.option_names:
+            raise ValueError(f"Unknown loop mode '{option_name}'")
+        while self.option_names[0] != option_name:
+            self.rotate_list(self.option_names, 1)
+        self.playbackmodechanged.emit(option_name)
+        config.state.loop_mode = option_name
+
 
 class PlaybackModeAction(QAction):
     def __init__(self, parent, loop_mode_mngr):
@@ -220,14 +229,16 @@ class FrameResolutionTimeSlider(QSlider):
         self.mouse_down = True
         self.mp.positionchanged.disconnect()
         as_proportion, as_slider_val = self.get_mouse_pos(e)
-        self.mp.set_position(as_proportion)
+        with span(log, "seek", source="slider", position=as_proportion):
+            self.mp.set_position(as_proportion)
         super().setValue(int(as_slider_val))
         self.mp_pos = as_proportion
 
     def mouseMoveEvent(self, e):
         e.accept()
         as_proportion, as_slider_val = self.get_mouse_pos(e)
-        self.mp.set_position(as_proportion)
+        with span(log, "seek", source="slider", position=as_proportion):
+            self.mp.set_position(as_proportion)
         self.mp_pos = as_proportion
         super().setValue(int(as_slider_val))
 
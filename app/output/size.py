@@ -1,19 +1,27 @@
 import logging
 
-from PyQt5.QtCore import QObject, QSize, Qt, pyqtSignal, pyqtSlot
+from PyQt5.QtCore import QObject, QSize, Qt, QTimer, pyqtSignal, pyqtSlot
 from PyQt5.QtWidgets import QAction, QActionGroup, QMenu, QToolButton
 
 from app import config
 from app.base.popup import PopupMenuAction
 from app.gui import icons
+from app.utils.logs import span
 
 log = logging.getLogger(__name__)
 
 
 class FrameSizeManager(QObject):
+    """Resize the main window to fit the media frame.
+
+    Resize requests are debounced, so that a burst of them (zoom steps, media changes
+    and the window being shown) settles into one resize and one viewpoint redraw.
+    """
+
     mediaframeresized = pyqtSignal(float)
     default_size = 600, 360
     default_scale = 1
+    resize_delay = 50  # ms
 
     def __init__(self, main_win, viewpoint_mngr, listplayer):
         super().__init__()
@@ -21,6 +29,11 @@ class FrameSizeManager(QObject):
         self._main_win = main_win
         self.listplayer = listplayer
         self.listplayer.mediachanged.connect(self.on_mediachanged)
+        self._pending = {}
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.resize_delay)
+        self._resize_timer.timeout.connect(self._apply_frame_size)
 
     def on_mediachanged(self, media_item):
         if config.state.auto_resize:
@@ -32,13 +45,24 @@ class FrameSizeManager(QObject):
         self.update_frame_size(scale=scale)
 
     def update_frame_size(self, width=None, height=None, scale=None):
-        """If media arg is None, current media_player media is used"""
+        """Schedule a resize. Values not given here or by a pending request are taken
+        from the current media when the resize is applied.
+        """
+        for key, value in (("width", width), ("height", height), ("scale", scale)):
+            if value:
+                self._pending[key] = value
+        self._resize_timer.start()  # Restarting postpones until requests settle
+
+    def _apply_frame_size(self):
+        pending, self._pending = self._pending, {}
+        width, height = pending.get("width"), pending.get("height")
         if not height or not width:
             _width, _height = self.get_media_size()
             width = width if width else _width
             height = height if height else _height
-        scale = scale if scale else self.get_media_scale()
-        self._main_win.resize_to_media(width, height, scale)
+        scale = pending.get("scale") or self.get_media_scale()
+        with span(log, "resize", width=width, height=height, scale=scale):
+            self._main_win.resize_to_media(width, height, scale)
         self.mediaframeresized.emit(scale)  # TODO
         self.viewpoint_mngr.trigger_redraw()
 
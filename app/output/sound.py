@@ -50,7 +50,6 @@ class VolumeSlider(QSlider):
     def __init__(self, parent, vol_mngr):
         super().__init__(parent=parent)
         self.vol_mngr = vol_mngr
-        self.vol_mngr.set_volume(100)
 
         self.setToolTip("Volume")
         self.setMinimum(0)
@@ -98,14 +97,22 @@ class VolumePopupAction(QAction):
     def __init__(self, parent, vol_mngr: VolumeManager):
         super().__init__(text="Volume")
         self.vol_mngr = vol_mngr
+        self.popup_parent = parent
         self.icons = icons.get("volume_button")
-        self.vol_widget = VolumePopupWidget(parent=parent, vol_mngr=self.vol_mngr)
+        self.vol_widget = None
 
         self.update_icon(config.state.volume)  # type: ignore
 
-        self.triggered.connect(self.vol_widget.popup)
+        self.triggered.connect(self.popup)
         self.vol_mngr.volumechanged.connect(self.update_icon)
 
+    def popup(self):
+        if not self.vol_widget:
+            self.vol_widget = VolumePopupWidget(
+                parent=self.popup_parent, vol_mngr=self.vol_mngr
+            )
+        self.vol_widget.popup()
+
     def update_icon(self, vol_val):
         vol_max = 100
         low_max = vol_max / 3
@@ -0,0 +1,191 @@
+import logging
+import os
+import sys
+import time
+from typing import List, NamedTuple, Optional
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+log = logging.getLogger(__name__)
+
+NETWORK_FILESYSTEMS = {
+    "9p",
+    "afpfs",
+    "cifs",
+    "davfs",
+    "fuse.davfs2",
+    "fuse.sshfs",
+    "ncpfs",
+    "nfs",
+    "nfs4",
+    "smb3",
+    "smbfs",
+    "sshfs",
+}
+
+HIGH_BITRATE = 50_000_000  # bits/s, e.g. 8K/60 equirectangular
+
+
+class CachingOptions(NamedTuple):
+    file_caching_ms: int
+    network_caching_ms: int
+    prefetch_buffer_kib: int
+    prefetch_read_size: int  # bytes
+
+    def media_options(self) -> List[str]:
+        return [
+            f":file-caching={self.file_caching_ms}",
+            f":network-caching={self.network_caching_ms}",
+            f":prefetch-buffer-size={self.prefetch_buffer_kib}",
+            f":prefetch-read-size={self.prefetch_read_size}",
+        ]
+
+
+def _linux_filesystem_type(path: str) -> Optional[str]:
+    try:
+        with open("/proc/mounts") as mounts:
+            entries = [line.split()[1:3] for line in mounts]
+    except OSError:
+        return None
+    path = os.path.realpath(path)
+    best_mount, best_type = "", None
+    for mount_point, fs_type in entries:
+        mount_point = mount_point.replace("\\040", " ")
+        if os.path.commonpath([path, mount_point]) == mount_point:
+            if len(mount_point) > len(best_mount):
+                best_mount, best_type = mount_point, fs_type
+    return best_type
+
+
+def _windows_is_remote(path: str) -> bool:
+    import ctypes
+
+    drive = os.path.splitdrive(os.path.abspath(path))[0]
+    if drive.startswith("\\\\"):
+        return True
+    DRIVE_REMOTE = 4
+    return ctypes.windll.kernel32.GetDriveTypeW(f"{drive}\\") == DRIVE_REMOTE
+
+
+def storage_type(path: str) -> str:
+    """Return 'stream' for urls, 'network' for network shares, otherwise 'local'"""
+    if "://" in path and not path.startswith("file://"):
+        return "stream"
+    if sys.platform.startswith("linux"):
+        fs_type = _linux_filesystem_type(path)
+        is_remote = fs_type in NETWORK_FILESYSTEMS
+    elif sys.platform == "win32":
+        is_remote = _windows_is_remote(path)
+    else:
+        is_remote = False
+    return "network" if is_remote else "local"
+
+
+def probe_bitrate(probe: dict) -> Optional[int]:
+    """Overall bitrate in bits/s from an ffprobe result"""
+    probe_format = probe.get("format", {})
+    try:
+        return int(probe_format["bit_rate"])
+    except (KeyError, ValueError):
+        pass
+    try:
+        return int(int(probe_format["size"]) * 8 / float(probe_format["duration"]))
+    except (KeyError, ValueError, ZeroDivisionError):
+        return None
+
+
+def caching_options(bitrate: Optional[int], storage: str) -> CachingOptions:
+    """Size caches to hold a few seconds of the media's data.
+
+    Network storage gets a deeper cache and larger reads to ride out latency, and
+    high bitrate media gets a larger cache wherever it is stored.
+    """
+    high_bitrate = bool(bitrate) and bitrate >= HIGH_BITRATE
+    if storage == "local":
+        caching_ms, readahead_s = (1000, 2) if not high_bitrate else (2000, 4)
+        read_size = 16384 if not high_bitrate else 262144
+    else:
+        caching_ms, readahead_s = (3000, 8) if not high_bitrate else (5000, 12)
+        read_size = 1048576
+    buffer_kib = int((bitrate or 0) / 8 * readahead_s / 1024)
+    return CachingOptions(
+        file_caching_ms=caching_ms,
+        network_caching_ms=caching_ms,
+        prefetch_buffer_kib=max(16384, min(buffer_kib, 1048576)),
+        prefetch_read_size=read_size,
+    )
+
+
+def media_options(media_item) -> List[str]:
+    """libvlc media options for a playlist item"""
+    bitrate = probe_bitrate(media_item.probe())
+    storage = storage_type(media_item.path())
+    options = caching_options(bitrate, storage)
+    log.debug(
+        "CACHING OPTIONS path=%s bitrate=%s storage=%s options=%s",
+        media_item.path(),
+        bitrate,
+        storage,
+        options,
+    )
+    return options.media_options()
+
+
+class BufferingStatistics:
+    def __init__(self):
+        self.startup_ms: Optional[float] = None
+        self.rebuffer_count = 0
+        self.rebuffer_ms = 0.0
+        self.min_cache = 100.0
+
+    def as_dict(self) -> dict:
+        return {
+            "startup_ms": round(self.startup_ms or 0),
+            "rebuffer_count": self.rebuffer_count,
+            "rebuffer_ms": round(self.rebuffer_ms),
+            "min_cache": round(self.min_cache),
+        }
+
+
+class BufferingMonitor(QObject):
+    """Track startup buffering and rebuffering stalls for the current media"""
+
+    statisticschanged = pyqtSignal(dict)
+
+    def __init__(self, listplayer, media_player):
+        super().__init__()
+        self.lp = listplayer
+        self.mp = media_player
+        self.stats = BufferingStatistics()
+        self._loaded_at = time.monotonic()
+        self._stall_start: Optional[float] = None
+        self.mp.buffering.connect(self.on_buffering)
+        self.lp.mediachanged.connect(self.on_mediachanged)
+
+    def on_mediachanged(self, media_item):
+        if self.stats.startup_ms is not None:
+            log.info(f"BUFFERING STATS {self.stats.as_dict()}")
+        self.stats = BufferingStatistics()
+        self._loaded_at = time.monotonic()
+        self._stall_start = None
+
+    def on_buffering(self, e):
+        self.update(e.value)
+
+    def update(self, cache: float):
+        now = time.monotonic()
+        if self.stats.startup_ms is not None:
+            self.stats.min_cache = min(self.stats.min_cache, cache)
+        if cache < 100:
+            if self._stall_start is None and self.stats.startup_ms is not None:
+                self._stall_start = now
+                self.stats.rebuffer_count += 1
+            return
+        if self.stats.startup_ms is None:
+            self.stats.startup_ms = (now - self._loaded_at) * 1000
+        elif self._stall_start is not None:
+            self.stats.rebuffer_ms += (now - self._stall_start) * 1000
+            self._stall_start = None
+        else:
+            return
+        self.statisticschanged.emit(self.stats.as_dict())
@@ -0,0 +1,182 @@
+import logging
+import math
+import threading
+from fractions import Fraction
+from typing import Dict, List, Optional
+
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, Qt, pyqtSignal, pyqtSlot
+
+from app import config
+from app.playlist.caching import probe_bitrate
+
+log = logging.getLogger(__name__)
+
+DERIVED_COLUMNS = ("duration", "resolution", "fps", "bitrate", "codec", "projection")
+
+
+def _video_stream(probe: dict) -> Optional[dict]:
+    return next((s for s in probe["streams"] if s["codec_type"] == "video"), None)
+
+
+def format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(round(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+def format_bitrate(bitrate: int) -> str:
+    if bitrate >= 1_000_000:
+        return f"{bitrate / 1_000_000:.1f} Mb/s"
+    return f"{bitrate / 1000:.0f} kb/s"
+
+
+def derived_fields(probe: dict) -> Dict[str, str]:
+    """Readable values for the derived playlist columns of an ffprobe result"""
+    fields = {}
+    stream = _video_stream(probe) or {}
+    duration = float(probe["format"].get("duration") or stream.get("duration") or 0)
+    if duration and math.isfinite(duration):  # Live streams report 'inf'
+        fields["duration"] = format_duration(duration)
+    if stream.get("width") and stream.get("height"):
+        fields["resolution"] = f"{stream['width']}x{stream['height']}"
+    try:
+        fps = Fraction(stream["avg_frame_rate"])
+    except (KeyError, ValueError, ZeroDivisionError):
+        fps = 0
+    if fps:
+        fields["fps"] = f"{float(fps):.2f}".rstrip("0").rstrip(".")
+    bitrate = probe_bitrate(probe)
+    if bitrate:
+        fields["bitrate"] = format_bitrate(bitrate)
+    if stream.get("codec_name"):
+        fields["codec"] = stream["codec_name"].upper()
+    if stream:
+        # Any side data marks the media as spherical, as in MediaItem.is_spherical
+        side_data = stream.get("side_data_list") or []
+        projection = next(
+            (d["projection"] for d in side_data if "projection" in d),
+            "spherical" if side_data else "flat",
+        )
+        fields["projection"] = projection.capitalize()
+    return fields
+
+
+def _row_ranges(rows: List[int]):
+    """Contiguous (first, last) ranges of `rows`"""
+    rows = sorted(set(rows))
+    first = last = rows[0]
+    for row in rows[1:]:
+        if row != last + 1:
+            yield first, last
+            first = row
+        last = row
+    yield first, last
+
+
+class MetadataEnricher(QObject):
+    """Compute derived columns for playlist items on a worker thread.
+
+    Inserted rows are queued for a worker thread, which exits once the queue is
+    empty. Results are delivered to the Qt thread in batches, with a single wake-up
+    posted until the batch is taken. Each batch is stored with the model's signals
+    blocked, then announced with one 'dataChanged' per contiguous range of rows, so
+    the view fills in progressively without repainting per item.
+    """
+
+    _wake = pyqtSignal()
+
+    def __init__(self, model):
+        super().__init__(model)
+        self.model = model
+        self.ranges_emitted = 0
+
+        self._lock = threading.Lock()
+        self._requests = []
+        self._results = []
+        self._thread = None
+        self._wake_pending = False
+        self._wake.connect(self._deliver, Qt.QueuedConnection)
+        self.model.rowsInserted.connect(self.on_rowsInserted)
+
+    def on_rowsInserted(self, parent, first, last):
+        self.enrich([self.model.item(row) for row in range(first, last + 1)])
+
+    def enrich(self, items):
+        items = [item for item in items if hasattr(item, "probe")]
+        requests = [(item, item.path(), item.probe()) for item in items]
+        if not requests:
+            return
+        with self._lock:
+            self._requests.extend(requests)
+            if self._thread is None:
+                self._start_worker()
+
+    def _start_worker(self):
+        """Call with the lock held"""
+        self._thread = threading.Thread(
+            target=self._work, name="MetadataEnricher", daemon=True
+        )
+        self._thread.start()
+
+    def _work(self):
+        """Runs on the worker thread"""
+        try:
+            self._work_until_idle()
+        finally:
+            with self._lock:
+                self._thread = None
+                # Requests queued after a failure still get a worker
+                if self._requests:
+                    self._start_worker()
+
+    def _work_until_idle(self):
+        while True:
+            with self._lock:
+                requests, self._requests = self._requests, []
+                if not requests:
+                    return
+            results = []
+            for item, path, probe in requests:
+                try:
+                    results.append((item, derived_fields(probe)))
+                except Exception:
+                    log.exception("Could not enrich media path=%s", path)
+            with self._lock:
+                self._results.extend(results)
+                if self._wake_pending:
+                    continue
+                self._wake_pending = True
+            self._wake.emit()
+
+    @pyqtSlot()
+    def _deliver(self):
+        with self._lock:
+            results, self._results = self._results, []
+            self._wake_pending = False
+        rows = []
+        blocked = self.model.blockSignals(True)
+        try:
+            for item, fields in results:
+                if sip.isdeleted(item) or item.model() is not self.model:
+                    continue
+                item.setData(fields, item.DerivedRole)
+                rows.append(item.row())
+        finally:
+            self.model.blockSignals(blocked)
+        columns = [
+            column
+            for column, key in enumerate(config.state.meta_tags)
+            if key in DERIVED_COLUMNS
+        ]
+        if not rows or not columns:
+            return
+        for first, last in _row_ranges(rows):
+            self.model.dataChanged.emit(
+                self.model.index(first, columns[0]),
+                self.model.index(last, columns[-1]),
+                [Qt.DisplayRole],
+            )
+            self.ranges_emitted += 1
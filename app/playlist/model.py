@@ -6,7 +6,9 @@ from PyQt5.QtCore import QModelIndex, Qt, pyqtSignal
 from PyQt5.QtGui import QStandardItem, QStandardItemModel
 
 from app import config
+from app.playlist.enrich import DERIVED_COLUMNS, MetadataEnricher
 from app.utils import fraction_string_to_float
+from app.utils.logs import span
 
 log = logging.getLogger(__name__)
 
@@ -16,6 +18,7 @@ class MediaItem(QStandardItem):
     PathRole = Qt.UserRole + 1
     ProbeRole = Qt.UserRole + 3
     SphericalRole = Qt.UserRole + 4
+    DerivedRole = Qt.UserRole + 5  # Derived column values, set by MetadataEnricher
 
     def __str__(self):
         return self.title()
@@ -23,7 +26,8 @@ class MediaItem(QStandardItem):
     def __init__(self, path: str):
         super().__init__()
         # Check probe values
-        probe = ffmpeg_probe(path)
+        with span(log, "probe", path=path):
+            probe = ffmpeg_probe(path)
         try:
             title = probe["format"]["tags"]["title"]
         except KeyError:
@@ -82,14 +86,18 @@ class PlaylistModel(QStandardItemModel):
 
     def __init__(self, parent=None):
         super().__init__(0, len(config.state.meta_tags), parent=parent)
+        self.enricher = MetadataEnricher(self)
 
     def data(self, index: QModelIndex, role: Qt.ItemDataRole):
         if not index.isValid():
             return None
         if role == Qt.DisplayRole:
             media_item = self.item(index.row(), 0)
-            probe = media_item.data(MediaItem.ProbeRole)
             key = config.state.meta_tags[index.column()]  # type: ignore
+            if key in DERIVED_COLUMNS:
+                derived = media_item.data(MediaItem.DerivedRole)
+                return derived.get(key) if derived else None
+            probe = media_item.data(MediaItem.ProbeRole)
             return probe["format"]["tags"].get(key, None)
         elif role == (Qt.ToolTipRole):
             return config.state.meta_tags[index.column()]  # type: ignore
@@ -3,7 +3,9 @@ import logging
 from PyQt5.QtCore import QModelIndex, QObject, Qt, QTimer, pyqtSignal, pyqtSlot
 
 from app import config
+from app.playlist import caching
 from app.playlist.model import MediaItem
+from app.utils.logs import span
 
 log = logging.getLogger(__name__)
 
@@ -99,12 +101,16 @@ class _ListPlayer(QObject):
         else:
             self._item = index.model().itemFromIndex(index)
             path = self._item.path()
-            is_spherical = self._item.is_spherical()
-            self.viewpoint_mngr.set_redraw_every_frame(is_spherical)
-            self.mp.stop()
-            self.mp.set_mrl(path)
-            self.mediachanged.emit(self._item)
-            self.mp.play()
+            with span(log, "load_media", path=path):
+                is_spherical = self._item.is_spherical()
+                self.viewpoint_mngr.set_redraw_every_frame(is_spherical)
+                self.mp.stop()
+                if config.state.media_caching_auto:
+                    self.mp.set_mrl(path, *caching.media_options(self._item))
+                else:
+                    self.mp.set_mrl(path)
+                self.mediachanged.emit(self._item)
+                self.mp.play()
             return True
 
     def unload_media(self, items: list):
@@ -150,27 +156,37 @@ class MediaListPlayer(_ListPlayer):
     newframe = pyqtSignal()
     slider_precision = 100
 
-    def __init__(self, viewpoint_mngr, loop_mode_mngr, media_player):
+    def __init__(
+        self, viewpoint_mngr, loop_mode_mngr, media_player, frame_callbacks=None
+    ):
         super().__init__(
             viewpoint_mngr=viewpoint_mngr,
             loop_mode_mngr=loop_mode_mngr,
             media_player=media_player,
         )
+        self.frame_callbacks = frame_callbacks
         self.timer = QTimer()
         self.timer.setTimerType(Qt.CoarseTimer)
         self.timer.timeout.connect(self.on_timeout)
 
-        self.mp.playing.connect(self.timer.start)
-        self.mp.stopped.connect(self.timer.stop)
-        self.mp.paused.connect(self.timer.stop)
+        if self.frame_callbacks:
+            # Frames presented by the decoder drive 'newframe' instead of the timer
+            self.frame_callbacks.framedisplayed.connect(self.on_timeout)
+        else:
+            self.mp.playing.connect(self.timer.start)
+            self.mp.stopped.connect(self.timer.stop)
+            self.mp.paused.connect(self.timer.stop)
 
         self.mediachanged.connect(self.on_mediachanged)
 
-    def on_timeout(self):
+    def on_timeout(self, *args):
         self.newframe.emit()
 
     @pyqtSlot(MediaItem)
     def on_mediachanged(self, media_item: MediaItem):
+        if self.frame_callbacks:
+            self.frame_callbacks.set_format(*media_item.size())
+            return
         media_info = media_item.info()
         media_fps = media_info["avg_frame_rate"]
         self.timer.setInterval(int(media_fps))
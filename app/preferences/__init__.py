@@ -5,13 +5,6 @@ from app import base, config, gui
 from .about import AboutTextLabel
 
 
-class EnableHardwareAccelerationCheckbox(QtWidgets.QCheckBox):
-    def __init__(self, parent):
-        super().__init__(
-            text="Enable hardware acceleration (Requires restart)", parent=parent
-        )
-
-
 class PlayerPreferencesWindow(base.modal.BaseModalSettingsDialog):
     def __init__(self, main_win, media_player):
         super().__init__(title="Media Player Preferences", main_win=main_win)
@@ -27,11 +20,33 @@ class PlayerPreferencesWindow(base.modal.BaseModalSettingsDialog):
         self.vlc_options_group.setLayout(self.vlc_options_lo)
         widget.layout().addWidget(self.vlc_options_group)
 
-        self.hw_accel_checkbox = QtWidgets.QCheckBox(
-            text="Enable hardware acceleration (Requires restart)", parent=widget
+        self.decode_options_lo = QtWidgets.QFormLayout()
+        self.vlc_options_lo.addLayout(self.decode_options_lo)
+
+        self.decode_profile_combo = QtWidgets.QComboBox(parent=widget)
+        self.decode_profile_combo.addItems(config.options.decode_profile)
+        self.decode_profile_combo.setCurrentText(config.state.decode_profile)
+        self.decode_options_lo.addRow("Decoding", self.decode_profile_combo)
+
+        self.decode_threads_spinbox = QtWidgets.QSpinBox(parent=widget)
+        self.decode_threads_spinbox.setRange(
+            config.schema["vlc_avcodec_threads"]["min"],
+            config.schema["vlc_avcodec_threads"]["max"],
+        )
+        self.decode_threads_spinbox.setSpecialValueText("Auto")
+        self.decode_threads_spinbox.setValue(config.state.vlc_avcodec_threads)
+        self.decode_options_lo.addRow("Decoding threads", self.decode_threads_spinbox)
+
+        self.frame_clock_combo = QtWidgets.QComboBox(parent=widget)
+        self.frame_clock_combo.addItems(config.options.frame_clock)
+        self.frame_clock_combo.setCurrentText(config.state.frame_clock)
+        self.decode_options_lo.addRow("Frame clock", self.frame_clock_combo)
+
+        self.vlc_options_lo.addWidget(
+            QtWidgets.QLabel(
+                "Decoding and frame clock changes require restart", parent=widget
+            )
         )
-        self.hw_accel_checkbox.setChecked(config.state.hw_accel)
-        self.vlc_options_lo.addWidget(self.hw_accel_checkbox)
 
         # About
         self.about_group = QtWidgets.QGroupBox(title="About", parent=widget)
@@ -44,7 +59,9 @@ class PlayerPreferencesWindow(base.modal.BaseModalSettingsDialog):
         return widget
 
     def save(self):
-        config.state.hw_accel = True if self.hw_accel_checkbox.isChecked() else False
+        config.state.decode_profile = self.decode_profile_combo.currentText()
+        config.state.vlc_avcodec_threads = self.decode_threads_spinbox.value()
+        config.state.frame_clock = self.frame_clock_combo.currentText()
 
 
 class OpenMediaPlayerPreferencesWindowAction(
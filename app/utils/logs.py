@@ -0,0 +1,71 @@
+import json
+import logging
+import logging.handlers
+import queue
+import time
+from contextlib import contextmanager
+from typing import List
+
+log = logging.getLogger(__name__)
+
+# Attributes of every LogRecord. Anything else on a record was passed as `extra`.
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as JSON lines, including fields passed with `extra`"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def start_queue_logging(
+    handlers: List[logging.Handler], logger: logging.Logger = None
+) -> logging.handlers.QueueListener:
+    """Route records for `logger` through a queue to `handlers` on a listener thread.
+
+    Callers only pay for putting the record on the queue, so writing logs never
+    blocks the GUI thread. Stop the returned listener to flush before exiting.
+    """
+    logger = logger or logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    return listener
+
+
+@contextmanager
+def span(logger: logging.Logger, name: str, **fields):
+    """Log the duration of the block as a 'SPAN' debug record.
+
+    Nothing is timed or formatted unless debug logging is enabled for `logger`.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration_ms = (time.perf_counter() - start) * 1000
+        logger.debug(
+            "SPAN %s duration_ms=%.2f",
+            name,
+            duration_ms,
+            extra={"span": name, "duration_ms": round(duration_ms, 3), **fields},
+        )
@@ -0,0 +1,55 @@
+import logging
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+log = logging.getLogger(__name__)
+
+
+class StartupProfiler:
+    """Record the duration of named startup phases.
+
+    Phases may be nested. Timing is skipped entirely until `enable()` is called, so
+    that instrumented code costs next to nothing in normal runs.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.records: List[Tuple[int, str, float, float]] = []
+        self._start = time.perf_counter()
+        self._depth = 0
+
+    def enable(self):
+        self.enabled = True
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            end = time.perf_counter()
+            self.records.append((self._depth, name, start - self._start, end - start))
+
+    def mark(self, name: str):
+        """Record an instant, e.g. the first frame being shown"""
+        if self.enabled:
+            now = time.perf_counter() - self._start
+            self.records.append((self._depth, name, now, 0.0))
+
+    def report(self) -> str:
+        lines = [f"{'start ms':>10} {'duration ms':>12}  phase"]
+        for depth, name, start, duration in sorted(self.records, key=lambda r: r[2]):
+            indent = "  " * depth
+            timings = f"{start * 1000:10.1f} {duration * 1000:12.1f}"
+            lines.append(f"{timings}  {indent}{name}")
+        return "\n".join(lines)
+
+
+startup_profiler = StartupProfiler()
@@ -0,0 +1,120 @@
+import logging
+import sys
+import threading
+import time
+import traceback
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from PyQt5.QtCore import QObject, Qt, QTimer, pyqtSlot
+
+log = logging.getLogger(__name__)
+
+
+def _executing_module(frame, package: str) -> Optional[str]:
+    """Innermost `package` module and function on the stack, as 'module:function'"""
+    while frame is not None:
+        name = frame.f_globals.get("__name__", "")
+        if name == package or name.startswith(f"{package}."):
+            return f"{name}:{frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+class StallWatchdog(QObject):
+    """Detect stalls of the Qt event loop and report what the GUI thread was doing.
+
+    A timer on the GUI thread beats every `interval` ms. A watchdog thread checks the
+    beat and, once it is `threshold_ms` late, captures the GUI thread's Python stack
+    and writes a stall report to `report_dir`. Only one report is written per stall.
+
+    A stall inside a C call that holds the GIL also blocks the watchdog thread, so its
+    report is written late but still shows the stack of the call.
+    """
+
+    def __init__(
+        self,
+        report_dir: str,
+        threshold_ms: int = 1000,
+        interval: int = 100,
+        package: str = "app",
+    ):
+        super().__init__()
+        self.report_dir = Path(report_dir)
+        self.threshold_ms = threshold_ms
+        self.package = package
+        self.max_lag_ms = 0.0
+        self.stalls = 0
+        self.reports = []
+
+        self._beat = time.monotonic()
+        self._reported_beat = None
+        self._main_thread_id = threading.main_thread().ident
+        self._stopped = threading.Event()
+        self._thread = None
+
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self._on_beat)
+
+    def start(self):
+        self._beat = time.monotonic()
+        self._stopped.clear()
+        self.timer.start()
+        self._thread = threading.Thread(
+            target=self._watch, name="StallWatchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self.timer.stop()
+        self._stopped.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    @pyqtSlot()
+    def _on_beat(self):
+        now = time.monotonic()
+        lag_ms = (now - self._beat) * 1000 - self.timer.interval()
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+        if lag_ms >= self.threshold_ms:
+            self.stalls += 1
+            log.warning("EVENT LOOP STALL duration_ms=%.0f", lag_ms)
+        self._beat = now
+
+    def _watch(self):
+        poll_s = self.threshold_ms / 4000
+        while not self._stopped.wait(poll_s):
+            beat = self._beat
+            late_ms = (time.monotonic() - beat) * 1000 - self.timer.interval()
+            if late_ms >= self.threshold_ms and beat != self._reported_beat:
+                self._reported_beat = beat
+                self._report(late_ms)
+
+    def _report(self, late_ms: float):
+        frame = sys._current_frames().get(self._main_thread_id)
+        if frame is None:
+            return
+        stack = "".join(traceback.format_stack(frame))
+        module = _executing_module(frame, self.package) or "unknown"
+        del frame
+        now = datetime.now()
+        text = (
+            f"Event loop stalled for at least {late_ms:.0f} ms\n"
+            f"time: {now.isoformat(timespec='milliseconds')}\n"
+            f"threshold_ms: {self.threshold_ms}\n"
+            f"module: {module}\n\n"
+            f"GUI thread stack (most recent call last):\n{stack}"
+        )
+        path = self.report_dir / f"stall-{now:%Y%m%d-%H%M%S-%f}.txt"
+        try:
+            self.report_dir.mkdir(parents=True, exist_ok=True)
+            path.write_text(text)
+        except OSError as e:
+            log.error("Could not write stall report %s: %s", path, e)
+            return
+        self.reports.append(path)
+        log.warning("EVENT LOOP STALL module=%s report=%s", module, path)
@@ -3,7 +3,7 @@ import sys
 
 import vlc
 
-from . import _facades
+from . import _benchmark, _facades, _frames, _instance, _signals
 
 log = logging.getLogger(__name__)
 
@@ -16,5 +16,20 @@ for key, val in vlc.__dict__.items():
     setattr(__module, key, val)
 
 
+DECODE_PROFILES = _instance.DECODE_PROFILES
+InstanceOptions = _instance.InstanceOptions
+create_instance = _instance.create_instance
+get_instance = _instance.get_instance
+
+DecodeBenchmarkResult = _benchmark.DecodeBenchmarkResult
+benchmark_decoding = _benchmark.benchmark_decoding
+recommend_decode_profile = _benchmark.recommend_decode_profile
+
+EventRecord = _signals.EventRecord
+
+FrameBufferRing = _frames.FrameBufferRing
+FrameCallbacks = _frames.FrameCallbacks
+VideoFrame = _frames.VideoFrame
+
 MediaPlayer = _facades.QtVLCMediaPlayer
 Media = _facades.QtVLCMedia
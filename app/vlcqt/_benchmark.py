@@ -0,0 +1,141 @@
+import logging
+import time
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+import vlc
+
+from ._frames import FrameCallbacks
+from ._instance import DECODE_PROFILES, InstanceOptions
+
+log = logging.getLogger(__name__)
+
+# Decode without presenting anything, so that runs are comparable on any host
+HEADLESS_ARGS = ["--no-audio", "--vout=vdummy", "--no-video-title-show"]
+
+# Render through video callbacks into memory instead, so no display is needed either
+OFFSCREEN_ARGS = ["--no-audio", "--no-video-title-show"]
+
+
+class DecodeBenchmarkResult(NamedTuple):
+    profile: str
+    clip: str
+    seconds: float
+    decoded_frames: int
+    displayed_frames: int
+    dropped_frames: int
+    cpu_percent: float
+    error: Optional[str] = None
+    rendered_frames: Optional[int] = None  # frames rendered offscreen, if enabled
+
+    @property
+    def fps(self) -> float:
+        return self.decoded_frames / self.seconds if self.seconds else 0.0
+
+
+def benchmark_clip(
+    profile: str,
+    path: str,
+    duration: float = 5.0,
+    threads: int = 0,
+    render_size: Optional[Tuple[int, int]] = None,
+) -> DecodeBenchmarkResult:
+    """Play `path` headless with decode `profile` for up to `duration` seconds.
+
+    With a `render_size`, frames are also scaled and rendered into memory buffers.
+    """
+    options = InstanceOptions(decode_profile=profile, avcodec_threads=threads)
+    instance_args = OFFSCREEN_ARGS if render_size else HEADLESS_ARGS
+    instance = vlc.Instance(options.args() + instance_args)
+    if instance is None:
+        error = "Could not create libvlc instance"
+        return DecodeBenchmarkResult(profile, path, 0, 0, 0, 0, 0, error)
+    media = instance.media_new(path)
+    player = instance.media_player_new()
+    player.set_media(media)
+    frames = None
+    if render_size:
+        frames = FrameCallbacks(media_player=player)
+        frames.set_format(*render_size)
+    stats = vlc.MediaStats()
+    error = None
+    try:
+        player.play()
+        deadline = time.monotonic() + 5
+        while player.get_state() not in (vlc.State.Playing, vlc.State.Error):
+            if time.monotonic() > deadline:
+                error = "Timed out opening clip"
+                break
+            time.sleep(0.01)
+
+        start_wall, start_cpu = time.monotonic(), time.process_time()
+        while not error and time.monotonic() - start_wall < duration:
+            state = player.get_state()
+            if state == vlc.State.Error:
+                error = "Playback error"
+            elif state == vlc.State.Ended:
+                break
+            time.sleep(0.05)
+        seconds = time.monotonic() - start_wall
+        cpu_seconds = time.process_time() - start_cpu
+        media.get_stats(stats)
+    finally:
+        player.stop()
+        player.release()
+        media.release()
+        instance.release()
+
+    return DecodeBenchmarkResult(
+        profile=profile,
+        clip=path,
+        seconds=seconds,
+        decoded_frames=stats.decoded_video,
+        displayed_frames=stats.displayed_pictures,
+        dropped_frames=stats.lost_pictures,
+        cpu_percent=cpu_seconds / seconds * 100 if seconds else 0.0,
+        error=error,
+        rendered_frames=frames.frames_displayed if frames else None,
+    )
+
+
+def benchmark_decoding(
+    paths: Iterable[str],
+    profiles: Iterable[str] = DECODE_PROFILES,
+    duration: float = 5.0,
+    threads: int = 0,
+    render_size: Optional[Tuple[int, int]] = None,
+) -> List[DecodeBenchmarkResult]:
+    paths = list(paths)  # Iterated once per profile
+    results = []
+    for profile in profiles:
+        for path in paths:
+            result = benchmark_clip(
+                profile,
+                path,
+                duration=duration,
+                threads=threads,
+                render_size=render_size,
+            )
+            log.info(f"DECODE BENCHMARK {result}")
+            results.append(result)
+    return results
+
+
+def recommend_decode_profile(results: List[DecodeBenchmarkResult]) -> Optional[str]:
+    """Return the profile that dropped the fewest frames, then used the least CPU.
+
+    Profiles that failed or decoded nothing for any clip are not considered.
+    """
+    totals = {}
+    failed = set()
+    for result in results:
+        if result.error or not result.decoded_frames:
+            failed.add(result.profile)
+            continue
+        dropped, cpu = totals.get(result.profile, (0, 0.0))
+        dropped += result.dropped_frames
+        cpu += result.cpu_percent
+        totals[result.profile] = (dropped, cpu)
+    candidates = {k: v for k, v in totals.items() if k not in failed}
+    if not candidates:
+        return None
+    return min(candidates, key=candidates.get)
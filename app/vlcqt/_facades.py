@@ -1,22 +1,55 @@
 import logging
 import sys
+from typing import Tuple
 
 import vlc
 
-from . import _signals
+from . import _instance, _signals
 
 log = logging.getLogger(__name__)
 
 
-class QtVLCMediaPlayer(_signals.MediaPlayerSignals):
+class _VlcObjectFacade:
+    """Forward unknown attributes to the wrapped libvlc object.
+
+    Methods in `bound_methods` are bound onto the instance on init and any other
+    method is bound on first use, so repeat calls are plain instance attribute
+    lookups instead of a failed lookup followed by `__getattr__`.
+    """
+
     _vlc_obj = None
+    bound_methods: Tuple[str, ...] = ()
 
-    def __init__(self):
-        self._vlc_obj = vlc.MediaPlayer()
-        super().__init__(vlc_media_player=self._vlc_obj)
+    def _bind_methods(self):
+        for name in self.bound_methods:
+            self.__dict__[name] = getattr(self._vlc_obj, name)
 
     def __getattr__(self, attribute):
-        return getattr(self._vlc_obj, attribute)
+        value = getattr(self._vlc_obj, attribute)
+        if callable(value):
+            self.__dict__[attribute] = value
+        return value
+
+
+class QtVLCMediaPlayer(_VlcObjectFacade, _signals.MediaPlayerSignals):
+    _output_wid = None
+
+    # Called per frame or per slider update
+    bound_methods = (
+        "get_length",
+        "get_position",
+        "get_state",
+        "get_time",
+        "is_playing",
+        "set_position",
+        "video_get_size",
+        "video_update_viewpoint",
+    )
+
+    def __init__(self):
+        self._vlc_obj = _instance.get_instance().media_player_new()
+        self._bind_methods()
+        super().__init__(vlc_media_player=self._vlc_obj)
 
     def _set_output_to_widget(self, widget):
         if sys.platform.startswith("linux"):  # for Linux X Server
@@ -29,6 +62,16 @@ class QtVLCMediaPlayer(_signals.MediaPlayerSignals):
             raise EnvironmentError("Could not determine platform")
 
     def set_output_widget(self, widget):
+        """Render into the native window of `widget`, a QWidget or QWindow.
+
+        libvlc only picks up a new window when playback restarts, so media that is
+        playing is reopened and returned to its time. Moving the same window, e.g.
+        into fullscreen, needs no call here.
+        """
+        wid = int(widget.winId())
+        if wid == self._output_wid:
+            return
+        self._output_wid = wid
         state = self.get_state()
         time = self.get_time()
         if state in [vlc.State.Buffering, vlc.State.Playing]:
@@ -54,18 +97,13 @@ class QtVLCMediaPlayer(_signals.MediaPlayerSignals):
             self.pause()
             self.set_time(-1)
         elif state in [vlc.State.Stopped, vlc.State.Error, vlc.State.NothingSpecial]:
-            self.play()
             self._set_output_to_widget(widget=widget)
-            self.stop()
 
 
-class QtVLCMedia(_signals.MediaVlclibSignals):
+class QtVLCMedia(_VlcObjectFacade, _signals.MediaVlclibSignals):
+    bound_methods = ("get_duration", "get_stats")
+
     def __init__(self, mrl, *options):
-        self._vlc_obj = vlc.Media(mrl, *options)
+        self._vlc_obj = _instance.get_instance().media_new(mrl, *options)
+        self._bind_methods()
         super().__init__(vlc_media=self._vlc_obj)
-
-    def __getattr__(self, attribute):
-        try:
-            return getattr(self._vlc_obj, attribute)
-        except Exception as e:
-            raise e
@@ -0,0 +1,194 @@
+import ctypes
+import logging
+import mmap
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, NamedTuple, Optional
+
+import vlc
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, Qt, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QImage
+
+try:
+    import numpy
+except ImportError:  # numpy views are optional
+    numpy = None
+
+log = logging.getLogger(__name__)
+
+
+class VideoFrame(NamedTuple):
+    index: int  # count of frames displayed since the format was set
+    buffer: int  # index of the buffer holding the picture
+    pts_us: int  # monotonic clock when the picture was presented
+    width: int
+    height: int
+    pitch: int
+
+
+class FrameBufferRing:
+    """A ring of anonymous memory maps that libvlc renders pictures into.
+
+    The maps are page aligned and only grow, so changing to a format of the same size
+    or smaller reuses them. QImages and numpy arrays made from a buffer are views of the
+    map rather than copies.
+    """
+
+    def __init__(self, count: int = 3):
+        self.count = count
+        self.capacity = 0
+        self._maps: List[mmap.mmap] = []
+        self._exports: List[ctypes.Array] = []
+
+    def allocate(self, size: int):
+        if size <= self.capacity:
+            return
+        self.release()
+        self._maps = [mmap.mmap(-1, size) for _ in range(self.count)]
+        self._exports = [(ctypes.c_char * size).from_buffer(m) for m in self._maps]
+        self.capacity = size
+
+    def release(self):
+        # Exported views must be dropped before the maps can be closed
+        self._exports = []
+        for m in self._maps:
+            m.close()
+        self._maps = []
+        self.capacity = 0
+
+    def address(self, index: int) -> int:
+        return ctypes.addressof(self._exports[index])
+
+    def image(self, index: int, width: int, height: int, pitch: int) -> QImage:
+        return QImage(
+            sip.voidptr(self.address(index)), width, height, pitch, QImage.Format_RGB32
+        )
+
+    def array(self, index: int, width: int, height: int, pitch: int):
+        """A (height, width, 4) uint8 numpy view of a BGRA buffer"""
+        if numpy is None:
+            raise RuntimeError("numpy is required for array views of frames")
+        rows = numpy.frombuffer(self._maps[index], numpy.uint8, height * pitch)
+        return rows.reshape(height, pitch)[:, : width * 4].reshape(height, width, 4)
+
+
+class FrameCallbacks(QObject):
+    """Render video into memory with libvlc video callbacks and signal each frame as
+    libvlc presents it.
+
+    libvlc draws pictures into a FrameBufferRing of RV32 buffers and calls the display
+    callback at each picture's presentation time, from its own thread. Every frame is
+    counted there, and 'framedisplayed' is delivered to the Qt thread with the latest
+    frame, skipping frames that arrive before the previous one was delivered.
+
+    Read a frame's buffer only inside `pinned()`. libvlc is never given the buffer of
+    the latest frame or of a pinned frame, so a picture is not overwritten while it
+    is painted or uploaded. That needs at least three buffers.
+
+    Setting video callbacks replaces libvlc's native video output, so libvlc's own 360
+    projection and viewpoint are not applied to frames rendered this way.
+    """
+
+    framedisplayed = pyqtSignal(object)
+    _wake = pyqtSignal()
+
+    chroma = "RV32"
+    bytes_per_pixel = 4
+
+    def __init__(self, media_player, buffer_count: int = 3):
+        super().__init__()
+        if buffer_count < 3:
+            raise ValueError("At least 3 frame buffers are needed")
+        self.mp = media_player
+        self.buffers = FrameBufferRing(count=buffer_count)
+        self.width = self.height = self.pitch = 0
+        self.frames_displayed = 0
+        self.latest: Optional[VideoFrame] = None
+        self._lock = threading.Lock()
+        self._next_buffer = 0
+        self._pinned: Optional[int] = None
+        self._pending = False
+        self._wake.connect(self._deliver, Qt.QueuedConnection)
+
+        # libvlc holds raw pointers to these, so they must live as long as the player
+        self._lock_cb = vlc.CallbackDecorators.VideoLockCb(self._on_lock)
+        self._unlock_cb = vlc.CallbackDecorators.VideoUnlockCb(self._on_unlock)
+        self._display_cb = vlc.CallbackDecorators.VideoDisplayCb(self._on_display)
+        self.mp.video_set_callbacks(
+            self._lock_cb, self._unlock_cb, self._display_cb, None
+        )
+
+    def set_format(self, width: int, height: int):
+        """Allocate buffers for `width` x `height` video, before playback starts"""
+        pitch = width * self.bytes_per_pixel
+        with self._lock:
+            self.width, self.height, self.pitch = width, height, pitch
+            self.buffers.allocate(pitch * height)
+            self._next_buffer = 0
+            self.frames_displayed = 0
+            self.latest = None
+        self.mp.video_set_format(self.chroma, width, height, pitch)
+        log.debug(
+            "FRAME CALLBACKS FORMAT %sx%s count=%s", width, height, self.buffers.count
+        )
+
+    @contextmanager
+    def pinned(self):
+        """Yield the latest frame, keeping libvlc out of its buffer until exit"""
+        with self._lock:
+            frame = self.latest
+            self._pinned = frame.buffer if frame else None
+        try:
+            yield frame
+        finally:
+            with self._lock:
+                self._pinned = None
+
+    def image(self, frame: VideoFrame) -> QImage:
+        """A QImage view of the frame's buffer. Only valid while the frame is pinned."""
+        return self.buffers.image(frame.buffer, frame.width, frame.height, frame.pitch)
+
+    def array(self, frame: VideoFrame):
+        """A numpy view of the frame's buffer. Only valid while the frame is pinned."""
+        return self.buffers.array(frame.buffer, frame.width, frame.height, frame.pitch)
+
+    def _on_lock(self, opaque, planes):
+        with self._lock:
+            busy = {self._pinned, self.latest.buffer if self.latest else None}
+            buffer = self._next_buffer
+            while buffer in busy:
+                buffer = (buffer + 1) % self.buffers.count
+            self._next_buffer = (buffer + 1) % self.buffers.count
+            planes[0] = self.buffers.address(buffer)
+        return buffer + 1  # Picture ids are passed back to the callbacks, so not 0
+
+    def _on_unlock(self, opaque, picture, planes):
+        pass
+
+    def _on_display(self, opaque, picture):
+        pts_us = time.monotonic_ns() // 1000
+        with self._lock:
+            frame = VideoFrame(
+                index=self.frames_displayed,
+                buffer=picture - 1,
+                pts_us=pts_us,
+                width=self.width,
+                height=self.height,
+                pitch=self.pitch,
+            )
+            self.frames_displayed += 1
+            self.latest = frame
+            wake = not self._pending
+            self._pending = True
+        if wake:
+            self._wake.emit()
+
+    @pyqtSlot()
+    def _deliver(self):
+        with self._lock:
+            frame = self.latest
+            self._pending = False
+        if frame is not None:
+            self.framedisplayed.emit(frame)
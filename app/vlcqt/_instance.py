@@ -0,0 +1,61 @@
+import logging
+from typing import List, NamedTuple, Optional
+
+import vlc
+
+log = logging.getLogger(__name__)
+
+
+# Decode profile name -> libvlc '--avcodec-hw' decoder
+DECODE_PROFILES = {
+    "auto": "any",
+    "software": "none",
+    "vaapi": "vaapi",
+    "vdpau": "vdpau_avcodec",
+}
+
+
+class InstanceOptions(NamedTuple):
+    """Typed libvlc instance options. 'None' leaves the libvlc default in place."""
+
+    decode_profile: str = "auto"
+    avcodec_threads: Optional[int] = None  # 0 is automatic
+    skip_loop_filter: Optional[int] = None  # 0 (none) to 4 (all frames)
+    file_caching_ms: Optional[int] = None
+    network_caching_ms: Optional[int] = None
+    extra_args: tuple = ()
+
+    def args(self) -> List[str]:
+        args = [f"--avcodec-hw={DECODE_PROFILES[self.decode_profile]}"]
+        if self.avcodec_threads is not None:
+            args.append(f"--avcodec-threads={self.avcodec_threads}")
+        if self.skip_loop_filter is not None:
+            args.append(f"--avcodec-skiploopfilter={self.skip_loop_filter}")
+        if self.file_caching_ms is not None:
+            args.append(f"--file-caching={self.file_caching_ms}")
+        if self.network_caching_ms is not None:
+            args.append(f"--network-caching={self.network_caching_ms}")
+        # Extra args come last so that they take precedence
+        args.extend(self.extra_args)
+        return args
+
+
+_instance: Optional[vlc.Instance] = None
+
+
+def create_instance(options: InstanceOptions = InstanceOptions()) -> vlc.Instance:
+    """Create the libvlc instance shared by all players and media"""
+    global _instance
+    args = options.args()
+    _instance = vlc.Instance(args)
+    if _instance is None:
+        raise RuntimeError(f"Could not create libvlc instance with args {args}")
+    log.info(f"CREATED VLC INSTANCE args={args}")
+    return _instance
+
+
+def get_instance() -> vlc.Instance:
+    """Return the shared libvlc instance, creating a default one if needed"""
+    if _instance is None:
+        return create_instance()
+    return _instance
@@ -1,4 +1,7 @@
 import logging
+import threading
+from collections import Counter
+from typing import Any, Dict, List, NamedTuple, Optional
 
 import vlc
 from PyQt5.QtCore import QObject, Qt, QTimer, pyqtSignal, pyqtSlot
@@ -6,228 +9,171 @@ from PyQt5.QtCore import QObject, Qt, QTimer, pyqtSignal, pyqtSlot
 log = logging.getLogger(__name__)
 
 
-class MediaPlayerVlclibSignals(QObject):
-
-    # audiodevice = pyqtSignal(vlc.Event)
-    audiovolume = pyqtSignal(vlc.Event)
-    # backward = pyqtSignal(vlc.Event)
-    buffering = pyqtSignal(vlc.Event)
-    # chapterchanged = pyqtSignal(vlc.Event)
-    # corked = pyqtSignal(vlc.Event)
-    # esadded = pyqtSignal(vlc.Event)
-    # esdeleted = pyqtSignal(vlc.Event)
-    # esselected = pyqtSignal(vlc.Event)
-    encounterederror = pyqtSignal(vlc.Event)
-    endreached = pyqtSignal(vlc.Event)
-    forward = pyqtSignal(vlc.Event)
-    # lengthchanged = pyqtSignal(vlc.Event)
-    # mediachanged = pyqtSignal(vlc.Event)
-    muted = pyqtSignal(vlc.Event)
-    nothingspecial = pyqtSignal(vlc.Event)
-    opening = pyqtSignal(vlc.Event)
-    pausablechanged = pyqtSignal(vlc.Event)
-    paused = pyqtSignal(vlc.Event)
-    playing = pyqtSignal(vlc.Event)
-    stopped = pyqtSignal(vlc.Event)
-    positionchanged = pyqtSignal(vlc.Event)
-    # scrambledchanged = pyqtSignal(vlc.Event)
-    # seekablechanged = pyqtSignal(vlc.Event)
-    # snapshottaken = pyqtSignal(vlc.Event)
-    stopped = pyqtSignal(vlc.Event)
-    timechanged = pyqtSignal(vlc.Event)
-    titlechanged = pyqtSignal(vlc.Event)
-    uncorked = pyqtSignal(vlc.Event)
-    unmuted = pyqtSignal(vlc.Event)
-    vout = pyqtSignal(vlc.Event)
+class EventRecord(NamedTuple):
+    """Plain copy of a libvlc event, safe to use after the libvlc callback returns"""
 
-    def __init__(self, vlc_media_player):
+    name: str
+    type: int
+    value: Any = None
+
+
+class _LazyEventSignals(QObject):
+    """Bridge libvlc events into Qt signals on the thread that owns this object.
+
+    Subclasses map signal names to libvlc event types in `event_types`. Connecting
+    the first slot to one of those signals attaches the callback, and disconnecting
+    the last slot detaches it, so unobserved events never cross into Python.
+
+    On libvlc's thread each event is copied into an EventRecord and queued under a
+    lock, with a single wake-up posted to the Qt thread until the queue is drained.
+    For signals in `coalesced_events` only the latest record is kept, so a busy GUI
+    thread does not fall behind on stale position and time updates. It takes the
+    place of the newest arrival, so records are always delivered in arrival order and
+    a stale position never follows a later 'stopped'.
+    """
+
+    event_types: dict = {}
+
+    # Signal name -> 'vlc.EventUnion' field holding the event's value
+    value_fields: dict = {}
+
+    coalesced_events: frozenset = frozenset()
+
+    _wake = pyqtSignal()
+
+    def __init__(self, event_manager):
         super().__init__()
+        self._event_manager = event_manager
+        self._attached = set()
+        self.events_received = Counter()
+        self.events_delivered = Counter()
+
+        self._lock = threading.Lock()
+        self._queue: List[Optional[EventRecord]] = []
+        # Coalesced signal name -> index of its pending record in the queue
+        self._latest: Dict[str, int] = {}
+        self._wake_pending = False
+        self._wake.connect(self._deliver, Qt.QueuedConnection)
+
+    def connectNotify(self, signal):
+        name = bytes(signal.name()).decode()
+        if name in self.event_types and name not in self._attached:
+            self._event_manager.event_attach(
+                self.event_types[name], self._on_event, name
+            )
+            self._attached.add(name)
+            log.debug("VLCQT ATTACH name='%s'", name)
+
+    def disconnectNotify(self, signal):
+        name = bytes(signal.name()).decode()
+        if name in self._attached and not self.receivers(getattr(self, name)):
+            self._event_manager.event_detach(self.event_types[name])
+            self._attached.discard(name)
+            log.debug("VLCQT DETACH name='%s'", name)
+
+    def attached_events(self) -> set:
+        return set(self._attached)
+
+    def _on_event(self, e, name):
+        """Runs on libvlc's thread"""
+        field = self.value_fields.get(name)
+        value = getattr(e.u, field) if field else None
+        record = EventRecord(name=name, type=self.event_types[name], value=value)
+        with self._lock:
+            self.events_received[name] += 1
+            if name in self.coalesced_events:
+                index = self._latest.get(name)
+                if index is not None:
+                    self._queue[index] = None
+                self._latest[name] = len(self._queue)
+            self._queue.append(record)
+            if self._wake_pending:
+                return
+            self._wake_pending = True
+        self._wake.emit()
+
+    @pyqtSlot()
+    def _deliver(self):
+        with self._lock:
+            records = self._queue
+            self._queue, self._latest = [], {}
+            self._wake_pending = False
+        for record in records:
+            if record is None:  # Superseded by a later coalesced record
+                continue
+            signal = getattr(self, record.name)
+            if self.receivers(signal):
+                self.events_delivered[record.name] += 1
+                signal.emit(record)
+
+
+class MediaPlayerVlclibSignals(_LazyEventSignals):
+
+    # audiodevice = pyqtSignal(object)
+    audiovolume = pyqtSignal(object)
+    # backward = pyqtSignal(object)
+    buffering = pyqtSignal(object)
+    # chapterchanged = pyqtSignal(object)
+    # corked = pyqtSignal(object)
+    # esadded = pyqtSignal(object)
+    # esdeleted = pyqtSignal(object)
+    # esselected = pyqtSignal(object)
+    encounterederror = pyqtSignal(object)
+    endreached = pyqtSignal(object)
+    forward = pyqtSignal(object)
+    # lengthchanged = pyqtSignal(object)
+    # mediachanged = pyqtSignal(object)
+    muted = pyqtSignal(object)
+    nothingspecial = pyqtSignal(object)
+    opening = pyqtSignal(object)
+    pausablechanged = pyqtSignal(object)
+    paused = pyqtSignal(object)
+    playing = pyqtSignal(object)
+    positionchanged = pyqtSignal(object)
+    # scrambledchanged = pyqtSignal(object)
+    # seekablechanged = pyqtSignal(object)
+    # snapshottaken = pyqtSignal(object)
+    stopped = pyqtSignal(object)
+    timechanged = pyqtSignal(object)
+    titlechanged = pyqtSignal(object)
+    uncorked = pyqtSignal(object)
+    unmuted = pyqtSignal(object)
+    vout = pyqtSignal(object)
+
+    event_types = {
+        "audiovolume": vlc.EventType.MediaPlayerAudioVolume,
+        "buffering": vlc.EventType.MediaPlayerBuffering,
+        "encounterederror": vlc.EventType.MediaPlayerEncounteredError,
+        "endreached": vlc.EventType.MediaPlayerEndReached,
+        "forward": vlc.EventType.MediaPlayerForward,
+        "muted": vlc.EventType.MediaPlayerMuted,
+        "nothingspecial": vlc.EventType.MediaPlayerNothingSpecial,
+        "opening": vlc.EventType.MediaPlayerOpening,
+        "pausablechanged": vlc.EventType.MediaPlayerPausableChanged,
+        "paused": vlc.EventType.MediaPlayerPaused,
+        "playing": vlc.EventType.MediaPlayerPlaying,
+        "positionchanged": vlc.EventType.MediaPlayerPositionChanged,
+        "stopped": vlc.EventType.MediaPlayerStopped,
+        "timechanged": vlc.EventType.MediaPlayerTimeChanged,
+        "titlechanged": vlc.EventType.MediaPlayerTitleChanged,
+        "uncorked": vlc.EventType.MediaPlayerUncorked,
+        "unmuted": vlc.EventType.MediaPlayerUnmuted,
+        "vout": vlc.EventType.MediaPlayerVout,
+    }
+
+    value_fields = {
+        "buffering": "new_cache",
+        "pausablechanged": "new_pausable",
+        "positionchanged": "new_position",
+        "timechanged": "new_time",
+        "titlechanged": "new_title",
+        "vout": "new_count",
+    }
+
+    coalesced_events = frozenset({"positionchanged", "timechanged"})
 
-        type_slot_pairs = [
-            # (vlc.EventType.MediaPlayerAudioDevice, self._audiodevice),
-            (vlc.EventType.MediaPlayerAudioVolume, self._audiovolume),
-            # (vlc.EventType.MediaPlayerBackward, self._backward),
-            (vlc.EventType.MediaPlayerBuffering, self._buffering),
-            # (vlc.EventType.MediaPlayerChapterChanged, self._chapterchanged),
-            # (vlc.EventType.MediaPlayerCorked, self._corked),
-            # (vlc.EventType.MediaPlayerESAdded, self._esadded),
-            # (vlc.EventType.MediaPlayerESDeleted, self._esdeleted),
-            # (vlc.EventType.MediaPlayerESSelected, self._esselected),
-            (vlc.EventType.MediaPlayerEncounteredError, self._encounterederror),
-            (vlc.EventType.MediaPlayerEndReached, self._endreached),
-            (vlc.EventType.MediaPlayerForward, self._forward),
-            # (vlc.EventType.MediaPlayerLengthChanged, self._lengthchanged),
-            # (vlc.EventType.MediaPlayerMediaChanged, self._mediachanged),
-            (vlc.EventType.MediaPlayerMuted, self._muted),
-            (vlc.EventType.MediaPlayerNothingSpecial, self._nothingspecial),
-            (vlc.EventType.MediaPlayerOpening, self._opening),
-            (vlc.EventType.MediaPlayerPausableChanged, self._pausablechanged),
-            (vlc.EventType.MediaPlayerPaused, self._paused),
-            (vlc.EventType.MediaPlayerPlaying, self._playing),
-            (vlc.EventType.MediaPlayerPositionChanged, self._positionchanged),
-            # (vlc.EventType.MediaPlayerScrambledChanged, self._scrambledchanged),
-            # (vlc.EventType.MediaPlayerSeekableChanged, self._seekablechanged),
-            # (vlc.EventType.MediaPlayerSnapshotTaken, self._snapshottaken),
-            (vlc.EventType.MediaPlayerStopped, self._stopped),
-            (vlc.EventType.MediaPlayerTimeChanged, self._timechanged),
-            (vlc.EventType.MediaPlayerTitleChanged, self._titlechanged),
-            (vlc.EventType.MediaPlayerUncorked, self._uncorked),
-            (vlc.EventType.MediaPlayerUnmuted, self._unmuted),
-            (vlc.EventType.MediaPlayerVout, self._vout),
-        ]
-        event_manager = vlc_media_player.event_manager()
-        for e_type, cb_slot in type_slot_pairs:
-            event_manager.event_attach(e_type, cb_slot)
-
-    @pyqtSlot(vlc.Event)
-    def _audiodevice(self, e):
-        self.audiodevice.emit(e)
-        # log.debug("VLCQT SIGNAL name='audiodevice'")
-
-    @pyqtSlot(vlc.Event)
-    def _audiovolume(self, e):
-        self.audiovolume.emit(e)
-        # log.debug("VLCQT SIGNAL name='audiovolume'")
-
-    @pyqtSlot(vlc.Event)
-    def _backward(self, e):
-        self.backward.emit(e)
-        # log.debug("VLCQT SIGNAL name='backward'")
-
-    @pyqtSlot(vlc.Event)
-    def _buffering(self, e):
-        self.buffering.emit(e)
-        # log.debug("VLCQT SIGNAL name='buffering'")
-
-    @pyqtSlot(vlc.Event)
-    def _chapterchanged(self, e):
-        self.chapterchanged.emit(e)
-        # log.debug("VLCQT SIGNAL name='chapterchanged'")
-
-    @pyqtSlot(vlc.Event)
-    def _corked(self, e):
-        self.corked.emit(e)
-        # log.debug("VLCQT SIGNAL name='corked'")
-
-    @pyqtSlot(vlc.Event)
-    def _esadded(self, e):
-        self.esadded.emit(e)
-        # log.debug("VLCQT SIGNAL name='esadded'")
-
-    @pyqtSlot(vlc.Event)
-    def _esdeleted(self, e):
-        self.esdeleted.emit(e)
-        # log.debug("VLCQT SIGNAL name='esdeleted'")
-
-    @pyqtSlot(vlc.Event)
-    def _esselected(self, e):
-        self.esselected.emit(e)
-        # log.debug("VLCQT SIGNAL name='esselected'")
-
-    @pyqtSlot(vlc.Event)
-    def _encounterederror(self, e):
-        self.encounterederror.emit(e)
-        # log.debug("VLCQT SIGNAL name='encounterederror'")
-
-    @pyqtSlot(vlc.Event)
-    def _endreached(self, e):
-        self.endreached.emit(e)
-        # log.debug("VLCQT SIGNAL name='endreached'")
-
-    @pyqtSlot(vlc.Event)
-    def _forward(self, e):
-        self.forward.emit(e)
-        # log.debug("VLCQT SIGNAL name='forward'")
-
-    @pyqtSlot(vlc.Event)
-    def _lengthchanged(self, e):
-        self.lengthchanged.emit(e)
-        # log.debug("VLCQT SIGNAL name='lengthchanged'")
-
-    @pyqtSlot(vlc.Event)
-    def _mediachanged(self, e):
-        self.mediachanged.emit(e)
-        # log.debug("VLCQT SIGNAL name='mediachanged'")
-
-    @pyqtSlot(vlc.Event)
-    def _muted(self, e):
-        self.muted.emit(e)
-        # log.debug("VLCQT SIGNAL name='muted'")
-
-    @pyqtSlot(vlc.Event)
-    def _nothingspecial(self, e):
-        self.nothingspecial.emit(e)
-        # log.debug("VLCQT SIGNAL name='nothingspecial'")
-
-    @pyqtSlot(vlc.Event)
-    def _opening(self, e):
-        self.opening.emit(e)
-        # log.debug("VLCQT SIGNAL name='opening'")
-
-    @pyqtSlot(vlc.Event)
-    def _pausablechanged(self, e):
-        self.pausablechanged.emit(e)
-        # log.debug("VLCQT SIGNAL name='pausablechanged'")
-
-    @pyqtSlot(vlc.Event)
-    def _paused(self, e):
-        self.paused.emit(e)
-        # log.debug("VLCQT SIGNAL name='paused'")
-
-    @pyqtSlot(vlc.Event)
-    def _playing(self, e):
-        self.playing.emit(e)
-        # log.debug("VLCQT SIGNAL name='playing'")
-
-    @pyqtSlot(vlc.Event)
-    def _positionchanged(self, e):
-        self.positionchanged.emit(e)
-        # log.debug("VLCQT SIGNAL name='positionchanged'")
-
-    @pyqtSlot(vlc.Event)
-    def _scrambledchanged(self, e):
-        self.scrambledchanged.emit(e)
-        # log.debug("VLCQT SIGNAL name='scrambledchanged'")
-
-    @pyqtSlot(vlc.Event)
-    def _seekablechanged(self, e):
-        self.seekablechanged.emit(e)
-        # log.debug("VLCQT SIGNAL name='seekablechanged'")
-
-    @pyqtSlot(vlc.Event)
-    def _snapshottaken(self, e):
-        self.snapshottaken.emit(e)
-        # log.debug("VLCQT SIGNAL name='snapshottaken'")
-
-    @pyqtSlot(vlc.Event)
-    def _stopped(self, e):
-        self.stopped.emit(e)
-        # log.debug("VLCQT SIGNAL name='stopped'")
-
-    @pyqtSlot(vlc.Event)
-    def _timechanged(self, e):
-        self.timechanged.emit(e)
-        # log.debug("VLCQT SIGNAL name='timechanged'")
-
-    @pyqtSlot(vlc.Event)
-    def _titlechanged(self, e):
-        self.titlechanged.emit(e)
-        # log.debug("VLCQT SIGNAL name='titlechanged'")
-
-    @pyqtSlot(vlc.Event)
-    def _uncorked(self, e):
-        self.uncorked.emit(e)
-        # log.debug("VLCQT SIGNAL name='uncorked'")
-
-    @pyqtSlot(vlc.Event)
-    def _unmuted(self, e):
-        self.unmuted.emit(e)
-        # log.debug("VLCQT SIGNAL name='unmuted'")
-
-    @pyqtSlot(vlc.Event)
-    def _vout(self, e):
-        self.vout.emit(e)
-        # log.debug("VLCQT SIGNAL name='vout'")
+    def __init__(self, vlc_media_player):
+        super().__init__(event_manager=vlc_media_player.event_manager())
 
 
 class MediaPlayerCustomSignals(MediaPlayerVlclibSignals):
@@ -275,67 +221,29 @@ class MediaPlayerCustomSignals(MediaPlayerVlclibSignals):
 MediaPlayerSignals = MediaPlayerCustomSignals
 
 
-class MediaVlclibSignals(QObject):
+class MediaVlclibSignals(_LazyEventSignals):
 
-    mediadurationchanged = pyqtSignal(vlc.Event)
-    mediafreed = pyqtSignal(vlc.Event)
-    mediastatechanged = pyqtSignal(vlc.Event)
-    mediasubitemadded = pyqtSignal(vlc.Event)
-    mediasubitemtreeadded = pyqtSignal(vlc.Event)
+    mediadurationchanged = pyqtSignal(object)
+    mediafreed = pyqtSignal(object)
+    mediastatechanged = pyqtSignal(object)
+    mediasubitemadded = pyqtSignal(object)
+    mediasubitemtreeadded = pyqtSignal(object)
 
-    def __init__(self, vlc_media):
-        super().__init__()
+    event_types = {
+        "mediadurationchanged": vlc.EventType.MediaDurationChanged,
+        "mediafreed": vlc.EventType.MediaFreed,
+        "mediastatechanged": vlc.EventType.MediaStateChanged,
+        "mediasubitemadded": vlc.EventType.MediaSubItemAdded,
+        "mediasubitemtreeadded": vlc.EventType.MediaSubItemTreeAdded,
+    }
+
+    value_fields = {
+        "mediadurationchanged": "new_duration",
+        "mediastatechanged": "new_state",
+    }
 
-        type_slot_pairs = [
-            (vlc.EventType.MediaDurationChanged, self.__MediaDurationChanged),
-            (vlc.EventType.MediaFreed, self.__MediaFreed),
-            (vlc.EventType.MediaStateChanged, self.__MediaStateChanged),
-            (vlc.EventType.MediaSubItemAdded, self.__MediaSubItemAdded),
-            (vlc.EventType.MediaSubItemTreeAdded, self.__MediaSubItemTreeAdded),
-        ]
-        event_manager = vlc_media.event_manager()
-        for e_type, cb_slot in type_slot_pairs:
-            event_manager.event_attach(e_type, cb_slot)
-
-    @pyqtSlot(vlc.Event)
-    def __MediaDurationChanged(self, e):
-        try:
-            self.mediadurationchanged.emit(e)
-        except AttributeError as e:
-            log.error(e)
-        # log.debug("VLCQT SIGNAL name='mediadurationchanged'")
-
-    @pyqtSlot(vlc.Event)
-    def __MediaFreed(self, e):
-        try:
-            self.mediafreed.emit(e)
-        except AttributeError as e:
-            log.error(e)
-        # log.debug("VLCQT SIGNAL name='mediafreed'")
-
-    @pyqtSlot(vlc.Event)
-    def __MediaStateChanged(self, e):
-        try:
-            self.mediastatechanged.emit(e)
-        except AttributeError as e:
-            log.error(e)
-        # log.debug("VLCQT SIGNAL name='mediastatechanged'")
-
-    @pyqtSlot(vlc.Event)
-    def __MediaSubItemAdded(self, e):
-        try:
-            self.mediasubitemadded.emit(e)
-        except AttributeError as e:
-            log.error(e)
-        # log.debug("VLCQT SIGNAL name='mediasubitemadded'")
-
-    @pyqtSlot(vlc.Event)
-    def __MediaSubItemTreeAdded(self, e):
-        try:
-            self.mediasubitemtreeadded.emit(e)
-        except AttributeError as e:
-            log.error(e)
-        # log.debug("VLCQT SIGNAL name='mediasubitemtreeadded'")
+    def __init__(self, vlc_media):
+        super().__init__(event_manager=vlc_media.event_manager())
 
 
 MediaSignals = MediaVlclibSignals
@@ -1,3 +1,4 @@
+import json
 import os
 import platform
 import plistlib
@@ -238,8 +239,30 @@ class FreezeContext:
         self.context.__exit__(exc_type, exc_val, exc_tb)
 
 
+@cli.command()
+def compile_styles():
+    """Validate and minify the stylesheets in style/ for bundling"""
+    from app.gui.style import StyleSheetError, compile_stylesheet
+
+    for source_path in sorted((BASE_DIR / "style").glob("*.qss")):
+        if source_path.suffixes == [".min", ".qss"]:
+            continue
+        try:
+            compiled = compile_stylesheet(source_path.read_text())
+        except StyleSheetError as e:
+            typer.echo(f"{source_path.name}: {e}", err=True)
+            raise typer.Exit(code=1)
+        compiled_path = source_path.with_suffix(".min.qss")
+        compiled_path.write_text(compiled)
+        typer.echo(
+            f"{source_path.name}: {len(source_path.read_text())} -> "
+            f"{len(compiled)} bytes ({compiled_path.name})"
+        )
+
+
 @cli.command()
 def freeze(console=False):
+    compile_styles()
     add_to_path(get_ffprobe_binary_path().resolve())
     delimiter = ";" if is_win else ":"
     base_command = [
@@ -552,9 +575,69 @@ def get_ffprobe_binary_path() -> Path:
     return bin_file_path
 
 
+@cli.command()
+def benchmark_decoding(
+    clips: List[Path] = typer.Argument(None, help="Defaults to the clips in media/"),
+    profiles: List[str] = typer.Option(None, "--profile", help="Defaults to all"),
+    duration: float = typer.Option(5.0, help="Seconds to play each clip"),
+    threads: int = typer.Option(0, help="Software decoding threads, 0 is auto"),
+    output: Path = typer.Option(None, help="Write results to this JSON file"),
+    render_size: str = typer.Option(
+        None, help="Also render frames offscreen at this size, e.g. 1920x1080"
+    ),
+):
+    """Play each clip headless under each decode profile and recommend the best"""
+    from app import vlcqt
+
+    if not clips:
+        clips = sorted(p for p in (BASE_DIR / "media").iterdir() if p.suffix != ".m3u")
+    results = vlcqt.benchmark_decoding(
+        paths=[str(c) for c in clips],
+        profiles=profiles or list(vlcqt.DECODE_PROFILES),
+        duration=duration,
+        threads=threads,
+        render_size=tuple(int(i) for i in render_size.split("x"))
+        if render_size
+        else None,
+    )
+
+    typer.echo(f"{'profile':<10}{'fps':>8}{'dropped':>9}{'cpu %':>8}  clip")
+    for r in results:
+        typer.echo(
+            f"{r.profile:<10}{r.fps:>8.1f}{r.dropped_frames:>9}{r.cpu_percent:>8.1f}"
+            f"  {Path(r.clip).name}{f' ({r.error})' if r.error else ''}"
+        )
+    if output:
+        with open(output, "w") as f:
+            json.dump([dict(r._asdict(), fps=r.fps) for r in results], f, indent=2)
+
+    recommended = vlcqt.recommend_decode_profile(results)
+    if recommended:
+        typer.echo(f"Recommended decode profile: {recommended}")
+    else:
+        typer.echo("No decode profile played every clip")
+        raise typer.Exit(code=1)
+
+
+@cli.command()
+def benchmark(
+    update: bool = typer.Option(False, help="Save the timings as the new baselines"),
+):
+    """Run the hot path benchmarks in tests/benchmarks against their baselines"""
+    option = "--benchmark-update" if update else "--benchmark"
+    check_call(
+        [sys.executable, "-m", "pytest", "tests/benchmarks", option], cwd=BASE_DIR
+    )
+
+
 @cli.command()
 # @cli.argument("filename", type=click.Path(exists=True))
-def run(files: List[Path] = typer.Argument(None)):
+def run(
+    files: List[Path] = typer.Argument(None),
+    profile_startup: bool = typer.Option(
+        False, "--profile-startup", help="Print per-phase startup timings"
+    ),
+):
     for i in ["PYTHON_VLC_LIB_PATH", "PYTHON_VLC_MODULE_PATH"]:
         try:
             del os.environ[i]
@@ -564,7 +647,7 @@ def run(files: List[Path] = typer.Argument(None)):
     add_to_path(get_ffprobe_binary_path().parent.resolve())
     import app.__main__
 
-    app.__main__.run(files)
+    app.__main__.run(files, profile_startup=profile_startup)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,100 @@
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+BASELINES_PATH = Path(__file__).parent / "baselines.json"
+
+_results = {}
+
+
+def load_baselines() -> dict:
+    with open(BASELINES_PATH) as f:
+        return json.load(f)
+
+
+class Benchmark:
+    """Time a callable and check its best time against the stored baseline.
+
+    Timings are the fastest of `rounds` calls divided by `per`, e.g. the number of
+    files or cells handled by each call, so baselines are in seconds per unit. A
+    benchmark fails if it is slower than its baseline by more than its tolerance, and
+    also fails if it has no baseline yet, so that a run cannot pass unmeasured.
+    """
+
+    def __init__(self, name: str, baselines: dict, update: bool):
+        self.name = name
+        self.baselines = baselines
+        self.update = update
+        self.seconds = None
+
+    def __call__(self, func, *args, rounds=5, per=1, setup=None, **kwargs):
+        timings = []
+        for _ in range(rounds):
+            if setup:
+                setup()
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            timings.append(time.perf_counter() - start)
+        self.seconds = min(timings) / per
+        _results[self.name] = self.seconds
+        if not self.update:
+            self.check()
+        return result
+
+    def check(self):
+        baseline = self.baselines["benchmarks"].get(self.name)
+        if baseline is None:
+            pytest.fail(
+                f"No baseline for {self.name}, record one with --benchmark-update",
+                pytrace=False,
+            )
+        tolerance = baseline.get("tolerance", self.baselines["tolerance"])
+        limit = baseline["seconds"] * (1 + tolerance)
+        assert self.seconds <= limit, (
+            f"{self.name} regressed: {self.seconds * 1e6:.1f}us per unit, "
+            f"baseline {baseline['seconds'] * 1e6:.1f}us +{tolerance:.0%}"
+        )
+
+
+@pytest.fixture(autouse=True)
+def _benchmarks_enabled(pytestconfig):
+    if not (
+        pytestconfig.getoption("--benchmark")
+        or pytestconfig.getoption("--benchmark-update")
+    ):
+        pytest.skip("Benchmarks run with --benchmark or --benchmark-update")
+
+
+@pytest.fixture
+def benchmark(request, pytestconfig):
+    return Benchmark(
+        name=request.node.name,
+        baselines=load_baselines(),
+        update=pytestconfig.getoption("--benchmark-update"),
+    )
+
+
+def pytest_sessionfinish(session):
+    if not _results or not session.config.getoption("--benchmark-update"):
+        return
+    baselines = load_baselines()
+    for name, seconds in _results.items():
+        entry = baselines["benchmarks"].setdefault(name, {})
+        entry["seconds"] = float(f"{seconds:.3g}")
+    with open(BASELINES_PATH, "w") as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _results:
+        return
+    benchmarks = load_baselines()["benchmarks"]
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(f"{'us/unit':>12} {'baseline':>12}  benchmark")
+    for name, seconds in sorted(_results.items()):
+        baseline = benchmarks.get(name, {}).get("seconds")
+        baseline_text = f"{baseline * 1e6:12.3f}" if baseline else f"{'-':>12}"
+        terminalreporter.write_line(f"{seconds * 1e6:12.3f} {baseline_text}  {name}")
@@ -0,0 +1,217 @@
+import subprocess
+import sys
+
+import pytest
+import qtawesome as qta
+from PyQt5.QtCore import QSize, Qt
+from PyQt5.QtGui import QIcon
+from PyQt5.QtWidgets import (
+    QApplication,
+    QLabel,
+    QMainWindow,
+    QToolButton,
+    QVBoxLayout,
+    QWidget,
+)
+
+from app.gui import icons
+from app.gui.style import load_stylesheet
+from app.output.frame import MediaPlayerContentFrame
+from app.vlcqt._facades import _VlcObjectFacade
+
+LIBRARY_SIZE = 1000
+
+STARTUP_SCRIPT = """
+from PyQt5.QtCore import QTimer
+from app.context import AppContext
+
+context = AppContext()
+context.main_win.show()
+QTimer.singleShot(0, context.app.quit)
+context.app.exec_()
+"""
+
+
+class FakeVlcMediaPlayer:
+    def get_position(self):
+        return 0.5
+
+
+class FakeFacade(_VlcObjectFacade):
+    bound_methods = ("get_position",)
+
+    def __init__(self):
+        self._vlc_obj = FakeVlcMediaPlayer()
+        self._bind_methods()
+
+
+class FakeMediaPlayer:
+    def __getattr__(self, name):
+        return lambda *args: None
+
+
+def build_window(count):
+    window = QWidget()
+    window.setLayout(QVBoxLayout())
+    for n in range(count):
+        window.layout().addWidget(QToolButton(text=str(n)))
+        window.layout().addWidget(QLabel(str(n)))
+    window.show()
+    return window
+
+
+def media_paths(media_dir):
+    return [str(p) for p in sorted(media_dir.iterdir()) if p.suffix == ".mp4"]
+
+
+def test_add_media_per_file(main_win, media_dir, benchmark):
+    model = main_win.playlist_widget.view.model()
+    paths = media_paths(media_dir)
+    benchmark(
+        main_win.playlist_widget.add_media,
+        paths,
+        setup=lambda: model.setRowCount(0),
+        per=len(paths),
+    )
+    assert model.rowCount() == len(paths)
+
+
+def test_add_media_library_per_file(main_win, synthetic_library, benchmark):
+    library = synthetic_library(count=LIBRARY_SIZE)
+    model = main_win.playlist_widget.view.model()
+    benchmark(
+        main_win.playlist_widget.add_media,
+        library.paths,
+        setup=lambda: model.setRowCount(0),
+        rounds=3,
+        per=LIBRARY_SIZE,
+    )
+    assert model.rowCount() == LIBRARY_SIZE
+
+
+def test_playlist_model_data_per_cell(main_win, synthetic_library, benchmark):
+    main_win.load_media(synthetic_library(count=LIBRARY_SIZE).paths)
+    model = main_win.playlist_widget.view.model()
+    indexes = [
+        model.index(row, column)
+        for row in range(model.rowCount())
+        for column in range(model.columnCount())
+    ]
+
+    def read_cells():
+        for index in indexes:
+            model.data(index, Qt.DisplayRole)
+
+    benchmark(read_cells, per=len(indexes))
+
+
+def test_load_media_switch(qtbot, main_win, media_dir, benchmark):
+    main_win.load_media(media_paths(media_dir)[:2])
+    model = main_win.playlist_widget.view.model()
+    first, second = model.item(0).index(), model.item(1).index()
+
+    def switch():
+        main_win.listplayer.load_media(index=second)
+        main_win.listplayer.load_media(index=first)
+
+    benchmark(switch, rounds=10, per=2)
+
+
+def test_viewpoint_update(main_win, media_dir, benchmark):
+    main_win.load_media(media_paths(media_dir)[:1])
+    viewpoint_mngr = main_win.viewpoint_mngr
+    count = 1000
+
+    def update_viewpoints():
+        for n in range(count):
+            viewpoint_mngr.set_new_user_viewpoint(n % 360 - 180, n % 90 - 45, 0)
+
+    benchmark(update_viewpoints, per=count)
+
+
+def test_facade_call(benchmark):
+    """A per-frame call through the media player facade"""
+    facade = FakeFacade()
+    count = 100000
+
+    def call_facade():
+        for _ in range(count):
+            facade.get_position()
+
+    benchmark(call_facade, per=count)
+
+
+def test_icon_pixmap(qtbot, benchmark):
+    """A toolbar icon pixmap served from the pixmap cache"""
+    cache = icons.IconPixmapCache()
+    icon = QIcon(icons.CachedIconEngine("play", qta.icon("mdi.play"), cache))
+    size = QSize(24, 24)
+    count = 1000
+
+    def get_pixmaps():
+        for _ in range(count):
+            icon.pixmap(size)
+
+    benchmark(get_pixmaps, per=count)
+
+
+def test_settings_read_per_cell(state, benchmark):
+    """The settings read made for each playlist cell paint"""
+    count = 10000
+
+    def read_settings():
+        for _ in range(count):
+            state.meta_tags[3]
+
+    benchmark(read_settings, per=count)
+
+
+def test_fullscreen_toggle(qtbot, benchmark):
+    main_win = QMainWindow()
+    qtbot.addWidget(main_win)
+    frame = MediaPlayerContentFrame(
+        main_win=main_win, frame_size_mngr=None, media_player=FakeMediaPlayer()
+    )
+    main_win.setCentralWidget(frame)
+    main_win.show()
+    qtbot.waitExposed(main_win)
+
+    def toggle():
+        frame.start_fullscreen(QApplication.primaryScreen(), text="Fullscreen")
+        frame.stop_fullscreen()
+
+    benchmark(toggle, rounds=10)
+
+
+@pytest.mark.parametrize("style_first", [True, False], ids=["before", "after"])
+def test_apply_stylesheet(qtbot, rootdir, benchmark, style_first):
+    """Styling before widgets exist, as at startup, or after, which re-polishes them"""
+    app = QApplication.instance()
+    stylesheet = load_stylesheet(str(rootdir / "style"), "dark")
+    windows = []
+
+    def build_and_style():
+        if style_first:
+            app.setStyleSheet(stylesheet)
+        windows.append(build_window(200))
+        if not style_first:
+            app.setStyleSheet(stylesheet)
+        app.processEvents()
+
+    def reset():
+        while windows:
+            windows.pop().close()
+        app.setStyleSheet("")
+
+    benchmark(build_and_style, setup=reset, rounds=3)
+    reset()
+
+
+def test_startup(rootdir, benchmark):
+    benchmark(
+        subprocess.run,
+        [sys.executable, "-c", STARTUP_SCRIPT],
+        cwd=rootdir,
+        check=True,
+        rounds=3,
+    )
@@ -4,13 +4,32 @@ import pytest
 
 from build import add_to_path, get_ffprobe_binary_path
 
+from .library import SyntheticLibrary
+from .simulator import ControlServerSimulator
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        help="Run the benchmarks in tests/benchmarks and check them against baselines",
+    )
+    group.addoption(
+        "--benchmark-update",
+        action="store_true",
+        help="Run the benchmarks and save their timings as the new baselines",
+    )
+
 
 def pytest_configure():
     add_to_path(get_ffprobe_binary_path().parent.resolve())
 
 
 @pytest.fixture
-def context():
+def context(monkeypatch):
+    # aboutToQuit is never emitted in tests, so a watchdog would outlive its test
+    monkeypatch.setenv("VR_PLAYER_STALL_MS", "0")
     import app.__main__
 
     yield app.__main__.AppContext()
@@ -37,3 +56,44 @@ def rootdir(pytestconfig):
 @pytest.fixture
 def media_dir(rootdir):
     return rootdir / "media"
+
+
+@pytest.fixture
+def synthetic_library(tmp_path_factory, media_dir, monkeypatch):
+    """Factory for synthetic media libraries. Media items get the generated metadata."""
+
+    def make(count=1000, **kwargs):
+        directory = tmp_path_factory.mktemp("library")
+        sources = sorted(p for p in media_dir.iterdir() if p.suffix == ".mp4")
+        library = SyntheticLibrary(directory, sources, count, **kwargs).generate()
+        monkeypatch.setattr("app.playlist.model.ffmpeg_probe", library.probe)
+        return library
+
+    return make
+
+
+@pytest.fixture
+def state(qtbot, tmp_path):
+    """Settings state loaded from a fresh settings file"""
+    from PyQt5.QtCore import QSettings
+
+    from app.config import state
+
+    state.load(QSettings(str(tmp_path / "settings.ini"), QSettings.IniFormat))
+    yield state
+
+
+@pytest.fixture
+def control_server(request):
+    """Local control server. Parametrize indirectly to pass simulator options."""
+    server = ControlServerSimulator(**getattr(request, "param", {}))
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def local_control_server(state, control_server):
+    """Point the configured server url at the local control server"""
+    state.url = control_server.url
+    yield control_server
@@ -0,0 +1,171 @@
+import os
+import random
+import shutil
+import subprocess
+from fractions import Fraction
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Sequence
+
+from ffmpeg import probe as ffmpeg_probe
+
+RESOLUTIONS = [(1920, 1080), (3840, 2160), (3840, 1920), (5760, 2880), (7680, 3840)]
+FRAME_RATES = ["24000/1001", "24/1", "25/1", "30000/1001", "30/1", "50/1", "60/1"]
+GENRES = ["Documentary", "Music", "Sports", "Travel", "Nature", "Performance"]
+TIME_BASE = 15360
+
+
+class MediaSpec(NamedTuple):
+    title: str
+    width: int
+    height: int
+    frame_rate: str  # as ffprobe reports it, e.g. "30000/1001"
+    duration: float  # seconds
+    spherical: bool
+    bit_rate: int  # bits/s
+    tags: Dict[str, str]
+
+
+def synthetic_probe(path: str, spec: MediaSpec) -> dict:
+    """An ffprobe result for `spec`, with the fields that ffprobe reports for mp4"""
+    fps = Fraction(spec.frame_rate)
+    video = {
+        "index": 0,
+        "codec_name": "h264",
+        "codec_type": "video",
+        "width": spec.width,
+        "height": spec.height,
+        "has_b_frames": 2,
+        "r_frame_rate": spec.frame_rate,
+        "avg_frame_rate": spec.frame_rate,
+        "time_base": f"1/{TIME_BASE}",
+        "duration_ts": int(spec.duration * TIME_BASE),
+        "duration": f"{spec.duration:.6f}",
+        "nb_frames": str(int(spec.duration * fps)),
+    }
+    if spec.spherical:
+        video["side_data_list"] = [
+            {
+                "side_data_type": "Spherical Mapping",
+                "projection": "equirectangular",
+                "yaw": 0,
+                "pitch": 0,
+                "roll": 0,
+            }
+        ]
+    audio = {"index": 1, "codec_name": "aac", "codec_type": "audio"}
+    return {
+        "streams": [video, audio],
+        "format": {
+            "filename": path,
+            "nb_streams": 2,
+            "format_name": "mov,mp4,m4a,3gp,3g2,mj2",
+            "duration": f"{spec.duration:.6f}",
+            "size": str(int(spec.bit_rate * spec.duration / 8)),
+            "bit_rate": str(spec.bit_rate),
+            "tags": dict(spec.tags, title=spec.title),
+        },
+    }
+
+
+def random_spec(rng: random.Random, number: int, spherical_ratio: float) -> MediaSpec:
+    width, height = rng.choice(RESOLUTIONS)
+    frame_rate = rng.choice(FRAME_RATES)
+    # Bitrate scales with pixel rate, about 0.1 bits per pixel
+    bit_rate = int(width * height * Fraction(frame_rate) * 0.1)
+    genre = rng.choice(GENRES)
+    return MediaSpec(
+        title=f"{genre} {number:05d}",
+        width=width,
+        height=height,
+        frame_rate=frame_rate,
+        duration=round(rng.uniform(5, 3600), 3),
+        spherical=rng.random() < spherical_ratio,
+        bit_rate=bit_rate,
+        tags={
+            "artist": f"Artist {rng.randrange(200)}",
+            "album": f"Album {rng.randrange(500)}",
+            "genre": genre,
+            "date": str(rng.randrange(2010, 2021)),
+            "track number": str(rng.randrange(1, 20)),
+            "description": " ".join(rng.choices(GENRES, k=rng.randrange(1, 12))),
+        },
+    )
+
+
+def render_clip(path: Path, spec: MediaSpec, seconds: float = 2.0):
+    """Encode a test pattern clip of the spec's size and frame rate with ffmpeg"""
+    source = f"testsrc2=size={spec.width}x{spec.height}:rate={spec.frame_rate}"
+    subprocess.run(
+        ["ffmpeg", "-v", "error", "-y", "-f", "lavfi", "-i", source]
+        + ["-t", str(seconds), "-c:v", "libx264", "-preset", "ultrafast", str(path)],
+        check=True,
+    )
+
+
+class SyntheticLibrary:
+    """A directory of media files with varied, generated metadata.
+
+    Files are links to `sources`, so libraries of thousands of items take no space
+    and need no encoding. With `render`, one short clip is encoded with ffmpeg for
+    each size and frame rate instead, so that playback matches the metadata.
+
+    Use `probe` in place of ffmpeg's probe to read the generated metadata.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        sources: Sequence[Path],
+        count: int,
+        spherical_ratio: float = 0.5,
+        render: bool = False,
+        seed: int = 0,
+    ):
+        self.directory = Path(directory)
+        self.sources = [Path(s) for s in sources]
+        self.count = count
+        self.spherical_ratio = spherical_ratio
+        self.render = render
+        self.seed = seed
+        self.probes: Dict[str, dict] = {}
+
+    @property
+    def paths(self) -> List[str]:
+        return list(self.probes)
+
+    def generate(self) -> "SyntheticLibrary":
+        if self.render and not shutil.which("ffmpeg"):
+            raise RuntimeError("ffmpeg is required to render a synthetic library")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        rng = random.Random(self.seed)
+        rendered: Dict[tuple, Path] = {}
+        for number in range(self.count):
+            spec = random_spec(rng, number, self.spherical_ratio)
+            if self.render:
+                key = spec.width, spec.height, spec.frame_rate
+                if key not in rendered:
+                    name = "render-{}x{}-{}.mp4".format(*key).replace("/", "_")
+                    rendered[key] = self.directory / name
+                    render_clip(rendered[key], spec)
+                source = rendered[key]
+            else:
+                source = self.sources[number % len(self.sources)]
+            path = self.directory / f"{number:05d}{source.suffix}"
+            self._link(source, path)
+            self.probes[str(path)] = synthetic_probe(str(path), spec)
+        return self
+
+    def probe(self, path, **kwargs) -> dict:
+        try:
+            return self.probes[str(path)]
+        except KeyError:
+            return ffmpeg_probe(path, **kwargs)
+
+    @staticmethod
+    def _link(source: Path, path: Path):
+        if path.exists() or path.is_symlink():
+            path.unlink()
+        try:
+            os.symlink(os.path.abspath(source), path)
+        except OSError:  # e.g. Windows without symlink privileges
+            shutil.copyfile(source, path)
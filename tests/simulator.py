@@ -0,0 +1,401 @@
+"""Local stand-in for the hosted control server, for offline load and latency tests.
+
+The simulator speaks just enough of RFC 6455 to serve a QWebSocket client, and
+streams synthetic motion states in the same format that the hosted server sends
+(3 native doubles: yaw, pitch, roll). It also answers 'sync_request' messages and
+can broadcast a 'master_clock' for synchronized playback tests.
+"""
+import asyncio
+import base64
+import hashlib
+import heapq
+import json
+import logging
+import math
+import random
+import struct
+import threading
+import time
+from array import array
+from typing import Callable, List, Optional
+
+log = logging.getLogger(__name__)
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+
+def accept_key(key: str) -> str:
+    digest = hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()
+    return base64.b64encode(digest).decode()
+
+
+def encode_frame(opcode: int, payload: bytes) -> bytes:
+    """Encode a single unmasked (server to client) frame"""
+    header = bytearray([0x80 | opcode])
+    length = len(payload)
+    if length < 126:
+        header.append(length)
+    elif length < 65536:
+        header.append(126)
+        header.extend(struct.pack("!H", length))
+    else:
+        header.append(127)
+        header.extend(struct.pack("!Q", length))
+    return bytes(header) + payload
+
+
+async def read_frame(reader: asyncio.StreamReader):
+    """Read a single (masked, client to server) frame. Returns (fin, opcode, data)"""
+    b0, b1 = await reader.readexactly(2)
+    fin = bool(b0 & 0x80)
+    opcode = b0 & 0x0F
+    length = b1 & 0x7F
+    if length == 126:
+        (length,) = struct.unpack("!H", await reader.readexactly(2))
+    elif length == 127:
+        (length,) = struct.unpack("!Q", await reader.readexactly(8))
+    mask = await reader.readexactly(4) if b1 & 0x80 else None
+    data = await reader.readexactly(length)
+    if mask:
+        data = bytes(b ^ mask[i % 4] for i, b in enumerate(data))
+    return fin, opcode, data
+
+
+def synthetic_motion_state(t: float) -> bytes:
+    """Slow, smooth head movement as (yaw, pitch, roll) degrees"""
+    yaw = 180 * math.sin(t * 0.5)
+    pitch = 45 * math.sin(t * 0.7)
+    roll = 10 * math.sin(t * 1.1)
+    return array("d", (yaw, pitch, roll)).tobytes()
+
+
+class SimulatorStats:
+    def __init__(self):
+        self.connections = 0
+        self.packets_generated = 0
+        self.packets_sent = 0
+        self.packets_lost = 0
+        self.packets_reordered = 0
+        self.forced_disconnects = 0
+
+    def as_dict(self):
+        return dict(self.__dict__)
+
+
+class _Connection:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.queue: List = []  # heap of (due, seq, opcode, payload)
+        self.seq = 0
+        self.closed = False
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.writer.write(encode_frame(OP_CLOSE, struct.pack("!H", 1001)))
+        except (ConnectionError, RuntimeError):
+            pass
+        self.writer.close()
+
+
+class ControlServerSimulator:
+    """Asyncio websocket server that streams synthetic motion to connected players.
+
+    Runs its own event loop on a background thread so that it can serve a Qt client
+    running on the main thread. Impairments are applied per outgoing motion packet.
+    """
+
+    def __init__(
+        self,
+        rate: float = 60,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        loss: float = 0,
+        reorder: float = 0,
+        disconnect_after: Optional[float] = None,
+        motion: Callable[[float], bytes] = synthetic_motion_state,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: Optional[int] = None,
+        clock_offset_ms: float = 0,
+    ):
+        if not 0 < rate <= 1000:
+            raise ValueError(f"Motion rate must be in (0, 1000] Hz, not {rate}")
+        self.rate = rate
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.loss = loss
+        self.reorder = reorder
+        self.disconnect_after = disconnect_after
+        self.motion = motion
+        self.host = host
+        self.port = port
+        self.clock_offset_ms = clock_offset_ms
+        self.stats = SimulatorStats()
+        self.received: List = []  # (opcode, data) of client data messages
+
+        self._random = random.Random(seed)
+        self._connections: List[_Connection] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server = None
+        self._thread: Optional[threading.Thread] = None
+        self._started = threading.Event()
+        self._message_handlers: List[Callable] = [self._answer_sync_request]
+        self._master_clock_task = None
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}/mediaplayer"
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._run, name="control-server-simulator", daemon=True
+        )
+        self._thread.start()
+        if not self._started.wait(timeout=5):
+            raise RuntimeError("Control server simulator failed to start")
+        log.info(f"SIMULATOR STARTED url={self.url}")
+
+    def stop(self):
+        if not self._loop:
+            return
+        self._loop.call_soon_threadsafe(self._shutdown)
+        self._thread.join(timeout=5)
+        self._loop = None
+        log.info(f"SIMULATOR STOPPED stats={self.stats.as_dict()}")
+
+    def drop_connections(self):
+        """Close all client connections, as if the server went away for a moment"""
+        self._loop.call_soon_threadsafe(self._drop_connections)
+
+    def connection_count(self) -> int:
+        return len([c for c in self._connections if not c.closed])
+
+    def add_message_handler(self, handler: Callable):
+        """Register `handler(connection, opcode, data)` for client data messages.
+
+        Handlers run on the simulator thread.
+        """
+        self._message_handlers.append(handler)
+
+    def send(self, connection, opcode: int, payload: bytes, delay: float = 0):
+        """Queue a message to one connection, subject to injected latency only"""
+        connection.seq += 1
+        due = time.monotonic() + self.latency_ms / 1000 + delay
+        heapq.heappush(connection.queue, (due, connection.seq, opcode, payload))
+
+    def broadcast(self, opcode: int, payload: bytes):
+        """Queue a message to all connections. Thread-safe."""
+
+        def _broadcast():
+            for connection in self._connections:
+                self.send(connection, opcode, payload)
+
+        self._loop.call_soon_threadsafe(_broadcast)
+
+    def server_time(self) -> float:
+        """Server clock in ms, deliberately offset from the local monotonic clock"""
+        return time.monotonic() * 1000 + self.clock_offset_ms
+
+    def send_message(self, connection, message_type: str, **fields):
+        message = dict(type=message_type, **fields)
+        self.send(connection, OP_TEXT, json.dumps(message).encode())
+
+    def start_master_clock(
+        self, interval: float = 0.5, media_time: float = 0, rate: float = 1.0
+    ):
+        """Broadcast a 'master_clock' message every `interval` seconds. Thread-safe."""
+        origin = self.server_time()
+
+        async def _master_clock():
+            while True:
+                server_time = self.server_time()
+                for connection in self._connections:
+                    self.send_message(
+                        connection,
+                        "master_clock",
+                        server_time=server_time,
+                        media_time=media_time + (server_time - origin) * rate,
+                        rate=rate,
+                        playing=True,
+                    )
+                await asyncio.sleep(interval)
+
+        def _start():
+            self._master_clock_task = asyncio.ensure_future(_master_clock())
+
+        self._loop.call_soon_threadsafe(_start)
+
+    def _answer_sync_request(self, connection, opcode, data):
+        if opcode != OP_TEXT:
+            return
+        message = json.loads(data)
+        if message.get("type") != "sync_request":
+            return
+        t1 = self.server_time()
+        self.send_message(
+            connection, "sync_response", t0=message["t0"], t1=t1, t2=self.server_time()
+        )
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle_client, self.host, self.port)
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(self._loop)
+            for task in pending:
+                task.cancel()
+            self._loop.run_until_complete(
+                asyncio.gather(*pending, return_exceptions=True)
+            )
+            self._loop.close()
+
+    def _shutdown(self):
+        self._drop_connections(forced=False)
+        self._server.close()
+        self._loop.stop()
+
+    def _drop_connections(self, forced=True):
+        for connection in self._connections:
+            if not connection.closed:
+                connection.close()
+                if forced:
+                    self.stats.forced_disconnects += 1
+
+    async def _handshake(self, reader, writer) -> bool:
+        request = await reader.readuntil(b"\r\n\r\n")
+        headers = {}
+        for line in request.decode("latin-1").split("\r\n")[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+        key = headers.get("sec-websocket-key")
+        if not key:
+            writer.write(b"HTTP/1.1 400 Bad Request\r\n\r\n")
+            return False
+        writer.write(
+            (
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {accept_key(key)}\r\n\r\n"
+            ).encode()
+        )
+        await writer.drain()
+        return True
+
+    async def _handle_client(self, reader, writer):
+        try:
+            if not await self._handshake(reader, writer):
+                writer.close()
+                return
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+            return
+
+        connection = _Connection(reader, writer)
+        self._connections.append(connection)
+        self.stats.connections += 1
+        tasks = [
+            asyncio.ensure_future(self._stream_motion(connection)),
+            asyncio.ensure_future(self._deliver(connection)),
+        ]
+        try:
+            await self._receive(connection)
+        finally:
+            connection.close()
+            for task in tasks:
+                task.cancel()
+            self._connections.remove(connection)
+
+    async def _receive(self, connection):
+        fragments: List[bytes] = []
+        fragment_opcode = None
+        while not connection.closed:
+            try:
+                fin, opcode, data = await read_frame(connection.reader)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                return
+            if opcode == OP_CLOSE:
+                return
+            elif opcode == OP_PING:
+                connection.writer.write(encode_frame(OP_PONG, data))
+                continue
+            elif opcode == OP_PONG:
+                continue
+            if opcode != OP_CONTINUATION:
+                fragment_opcode = opcode
+            fragments.append(data)
+            if not fin:
+                continue
+            message, fragments = b"".join(fragments), []
+            self.received.append((fragment_opcode, message))
+            for handler in self._message_handlers:
+                handler(connection, fragment_opcode, message)
+
+    async def _stream_motion(self, connection):
+        period = 1 / self.rate
+        start = next_time = time.monotonic()
+        while not connection.closed:
+            now = time.monotonic()
+            if self.disconnect_after and now - start >= self.disconnect_after:
+                self.stats.forced_disconnects += 1
+                connection.close()
+                return
+            if now >= next_time:
+                self._generate(connection, now)
+                next_time += period
+            await asyncio.sleep(max(0, next_time - time.monotonic()))
+
+    def _generate(self, connection, now):
+        self.stats.packets_generated += 1
+        if self.loss and self._random.random() < self.loss:
+            self.stats.packets_lost += 1
+            return
+        delay = self.latency_ms / 1000
+        if self.jitter_ms:
+            delay += self._random.uniform(-self.jitter_ms, self.jitter_ms) / 1000
+        if self.reorder and self._random.random() < self.reorder:
+            # Hold the packet back long enough for at least one successor to pass it
+            delay += 2 / self.rate
+            self.stats.packets_reordered += 1
+        connection.seq += 1
+        heapq.heappush(
+            connection.queue,
+            (now + max(0, delay), connection.seq, OP_BINARY, self.motion(now)),
+        )
+
+    async def _deliver(self, connection):
+        while not connection.closed:
+            now = time.monotonic()
+            while connection.queue and connection.queue[0][0] <= now:
+                _, _, opcode, payload = heapq.heappop(connection.queue)
+                connection.writer.write(encode_frame(opcode, payload))
+                if opcode == OP_BINARY:
+                    self.stats.packets_sent += 1
+            try:
+                await connection.writer.drain()
+            except ConnectionError:
+                connection.closed = True
+                return
+            if connection.queue:
+                wait = connection.queue[0][0] - time.monotonic()
+            else:
+                wait = 1 / max(self.rate, 100)
+            await asyncio.sleep(max(0, min(wait, 1 / max(self.rate, 100))))
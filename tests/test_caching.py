@@ -0,0 +1,48 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from app.playlist.caching import (
+    BufferingMonitor,
+    BufferingStatistics,
+    caching_options,
+    probe_bitrate,
+    storage_type,
+)
+
+
+def test_probe_bitrate_falls_back_to_size_and_duration():
+    assert probe_bitrate({"format": {"bit_rate": "80000000"}}) == 80_000_000
+    assert probe_bitrate({"format": {"size": "1000000", "duration": "8.0"}}) == 1e6
+    assert probe_bitrate({"format": {}}) is None
+
+
+def test_caching_grows_with_bitrate_and_network_storage():
+    low_local = caching_options(5_000_000, "local")
+    high_local = caching_options(120_000_000, "local")
+    high_network = caching_options(120_000_000, "network")
+    assert low_local.prefetch_buffer_kib == 16384
+    assert high_local.file_caching_ms > low_local.file_caching_ms
+    assert high_local.prefetch_buffer_kib == 120_000_000 / 8 * 4 // 1024
+    assert high_network.file_caching_ms > high_local.file_caching_ms
+    assert high_network.prefetch_read_size > high_local.prefetch_read_size
+    assert ":file-caching=5000" in high_network.media_options()
+
+
+def test_storage_type(tmp_path):
+    assert storage_type("http://example.com/video.mp4") == "stream"
+    assert storage_type(str(tmp_path)) in ("local", "network")
+
+
+class FakeSignals(QObject):
+    buffering = pyqtSignal(object)
+    mediachanged = pyqtSignal(object)
+
+
+def test_buffering_statistics(qtbot):
+    signals = FakeSignals()
+    monitor = BufferingMonitor(listplayer=signals, media_player=signals)
+    for cache in (0, 50, 100, 100, 40, 80, 100):
+        monitor.update(cache)
+    assert isinstance(monitor.stats, BufferingStatistics)
+    assert monitor.stats.startup_ms is not None
+    assert monitor.stats.rebuffer_count == 1
+    assert monitor.stats.min_cache == 40
@@ -0,0 +1,63 @@
+import time
+
+import pytest
+
+from app.client.connect import ConnectAction
+from app.client.controller import IOController
+from app.client.socks import AutoReconnectSocket
+
+
+@pytest.fixture
+def socket(qtbot):
+    socket = AutoReconnectSocket()
+    yield socket
+    socket.disconnect()
+
+
+@pytest.mark.parametrize(
+    "control_server", [{"rate": 60}, {"rate": 250}, {"rate": 1000}], indirect=True
+)
+def test_motion_stream_throughput(qtbot, socket, control_server):
+    io_ctrlr = IOController(socket=socket)
+    received = []
+    socket.binaryMessageReceived.connect(lambda m: received.append(time.monotonic()))
+    socket.connect(control_server.url)
+    qtbot.waitUntil(lambda: len(received) > 0, timeout=5000)
+
+    qtbot.wait(1000)
+    elapsed = received[-1] - received[0]
+    rate = (len(received) - 1) / elapsed
+    assert rate > control_server.rate * 0.5
+    assert len(io_ctrlr.get_new_motion_state()) == 3
+
+
+@pytest.mark.parametrize(
+    "control_server",
+    [{"rate": 100, "latency_ms": 50, "jitter_ms": 10, "loss": 0.2, "seed": 1}],
+    indirect=True,
+)
+def test_motion_stream_with_impairments(qtbot, socket, control_server):
+    received = []
+    socket.binaryMessageReceived.connect(received.append)
+    socket.connect(control_server.url)
+    qtbot.waitUntil(lambda: len(received) >= 20, timeout=5000)
+    assert control_server.stats.packets_lost > 0
+    assert control_server.stats.packets_sent < control_server.stats.packets_generated
+
+
+def test_reconnect_after_server_disconnect(qtbot, socket, control_server):
+    socket.connect(control_server.url)
+    qtbot.waitUntil(lambda: socket.state() == socket.ConnectedState, timeout=5000)
+
+    control_server.drop_connections()
+    qtbot.waitUntil(lambda: control_server.stats.connections == 2, timeout=5000)
+    qtbot.waitUntil(lambda: socket.state() == socket.ConnectedState, timeout=5000)
+    assert control_server.stats.forced_disconnects == 1
+
+
+def test_connect_action_uses_configured_url(qtbot, socket, local_control_server):
+    action = ConnectAction(socket=socket, parent=None)
+    action.trigger()
+    qtbot.waitUntil(lambda: socket.state() == socket.ConnectedState, timeout=5000)
+    qtbot.waitUntil(lambda: local_control_server.connection_count() == 1)
+    assert action.isChecked()
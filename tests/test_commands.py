@@ -0,0 +1,153 @@
+import json
+
+import pytest
+from PyQt5.QtGui import QStandardItem, QStandardItemModel
+
+from app.client.commands import CommandDispatcher
+from app.client.controller import IOController
+from app.client.socks import AutoReconnectSocket
+
+from .simulator import OP_TEXT
+
+
+class FakeMediaPlayer:
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((name,) + args)
+
+    def has_media(self):
+        return True
+
+
+class FakeListPlayer:
+    def __init__(self):
+        self.loaded = []
+
+    def item(self):
+        return None
+
+    def load_media(self, index):
+        self.loaded.append(index.row())
+        return True
+
+
+class FakePlaylistWidget:
+    def __init__(self, rows):
+        self._model = QStandardItemModel()
+        for n in range(rows):
+            self._model.appendRow(QStandardItem(str(n)))
+        self.view = self
+
+    def model(self):
+        return self._model
+
+    def add_media(self, paths):
+        for path in paths:
+            self._model.appendRow(QStandardItem(path))
+
+
+class FakeVolumeManager:
+    volume = None
+
+    def set_volume(self, value):
+        self.volume = value
+
+
+class FakeLoopModeManager:
+    mode = "off"
+
+    def set_mode(self, mode):
+        if mode not in ("off", "one", "all"):
+            raise ValueError(f"Unknown loop mode '{mode}'")
+        self.mode = mode
+
+
+def create_dispatcher(socket):
+    return CommandDispatcher(
+        io_ctrlr=IOController(socket=socket),
+        listplayer=FakeListPlayer(),
+        media_player=FakeMediaPlayer(),
+        playlist_widget=FakePlaylistWidget(rows=3),
+        vol_mngr=FakeVolumeManager(),
+        loop_mode_mngr=FakeLoopModeManager(),
+    )
+
+
+def received_acks(control_server):
+    messages = [json.loads(d) for op, d in control_server.received if op == OP_TEXT]
+    return [m for m in messages if m["type"] == "ack"]
+
+
+def test_commands_batch_is_acknowledged(qtbot, control_server):
+    socket = AutoReconnectSocket()
+    dispatcher = create_dispatcher(socket)
+    socket.connect(control_server.url)
+    qtbot.waitUntil(lambda: control_server.connection_count() == 1, timeout=5000)
+
+    commands = [
+        {"id": "1", "name": "select_index", "args": {"index": 2}},
+        {"id": "2", "name": "seek", "args": {"time_ms": 1500}},
+        {"id": "3", "name": "set_volume", "args": {"volume": 80}},
+        {"id": "4", "name": "set_loop_mode", "args": {"mode": "sideways"}},
+        {"id": "5", "name": "seek", "args": {"time_ms": "soon"}},
+        {"id": "6", "name": "eject"},
+    ]
+    message = {"type": "commands", "commands": commands}
+    control_server.broadcast(OP_TEXT, json.dumps(message).encode())
+    qtbot.waitUntil(lambda: len(received_acks(control_server)) == 1, timeout=5000)
+
+    results = received_acks(control_server)[0]["results"]
+    assert [r["ok"] for r in results] == [True, True, True, False, False, False]
+    assert dispatcher.lp.loaded == [2]
+    assert ("set_time", 1500) in dispatcher.mp.calls
+    assert dispatcher.vol_mngr.volume == 80
+    assert dispatcher.loop_mode_mngr.mode == "off"
+    socket.disconnect()
+
+
+def test_resent_commands_run_once(qtbot):
+    dispatcher = create_dispatcher(AutoReconnectSocket())
+    command = {"id": "a", "name": "select_index", "args": {"index": 1}}
+    first = dispatcher.execute(command)
+    second = dispatcher.execute(command)
+    assert first == second == {"id": "a", "ok": True}
+    assert dispatcher.lp.loaded == [1]
+
+
+@pytest.mark.parametrize(
+    "command, error",
+    [
+        ({"id": "1", "name": ["x"]}, "Command name must be str"),
+        ({"id": "2", "name": "select_index", "args": "index"}, "must be dict"),
+        ({"id": {"a": 1}, "name": "play"}, "Command id must be str or int"),
+        ({"id": "3", "name": "load_playlist", "args": {"paths": [1, 2]}}, "of str"),
+        (["play"], "Missing command id"),
+    ],
+    ids=["name_list", "args_str", "id_dict", "paths_int", "not_dict"],
+)
+def test_malformed_commands_are_rejected(qtbot, command, error):
+    dispatcher = create_dispatcher(AutoReconnectSocket())
+    result = dispatcher.execute(command)
+    assert result["ok"] is False
+    assert error in result["error"]
+    assert dispatcher.mp.calls == []
+    assert dispatcher.playlist_widget.view.model().rowCount() == 3
+
+
+def test_malformed_message_is_acknowledged(qtbot, control_server):
+    socket = AutoReconnectSocket()
+    create_dispatcher(socket)
+    with qtbot.waitSignal(socket.connected, timeout=5000):
+        socket.connect(control_server.url)
+    qtbot.waitUntil(lambda: control_server.connection_count() == 1, timeout=5000)
+
+    commands = [{"id": "1", "name": ["x"]}, {"id": {"a": 1}, "name": "play"}]
+    message = {"type": "commands", "commands": commands}
+    control_server.broadcast(OP_TEXT, json.dumps(message).encode())
+    qtbot.waitUntil(lambda: len(received_acks(control_server)) == 1, timeout=5000)
+
+    results = received_acks(control_server)[0]["results"]
+    assert [(r["id"], r["ok"]) for r in results] == [("1", False), (None, False)]
+    socket.disconnect()
@@ -0,0 +1,77 @@
+import pytest
+from PyQt5.QtCore import QSettings
+
+from app import config
+
+
+def test_changed_signal_and_deferred_sync(qtbot, state, tmp_path):
+    changes = []
+    state.signal("loop_mode").connect(changes.append)
+    state.loop_mode = "all"
+    state.loop_mode = "all"
+    state.loop_mode = "one"
+    assert changes == ["all", "one"]
+    assert state.loop_mode == "one"
+
+    path = tmp_path / "settings.ini"
+    assert not path.exists()
+    qtbot.waitUntil(path.exists, timeout=2000)
+    assert "loop_mode=one" in path.read_text()
+
+
+def test_invalid_value_is_rejected(state):
+    with pytest.raises(ValueError):
+        state.loop_mode = "sideways"
+
+
+def test_invalid_stored_value_reads_as_default(state):
+    state.settings.setValue("loop_mode", "sideways")
+    assert state.loop_mode == config.schema["loop_mode"]["default"]
+    assert state.settings.value("loop_mode") == state.loop_mode
+
+
+def test_values_are_cached_as_schema_type(state):
+    state.vlc_file_caching = 1500.0
+    assert state.vlc_file_caching == 1500
+    assert type(state.vlc_file_caching) is int
+    state.meta_tags = ("title", "duration")
+    assert state.meta_tags == ["title", "duration"]
+
+
+def test_cache_and_disk_agree(state, tmp_path):
+    state.stay_on_top = "false"
+    state.audio_eq_selected_user_preset = None
+    state.vlc_file_caching = "1500"
+    cached = (
+        state.stay_on_top,
+        state.audio_eq_selected_user_preset,
+        state.vlc_file_caching,
+    )
+    assert cached == (False, None, 1500)
+
+    state.sync()
+    state.load(QSettings(str(tmp_path / "settings.ini"), QSettings.IniFormat))
+    stored = (
+        state.stay_on_top,
+        state.audio_eq_selected_user_preset,
+        state.vlc_file_caching,
+    )
+    assert stored == cached
+
+
+def test_reads_are_served_from_cache(state, monkeypatch):
+    reads = []
+    value = state.settings.value
+
+    def counted_value(key, *args, **kwargs):
+        reads.append(key)
+        return value(key, *args, **kwargs)
+
+    monkeypatch.setattr(state.settings, "value", counted_value)
+    for _ in range(100):
+        assert state.meta_tags[0] == "title"
+    assert reads == ["meta_tags"]
+
+    state.meta_tags = ["duration", "title"]
+    assert state.meta_tags[0] == "duration"
+    assert reads == ["meta_tags"]
@@ -0,0 +1,86 @@
+from PyQt5.QtCore import Qt
+
+from app.playlist import enrich
+from app.playlist.enrich import derived_fields
+from app.playlist.model import MediaItem, PlaylistModel
+
+from .library import MediaSpec, synthetic_probe
+
+
+def test_derived_fields_are_readable():
+    spec = MediaSpec(
+        title="Clip",
+        width=7680,
+        height=3840,
+        frame_rate="30000/1001",
+        duration=3725.4,
+        spherical=True,
+        bit_rate=85_000_000,
+        tags={},
+    )
+    assert derived_fields(synthetic_probe("clip.mp4", spec)) == {
+        "duration": "1:02:05",
+        "resolution": "7680x3840",
+        "fps": "29.97",
+        "bitrate": "85.0 Mb/s",
+        "codec": "H264",
+        "projection": "Equirectangular",
+    }
+    flat = spec._replace(frame_rate="25/1", duration=65, spherical=False)
+    fields = derived_fields(synthetic_probe("clip.mp4", flat))
+    assert (fields["duration"], fields["fps"], fields["projection"]) == (
+        "1:05",
+        "25",
+        "Flat",
+    )
+    live = synthetic_probe("clip.mp4", spec)
+    live["format"]["duration"] = live["streams"][0]["duration"] = "inf"
+    assert "duration" not in derived_fields(live)
+
+
+def test_model_fills_derived_columns_in_ranges(qtbot, state, synthetic_library):
+    library = synthetic_library(count=200)
+    model = PlaylistModel()
+    changes = []
+    model.dataChanged.connect(lambda first, last, roles: changes.append((first, last)))
+    for path in library.paths:
+        model.appendRow(MediaItem(path))
+
+    def enriched():
+        return all(model.item(r).data(MediaItem.DerivedRole) for r in range(200))
+
+    qtbot.waitUntil(enriched, timeout=5000)
+
+    assert model.enricher.ranges_emitted == len(changes)
+    assert 0 < len(changes) < 200
+    columns = [state.meta_tags.index(key) for key in ("duration", "projection")]
+    assert all(first.column() == min(columns) for first, _ in changes)
+    assert all(last.column() == max(columns) for _, last in changes)
+    rows = [range(first.row(), last.row() + 1) for first, last in changes]
+    assert {row for r in rows for row in r} == set(range(200))
+
+    column = state.meta_tags.index("resolution")
+    stream = library.probe(library.paths[7])["streams"][0]
+    resolution = model.data(model.index(7, column), Qt.DisplayRole)
+    assert resolution == f"{stream['width']}x{stream['height']}"
+
+
+def test_enricher_survives_failing_items(qtbot, state, synthetic_library, monkeypatch):
+    library = synthetic_library(count=4)
+    bad_path = library.paths[1]
+
+    def failing_derived_fields(probe):
+        if probe["format"]["filename"] == bad_path:
+            raise OverflowError("cannot convert float infinity to integer")
+        return derived_fields(probe)
+
+    monkeypatch.setattr(enrich, "derived_fields", failing_derived_fields)
+    model = PlaylistModel()
+    for path in library.paths[:3]:
+        model.appendRow(MediaItem(path))
+    qtbot.waitUntil(lambda: model.item(2).data(MediaItem.DerivedRole) is not None)
+    assert model.item(1).data(MediaItem.DerivedRole) is None
+
+    # The worker is still available for later rows
+    model.appendRow(MediaItem(library.paths[3]))
+    qtbot.waitUntil(lambda: model.item(3).data(MediaItem.DerivedRole) is not None)
@@ -0,0 +1,76 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtWidgets import QApplication, QMainWindow
+
+from app.output.frame import MediaPlayerContentFrame
+from app.vlcqt import FrameCallbacks
+
+
+class FakeMediaPlayer:
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append(name)
+
+
+def test_fullscreen_keeps_video_surface(qtbot):
+    main_win = QMainWindow()
+    qtbot.addWidget(main_win)
+    player = FakeMediaPlayer()
+    frame = MediaPlayerContentFrame(
+        main_win=main_win, frame_size_mngr=None, media_player=player
+    )
+    main_win.setCentralWidget(frame)
+    main_win.show()
+    qtbot.waitExposed(main_win)
+    surface = frame.video_surface
+    wid = int(surface.winId())
+
+    frame.start_fullscreen(QApplication.primaryScreen(), text="Fullscreen")
+    assert surface.parent() is None
+    assert surface.isVisible()
+    frame.stop_fullscreen()
+
+    # The same native window is moved, so the player is never stopped or reopened
+    assert int(surface.winId()) == wid
+    assert surface.parent() is main_win.windowHandle()
+    assert player.calls == ["set_output_widget"]
+    assert frame.layout().currentWidget() is frame.output_widget
+
+
+class FakeCallbackPlayer:
+    def video_set_callbacks(self, lock, unlock, display, opaque):
+        pass
+
+    def video_set_format(self, chroma, width, height, pitch):
+        pass
+
+
+class FakeViewpointManager(QObject):
+    updatedviewpoint = pyqtSignal(float, float, float)
+
+
+class FakeMediaItem:
+    def __init__(self, spherical):
+        self.spherical = spherical
+
+    def is_spherical(self):
+        return self.spherical
+
+
+def test_decoder_output_projects_spherical_media(qtbot):
+    main_win = QMainWindow()
+    qtbot.addWidget(main_win)
+    frame = MediaPlayerContentFrame(
+        main_win=main_win,
+        frame_size_mngr=None,
+        media_player=None,
+        frame_callbacks=FrameCallbacks(media_player=FakeCallbackPlayer()),
+        viewpoint_mngr=FakeViewpointManager(),
+    )
+    painter = frame.output_widget
+    assert not painter.spherical
+    frame.on_mediachanged(FakeMediaItem(spherical=True))
+    assert painter.spherical
+    frame.on_mediachanged(FakeMediaItem(spherical=False))
+    assert not painter.spherical
@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtWidgets import QWidget
+
+from app.output import hud
+
+
+class FakeMedia:
+    def __init__(self):
+        self.decoded = self.displayed = self.lost = 0
+
+    def get_stats(self, stats):
+        stats.decoded_video = self.decoded
+        stats.displayed_pictures = self.displayed
+        stats.lost_pictures = self.lost
+        return True
+
+
+class FakeMediaPlayer(QObject):
+    buffering = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.media = FakeMedia()
+
+    def get_media(self):
+        return self.media
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+
+def make_monitor(monkeypatch, rate=4):
+    clock = FakeClock()
+    monkeypatch.setattr(hud, "time", clock)
+    mp = FakeMediaPlayer()
+    io_ctrlr = SimpleNamespace(motion_packets=0)
+    viewpoint_mngr = SimpleNamespace(motion_latency_ms=None)
+    monitor = hud.PerformanceMonitor(mp, io_ctrlr, viewpoint_mngr, rate=rate)
+    return monitor, clock, mp, io_ctrlr, viewpoint_mngr
+
+
+def test_monitor_samples_rates_and_lag(qtbot, monkeypatch):
+    monitor, clock, mp, io_ctrlr, viewpoint_mngr = make_monitor(monkeypatch)
+    monitor.start()
+    monitor.sample()  # First tick only sets the baseline
+    assert monitor.latest is None
+
+    mp.media.decoded, mp.media.displayed, mp.media.lost = 30, 25, 5
+    io_ctrlr.motion_packets = 60
+    viewpoint_mngr.motion_latency_ms = 12.5
+    mp.buffering.emit(SimpleNamespace(value=80.0))
+    clock.now += 0.5  # Fired 250ms late at 4/s
+    with qtbot.waitSignal(monitor.sampled) as blocker:
+        monitor.sample()
+
+    sample = blocker.args[0]
+    assert sample.decode_fps == 60
+    assert sample.display_fps == 50
+    assert sample.dropped_frames == 5
+    assert sample.buffering == 80
+    assert sample.motion_rate == 120
+    assert sample.motion_latency_ms == 12.5
+    assert sample.loop_lag_ms == 250
+    monitor.stop()
+    assert not monitor.is_active()
+
+
+def test_overlay_shows_samples_only_while_enabled(qtbot, monkeypatch):
+    monitor, clock, mp, io_ctrlr, viewpoint_mngr = make_monitor(monkeypatch)
+    frame = QWidget()
+    qtbot.addWidget(frame)
+    overlay = hud.PerformanceOverlay(monitor, parent=frame)
+    frame.show()
+    assert not overlay.isVisible()
+
+    overlay.set_enabled(True)
+    assert overlay.isVisible() and monitor.is_active()
+    monitor.sample()
+    clock.now += 0.25
+    monitor.sample()
+    assert overlay.width() > 0 and overlay.height() > 0
+    assert overlay._lines == monitor.latest.lines()
+    assert "latency       - ms" in overlay._lines
+
+    overlay.set_enabled(False)
+    assert not overlay.isVisible() and not monitor.is_active()
@@ -0,0 +1,59 @@
+import qtawesome as qta
+from PyQt5.QtCore import QRect, QSize
+from PyQt5.QtGui import QIcon, QPainter, QPixmap
+
+from app.gui import icons
+
+
+def test_icons_are_built_once(qtbot):
+    assert icons.get("stop") is icons.get("stop")
+    volume = icons.get("volume_button")
+    assert set(volume) == {"mute", "low", "medium", "high"}
+
+
+def test_pixmaps_are_cached(qtbot):
+    cache = icons.IconPixmapCache()
+    icon = QIcon(icons.CachedIconEngine("stop", qta.icon("mdi.stop"), cache))
+    first = icon.pixmap(QSize(24, 24))
+    second = icon.pixmap(QSize(24, 24))
+    icon.pixmap(QSize(24, 24), QIcon.Disabled)
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert first.cacheKey() == second.cacheKey()
+
+
+def test_pixmaps_persist_on_disk(qtbot, tmp_path):
+    qta_icon = qta.icon("mdi.play")
+    cache = icons.IconPixmapCache(directory=tmp_path)
+    cache.pixmap("play", qta_icon, QSize(32, 32), QIcon.Normal, QIcon.Off, 2.0)
+    saved = list(tmp_path.glob("*/play-32x32-0-1@2x.png"))
+    assert len(saved) == 1
+    assert QPixmap(str(saved[0])).size() == QSize(64, 64)
+
+    next_run = icons.IconPixmapCache(directory=tmp_path)
+    pixmap = next_run.pixmap(
+        "play", qta_icon, QSize(32, 32), QIcon.Normal, QIcon.Off, 2.0
+    )
+    assert next_run.disk_hits == 1
+    assert pixmap.devicePixelRatio() == 2.0
+
+
+class CountingIcon(QIcon):
+    def __init__(self, icon):
+        super().__init__(icon)
+        self.renders = 0
+
+    def pixmap(self, *args):
+        self.renders += 1
+        return super().pixmap(*args)
+
+
+def test_cached_icon_renders_once(qtbot):
+    source = CountingIcon(qta.icon("mdi.play"))
+    cached = QIcon(icons.CachedIconEngine("play", source, icons.IconPixmapCache()))
+    target = QPixmap(24, 24)
+    painter = QPainter(target)
+    for _ in range(10):
+        cached.pixmap(QSize(24, 24))
+        cached.paint(painter, QRect(0, 0, 24, 24))
+    painter.end()
+    assert source.renders == 1
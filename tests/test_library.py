@@ -0,0 +1,40 @@
+import os
+
+from app.playlist.caching import probe_bitrate
+from app.playlist.model import MediaItem
+
+from .library import SyntheticLibrary
+
+
+def test_library_links_sources_with_varied_metadata(tmp_path, media_dir):
+    sources = sorted(p for p in media_dir.iterdir() if p.suffix == ".mp4")
+    library = SyntheticLibrary(tmp_path, sources, count=200, seed=1).generate()
+
+    assert len(library.paths) == 200
+    assert all(os.path.realpath(p) in map(str, sources) for p in library.paths)
+    probes = [library.probe(p) for p in library.paths]
+    video_streams = [probe["streams"][0] for probe in probes]
+    assert len({(s["width"], s["height"]) for s in video_streams}) > 1
+    assert len({s["avg_frame_rate"] for s in video_streams}) > 1
+    assert len({probe["format"]["duration"] for probe in probes}) > 1
+    spherical = sum("side_data_list" in s for s in video_streams)
+    assert 0 < spherical < 200
+
+    # Same seed, same library
+    again = SyntheticLibrary(tmp_path / "again", sources, count=200, seed=1).generate()
+    streams = [probe["streams"] for probe in again.probes.values()]
+    assert streams == [probe["streams"] for probe in probes]
+
+
+def test_media_items_read_synthetic_metadata(synthetic_library):
+    library = synthetic_library(count=20, spherical_ratio=1.0)
+    item = MediaItem(library.paths[0])
+    probe = library.probe(library.paths[0])
+
+    assert item.title() == probe["format"]["tags"]["title"]
+    assert item.is_spherical()
+    assert item.size() == (probe["streams"][0]["width"], probe["streams"][0]["height"])
+    info = item.info()
+    assert info["nb_frames"] == int(probe["streams"][0]["nb_frames"])
+    assert info["avg_frame_rate"] > 0
+    assert probe_bitrate(probe) == int(probe["format"]["bit_rate"])
@@ -0,0 +1,76 @@
+import json
+import logging
+
+from app.utils.logs import JsonFormatter, span, start_queue_logging
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def make_logger(name, level):
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+    logger.propagate = False
+    handler = ListHandler()
+    logger.addHandler(handler)
+    return logger, handler
+
+
+def test_json_formatter_includes_extra_fields():
+    record = logging.makeLogRecord(
+        {
+            "name": "app.test",
+            "levelno": logging.INFO,
+            "levelname": "INFO",
+            "msg": "SEEK %s",
+            "args": (1000,),
+            "span": "seek",
+            "duration_ms": 1.5,
+        }
+    )
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry["message"] == "SEEK 1000"
+    assert entry["logger"] == "app.test"
+    assert entry["level"] == "INFO"
+    assert entry["span"] == "seek"
+    assert entry["duration_ms"] == 1.5
+    assert "args" not in entry and "msg" not in entry
+
+
+def test_queue_logging_delivers_to_handlers():
+    logger = logging.getLogger("tests.test_logs.queue")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    handler = ListHandler()
+    listener = start_queue_logging([handler], logger=logger)
+    try:
+        logger.info("one")
+        logger.info("two")
+    finally:
+        listener.stop()
+        logger.handlers.clear()
+    assert [r.getMessage() for r in handler.records] == ["one", "two"]
+
+
+def test_span_is_silent_without_debug():
+    logger, handler = make_logger("tests.test_logs.info", logging.INFO)
+    with span(logger, "seek", time_ms=1000):
+        pass
+    assert handler.records == []
+
+
+def test_span_logs_duration_and_fields():
+    logger, handler = make_logger("tests.test_logs.debug", logging.DEBUG)
+    with span(logger, "seek", time_ms=1000):
+        pass
+    (record,) = handler.records
+    assert record.span == "seek"
+    assert record.time_ms == 1000
+    assert record.duration_ms >= 0
+    assert record.getMessage().startswith("SPAN seek duration_ms=")
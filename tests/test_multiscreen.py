@@ -0,0 +1,37 @@
+import pytest
+from PyQt5.QtCore import QRect
+
+from app.output.multiscreen import ViewOffset, screen_views
+
+
+class FakeScreen:
+    def __init__(self, name, x):
+        self.name = name
+        self._geometry = QRect(x, 0, 1920, 1080)
+
+    def geometry(self):
+        return self._geometry
+
+
+@pytest.fixture
+def screens():
+    return [FakeScreen("right", 3840), FakeScreen("left", 0), FakeScreen("front", 1920)]
+
+
+def test_span_turns_screens_left_to_right(screens):
+    views = screen_views(screens, mode="span", fov=80)
+    assert [(s.name, offset) for s, offset in views] == [
+        ("left", ViewOffset(yaw=-80)),
+        ("front", ViewOffset(yaw=0)),
+        ("right", ViewOffset(yaw=80)),
+    ]
+
+
+def test_mirror_shows_same_view(screens):
+    views = screen_views(screens, mode="mirror", fov=80)
+    assert {offset for _, offset in views} == {ViewOffset()}
+
+
+def test_unknown_mode(screens):
+    with pytest.raises(ValueError):
+        screen_views(screens, mode="tile", fov=80)
@@ -0,0 +1,22 @@
+from app.utils.profiling import StartupProfiler
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = StartupProfiler()
+    with profiler.phase("phase"):
+        pass
+    profiler.mark("mark")
+    assert profiler.records == []
+
+
+def test_nested_phases_are_reported_in_start_order():
+    profiler = StartupProfiler()
+    profiler.enable()
+    with profiler.phase("outer"):
+        with profiler.phase("inner"):
+            pass
+    profiler.mark("first frame")
+    lines = profiler.report().splitlines()
+    assert [line.split()[-1] for line in lines[1:]] == ["outer", "inner", "frame"]
+    assert lines[2].endswith("  inner")
+    assert [depth for depth, *_ in profiler.records] == [1, 0, 0]
@@ -0,0 +1,50 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from app.output.size import FrameSizeManager
+
+
+class FakeListPlayer(QObject):
+    mediachanged = pyqtSignal(object)
+
+    def item(self):
+        return None
+
+
+class FakeMainWindow:
+    def __init__(self):
+        self.resizes = []
+
+    def resize_to_media(self, media_w, media_h, scale):
+        self.resizes.append((media_w, media_h, scale))
+
+
+class FakeViewpointManager:
+    def __init__(self):
+        self.redraws = 0
+
+    def trigger_redraw(self):
+        self.redraws += 1
+
+
+def test_resize_requests_are_debounced(qtbot):
+    main_win = FakeMainWindow()
+    viewpoint_mngr = FakeViewpointManager()
+    frame_size_mngr = FrameSizeManager(
+        main_win=main_win, viewpoint_mngr=viewpoint_mngr, listplayer=FakeListPlayer()
+    )
+    scales = []
+    frame_size_mngr.mediaframeresized.connect(scales.append)
+
+    frame_size_mngr.update_frame_size(width=3840, height=1920)
+    for scale in (0.25, 0.5, 1, 2, 0.5):
+        frame_size_mngr.update_frame_size(scale=scale)
+    qtbot.waitUntil(lambda: bool(main_win.resizes))
+    qtbot.wait(frame_size_mngr.resize_delay * 2)
+
+    assert main_win.resizes == [(3840, 1920, 0.5)]
+    assert scales == [0.5]
+    assert viewpoint_mngr.redraws == 1
+
+    frame_size_mngr.update_frame_size()  # Falls back to the default size and scale
+    qtbot.waitUntil(lambda: len(main_win.resizes) == 2)
+    assert main_win.resizes[-1] == (600, 360, 1)
@@ -0,0 +1,88 @@
+import os
+import time
+
+import pytest
+from PyQt5.QtWidgets import QWidget
+
+from app.gui.style import StyleSheetError, compile_stylesheet, load_stylesheet
+
+
+def test_compile_stylesheet_minifies_and_drops_dead_rules():
+    source = """
+    /* Buttons */
+    QToolButton,
+    QAction {
+        border: 1px solid palette(shadow);
+        background-color : palette(window) ;
+    }
+
+    QAction::title { font-size: 11pt; }
+    CustomWidget > QLabel#title { color: red; }
+    QLabel {}
+    """
+    compiled = compile_stylesheet(source, known_types=["CustomWidget"])
+    assert compiled == (
+        "QToolButton{border:1px solid palette(shadow);"
+        "background-color:palette(window)}\n"
+        "CustomWidget > QLabel#title{color:red}"
+    )
+
+
+def test_compile_stylesheet_keeps_separators_in_strings():
+    source = 'QLabel { background: url("a;b.png"); color: red }'
+    compiled = compile_stylesheet(source)
+    assert compiled == 'QLabel{background:url("a;b.png");color:red}'
+
+
+def test_compile_stylesheet_ignores_attribute_selector_values():
+    source = """
+    QPushButton[text="Hello World"] { color: red; }
+    QLabel[text="Hello, World"] QPushButton { color: blue; }
+    """
+    assert compile_stylesheet(source) == (
+        'QPushButton[text="Hello World"]{color:red}\n'
+        'QLabel[text="Hello, World"] QPushButton{color:blue}'
+    )
+
+
+class StyledPanel(QWidget):
+    pass
+
+
+def test_compile_stylesheet_keeps_rules_for_app_widgets():
+    source = """
+    StyledPanel > QLabel { color: red; }
+    NotImportedPanel { color: blue; }
+    QAction { color: green; }
+    """
+    assert compile_stylesheet(source) == (
+        "StyledPanel > QLabel{color:red}\nNotImportedPanel{color:blue}"
+    )
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "QLabel { color: red;",
+        "QLabel { color }",
+        "{ color: red }",
+        "/* QLabel",
+        'QLabel { background: url("a.png); }',
+    ],
+)
+def test_compile_stylesheet_rejects_invalid(source):
+    with pytest.raises(StyleSheetError):
+        compile_stylesheet(source)
+
+
+def test_load_stylesheet_prefers_up_to_date_compiled(tmp_path):
+    source_path = tmp_path / "dark.qss"
+    source_path.write_text("QLabel { color: red; }")
+    assert load_stylesheet(str(tmp_path), "dark") == "QLabel{color:red}"
+
+    (tmp_path / "dark.min.qss").write_text("QLabel{color:blue}")
+    assert load_stylesheet(str(tmp_path), "dark") == "QLabel{color:blue}"
+
+    stale = time.time() + 10
+    os.utime(source_path, (stale, stale))
+    assert load_stylesheet(str(tmp_path), "dark") == "QLabel{color:red}"
@@ -0,0 +1,94 @@
+import time
+
+import pytest
+
+from app.client.controller import IOController
+from app.client.socks import AutoReconnectSocket
+from app.client.sync import ClockOffsetEstimator, PlaybackSynchronizer
+
+
+class FakeMediaPlayer:
+    """Player whose clock runs at `speed` times real time, like a drifting decoder"""
+
+    def __init__(self, speed=1.0, start_ms=0):
+        self.speed = speed
+        self.rate = 1.0
+        self.playing = False
+        self._base_ms = start_ms
+        self._base_wall = time.monotonic()
+
+    def _rebase(self):
+        self._base_ms = self.get_time()
+        self._base_wall = time.monotonic()
+
+    def get_time(self):
+        if not self.playing:
+            return int(self._base_ms)
+        elapsed = (time.monotonic() - self._base_wall) * 1000
+        return int(self._base_ms + elapsed * self.speed * self.rate)
+
+    def set_time(self, ms):
+        self._base_ms = ms
+        self._base_wall = time.monotonic()
+
+    def set_rate(self, rate):
+        self._rebase()
+        self.rate = rate
+
+    def is_playing(self):
+        return self.playing
+
+    def play(self):
+        self._rebase()
+        self.playing = True
+
+    def set_pause(self, pause):
+        self._rebase()
+        self.playing = not pause
+
+
+def test_clock_offset_estimator_prefers_lowest_delay():
+    estimator = ClockOffsetEstimator(window=4)
+    # True offset is +500ms, the second exchange was held up on the way back
+    estimator.add_exchange(t0=0, t1=510, t2=511, t3=21)
+    estimator.add_exchange(t0=100, t1=605, t2=606, t3=300)
+    assert estimator.delay() == 20
+    assert estimator.offset() == 500
+
+
+@pytest.mark.parametrize(
+    "control_server", [{"clock_offset_ms": 250000, "latency_ms": 5}], indirect=True
+)
+def test_players_converge_on_master_clock(qtbot, control_server):
+    players = [
+        FakeMediaPlayer(speed=1.0),
+        FakeMediaPlayer(speed=1.02, start_ms=700),
+        FakeMediaPlayer(speed=0.98, start_ms=5000),
+    ]
+    sockets, synchronizers = [], []
+    for mp in players:
+        socket = AutoReconnectSocket()
+        synchronizer = PlaybackSynchronizer(
+            io_ctrlr=IOController(socket=socket),
+            media_player=mp,
+            tolerance_ms=40,
+            check_interval_ms=50,
+            correction_period_ms=500,
+        )
+        synchronizer.set_enabled(True)
+        socket.connect(control_server.url)
+        sockets.append(socket)
+        synchronizers.append(synchronizer)
+
+    qtbot.waitUntil(lambda: control_server.connection_count() == 3, timeout=5000)
+    control_server.start_master_clock(interval=0.2, media_time=10000)
+    qtbot.waitUntil(lambda: all(mp.is_playing() for mp in players), timeout=5000)
+    qtbot.wait(3000)
+
+    for synchronizer in synchronizers:
+        drift = synchronizer.mp.get_time() - synchronizer.expected_time()
+        assert abs(drift) < 100, synchronizer.stats.as_dict()
+    assert synchronizers[2].stats.seeks >= 1
+
+    for socket in sockets:
+        socket.disconnect()
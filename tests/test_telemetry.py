@@ -0,0 +1,110 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from app.client.socks import AutoReconnectSocket
+from app.client.telemetry import (
+    MAX_BATCH_SAMPLES,
+    SAMPLE,
+    TelemetryReporter,
+    TelemetrySample,
+    decode_batch,
+    encode_batch,
+)
+
+from .simulator import OP_BINARY
+
+
+class FakeMediaPlayer(QObject):
+    buffering = pyqtSignal(object)
+
+    def get_media(self):
+        return None
+
+    def get_time(self):
+        return 1234
+
+    def get_state(self):
+        return 3
+
+
+class FakeViewpointManager(QObject):
+    updatedviewpoint = pyqtSignal(float, float, float)
+
+
+def test_batch_round_trip():
+    samples = [
+        TelemetrySample(
+            elapsed_ms=n * 100,
+            time_ms=n * 40 - 1,
+            state=3,
+            buffering=100,
+            fps=29.97,
+            dropped_frames=n,
+            yaw=-179.5,
+            pitch=45.25,
+            roll=0.0,
+            cpu=87.5,
+        )
+        for n in range(MAX_BATCH_SAMPLES)
+    ]
+    payload = encode_batch(samples)
+    assert len(payload) == 4 + SAMPLE.size * MAX_BATCH_SAMPLES
+    assert decode_batch(payload) == samples
+
+
+def test_reporter_sends_batches(qtbot, control_server):
+    socket = AutoReconnectSocket()
+    mp = FakeMediaPlayer()
+    viewpoint_mngr = FakeViewpointManager()
+    reporter = TelemetryReporter(
+        socket=socket,
+        media_player=mp,
+        viewpoint_mngr=viewpoint_mngr,
+        sample_rate=50,
+        flush_interval=100,
+    )
+    reporter.set_enabled(True)
+    viewpoint_mngr.updatedviewpoint.emit(10.0, -20.0, 5.0)
+    socket.connect(control_server.url)
+
+    def received_batches():
+        return [data for opcode, data in control_server.received if opcode == OP_BINARY]
+
+    qtbot.waitUntil(lambda: len(received_batches()) >= 3, timeout=5000)
+    samples = [s for batch in received_batches() for s in decode_batch(batch)]
+    assert samples[-1].time_ms == 1234
+    assert (samples[-1].yaw, samples[-1].pitch, samples[-1].roll) == (10, -20, 5)
+    assert reporter.dropped_samples == 0
+    socket.disconnect()
+
+
+def test_reporter_holds_batches_under_back_pressure(qtbot, control_server):
+    socket = AutoReconnectSocket()
+    reporter = TelemetryReporter(
+        socket=socket,
+        media_player=FakeMediaPlayer(),
+        viewpoint_mngr=FakeViewpointManager(),
+        max_queued_samples=10,
+    )
+    with qtbot.waitSignal(socket.connected, timeout=5000):
+        socket.connect(control_server.url)
+
+    def received_batches():
+        return [data for opcode, data in control_server.received if opcode == OP_BINARY]
+
+    reporter.pending_bytes = reporter.max_pending_bytes
+    for _ in range(15):
+        reporter.sample()
+    reporter.flush()
+    qtbot.wait(200)
+    assert len(reporter.samples) == 10
+    assert reporter.dropped_samples == 5
+    assert reporter.sent_batches == 0
+    assert received_batches() == []
+
+    reporter.pending_bytes = 0
+    reporter.flush()
+    assert reporter.sent_batches == 1
+    assert not reporter.samples
+    qtbot.waitUntil(lambda: len(received_batches()) == 1, timeout=5000)
+    assert len(decode_batch(received_batches()[0])) == 10
+    socket.disconnect()
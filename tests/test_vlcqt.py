@@ -0,0 +1,267 @@
+import ctypes
+import threading
+
+import pytest
+import vlc
+
+from app.vlcqt import (
+    DecodeBenchmarkResult,
+    FrameBufferRing,
+    FrameCallbacks,
+    InstanceOptions,
+    recommend_decode_profile,
+)
+from app.vlcqt._facades import _VlcObjectFacade
+from app.vlcqt._signals import MediaPlayerVlclibSignals
+
+
+def test_instance_options_args():
+    options = InstanceOptions(
+        decode_profile="software",
+        avcodec_threads=4,
+        skip_loop_filter=4,
+        file_caching_ms=3000,
+        extra_args=("--file-caching=5000",),
+    )
+    assert options.args() == [
+        "--avcodec-hw=none",
+        "--avcodec-threads=4",
+        "--avcodec-skiploopfilter=4",
+        "--file-caching=3000",
+        "--file-caching=5000",
+    ]
+
+
+def test_default_instance_options_only_set_decoder():
+    assert InstanceOptions().args() == ["--avcodec-hw=any"]
+
+
+def test_recommend_decode_profile():
+    results = [
+        DecodeBenchmarkResult("auto", "a.mp4", 5, 150, 150, 0, 40.0),
+        DecodeBenchmarkResult("software", "a.mp4", 5, 150, 140, 10, 90.0),
+        DecodeBenchmarkResult("vaapi", "a.mp4", 5, 150, 150, 0, 15.0),
+        DecodeBenchmarkResult("vaapi", "b.mp4", 0, 0, 0, 0, 0, "Playback error"),
+        DecodeBenchmarkResult("vdpau", "a.mp4", 5, 150, 150, 0, 20.0),
+    ]
+    assert recommend_decode_profile(results) == "vdpau"
+    assert recommend_decode_profile(results[3:4]) is None
+
+
+class FakeVlcMediaPlayer:
+    def get_position(self):
+        return 0.5
+
+    def video_update_viewpoint(self, viewpoint, absolute):
+        return 0
+
+
+class BoundFacade(_VlcObjectFacade):
+    bound_methods = ("get_position",)
+
+    def __init__(self, vlc_obj):
+        self.forwarded = []
+        self._vlc_obj = vlc_obj
+        self._bind_methods()
+
+    def __getattr__(self, attribute):
+        self.forwarded.append(attribute)
+        return super().__getattr__(attribute)
+
+
+def test_facade_forwards_each_method_once():
+    bound = BoundFacade(FakeVlcMediaPlayer())
+    for _ in range(3):
+        assert bound.get_position() == 0.5
+        assert bound.video_update_viewpoint(None, True) == 0
+    # Listed methods are bound on init and the rest on first use
+    assert bound.forwarded == ["video_update_viewpoint"]
+    assert {"get_position", "video_update_viewpoint"} <= set(vars(bound))
+
+
+class FakeEventManager:
+    def __init__(self):
+        self.callbacks = {}
+
+    def event_attach(self, event_type, callback, *args):
+        self.callbacks[event_type] = (callback, args)
+
+    def event_detach(self, event_type):
+        del self.callbacks[event_type]
+
+    def fire(self, event_type, **values):
+        event = vlc.Event()
+        for field, value in values.items():
+            setattr(event.u, field, value)
+        callback, args = self.callbacks[event_type]
+        callback(event, *args)
+
+
+class FakeEventSource:
+    def __init__(self):
+        self.manager = FakeEventManager()
+
+    def event_manager(self):
+        return self.manager
+
+
+def test_events_attach_only_while_connected(qtbot):
+    source = FakeEventSource()
+    signals = MediaPlayerVlclibSignals(vlc_media_player=source)
+    assert source.manager.callbacks == {}
+
+    received = []
+    first, second = received.append, lambda e: None
+    signals.positionchanged.connect(first)
+    signals.positionchanged.connect(second)
+    assert signals.attached_events() == {"positionchanged"}
+
+    source.manager.fire(vlc.EventType.MediaPlayerPositionChanged)
+    qtbot.waitUntil(lambda: len(received) == 1)
+    assert signals.events_received["positionchanged"] == 1
+    assert signals.events_delivered["positionchanged"] == 1
+
+    signals.positionchanged.disconnect(first)
+    assert signals.attached_events() == {"positionchanged"}
+    signals.positionchanged.disconnect(second)
+    assert signals.attached_events() == set()
+    assert source.manager.callbacks == {}
+
+
+def test_event_bridge_stress(qtbot):
+    """Fire thousands of events from another thread, as libvlc would"""
+    source = FakeEventSource()
+    signals = MediaPlayerVlclibSignals(vlc_media_player=source)
+    positions, buffering = [], []
+    signals.positionchanged.connect(lambda e: positions.append(e.value))
+    signals.buffering.connect(lambda e: buffering.append(e.value))
+    count = 20000
+
+    def fire_events():
+        for n in range(count):
+            source.manager.fire(
+                vlc.EventType.MediaPlayerPositionChanged, new_position=n / count
+            )
+            if n % 100 == 0:
+                source.manager.fire(
+                    vlc.EventType.MediaPlayerBuffering, new_cache=n // 100
+                )
+
+    thread = threading.Thread(target=fire_events)
+    thread.start()
+    qtbot.waitUntil(lambda: not thread.is_alive(), timeout=10000)
+    last_position = pytest.approx((count - 1) / count)  # new_position is a c_float
+    qtbot.waitUntil(lambda: positions and positions[-1] == last_position)
+
+    # Position updates are coalesced, buffering updates are all delivered in order
+    assert signals.events_received["positionchanged"] == count
+    assert signals.events_delivered["positionchanged"] == len(positions) < count
+    assert buffering == list(range(count // 100))
+    assert all(isinstance(value, float) for value in positions)
+
+
+def test_events_are_delivered_in_arrival_order(qtbot):
+    source = FakeEventSource()
+    signals = MediaPlayerVlclibSignals(vlc_media_player=source)
+    received = []
+    signals.positionchanged.connect(lambda e: received.append(("position", e.value)))
+    signals.stopped.connect(lambda e: received.append(("stopped", None)))
+
+    # Fired before the Qt thread runs, as from libvlc's thread
+    fire = source.manager.fire
+    fire(vlc.EventType.MediaPlayerPositionChanged, new_position=0.25)
+    fire(vlc.EventType.MediaPlayerStopped)
+    qtbot.waitUntil(lambda: len(received) == 2)
+    assert received == [("position", 0.25), ("stopped", None)]
+
+    received.clear()
+    fire(vlc.EventType.MediaPlayerPositionChanged, new_position=0.5)
+    fire(vlc.EventType.MediaPlayerStopped)
+    fire(vlc.EventType.MediaPlayerPositionChanged, new_position=0.0)
+    qtbot.waitUntil(lambda: len(received) == 2)
+    assert received == [("stopped", None), ("position", 0.0)]
+
+
+class FakeCallbackPlayer:
+    def video_set_callbacks(self, lock, unlock, display, opaque):
+        self.callbacks = (lock, unlock, display)
+
+    def video_set_format(self, chroma, width, height, pitch):
+        self.format = (chroma, width, height, pitch)
+
+
+def test_frame_callbacks(qtbot):
+    player = FakeCallbackPlayer()
+    frames = FrameCallbacks(media_player=player)
+    lock, unlock, display = player.callbacks
+    frames.set_format(4, 2)
+    assert player.format == ("RV32", 4, 2, 16)
+
+    displayed = []
+    frames.framedisplayed.connect(displayed.append)
+    planes = (ctypes.c_void_p * 1)()
+    addresses = []
+    for _ in range(5):
+        picture = lock(None, planes)
+        addresses.append(planes[0])
+        unlock(None, picture, planes)
+        display(None, picture)
+    qtbot.waitUntil(lambda: bool(displayed))
+
+    # Pictures rotate through the buffers, and only the latest frame is delivered
+    assert len(set(addresses)) == frames.buffers.count
+    assert frames.frames_displayed == 5
+    assert displayed == [frames.latest]
+    assert displayed[0].index == 4
+    assert displayed[0].pts_us > 0
+    assert frames.image(displayed[0]).size().width() == 4
+
+
+def test_frame_buffer_ring_reuses_maps():
+    ring = FrameBufferRing(count=2)
+    ring.allocate(4 * 4 * 2)
+    addresses = [ring.address(0), ring.address(1)]
+    ring.allocate(4 * 2 * 2)  # A smaller format fits in the same maps
+    assert [ring.address(0), ring.address(1)] == addresses
+
+    ctypes.memset(ring.address(1), 0xFF, 4 * 4 * 2)
+    image = ring.image(1, width=4, height=2, pitch=16)
+    assert image.pixel(3, 1) == 0xFFFFFFFF
+    ring.release()
+    assert ring.capacity == 0
+
+
+def test_frame_buffer_ring_array_view():
+    numpy = pytest.importorskip("numpy")
+    ring = FrameBufferRing(count=1)
+    ring.allocate(8 * 2)
+    array = ring.array(0, width=1, height=2, pitch=8)
+    assert array.shape == (2, 1, 4)
+    ctypes.memset(ring.address(0) + 8, 7, 4)
+    assert numpy.all(array[1, 0] == 7)  # A view, not a copy
+
+
+def test_frame_callbacks_skip_pinned_buffer(qtbot):
+    player = FakeCallbackPlayer()
+    frames = FrameCallbacks(media_player=player)
+    lock, unlock, display = player.callbacks
+    frames.set_format(4, 2)
+    planes = (ctypes.c_void_p * 1)()
+
+    def present():
+        picture = lock(None, planes)
+        unlock(None, picture, planes)
+        display(None, picture)
+        return picture - 1
+
+    present()
+    with frames.pinned() as pinned:
+        assert pinned is frames.latest
+        # Frames keep arriving while the pinned frame is painted
+        buffers = [present() for _ in range(6)]
+        assert pinned.buffer not in buffers
+    assert frames._pinned is None
+    assert pinned.buffer in [present() for _ in range(3)]
+
+    with pytest.raises(ValueError):
+        FrameCallbacks(media_player=FakeCallbackPlayer(), buffer_count=2)
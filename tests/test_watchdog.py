@@ -0,0 +1,37 @@
+import time
+
+from app.utils.watchdog import StallWatchdog
+
+
+def block_gui_thread(seconds):
+    time.sleep(seconds)
+
+
+def test_watchdog_reports_stalls(qtbot, tmp_path):
+    watchdog = StallWatchdog(tmp_path, threshold_ms=100, interval=20, package=__name__)
+    watchdog.start()
+    try:
+        qtbot.wait(100)
+        block_gui_thread(0.4)
+        qtbot.waitUntil(lambda: watchdog.stalls == 1, timeout=1000)
+    finally:
+        watchdog.stop()
+
+    (report,) = watchdog.reports
+    assert report.parent == tmp_path
+    text = report.read_text()
+    assert f"module: {__name__}:block_gui_thread" in text
+    assert "time.sleep(seconds)" in text
+    assert watchdog.max_lag_ms >= 300
+
+
+def test_watchdog_is_quiet_when_responsive(qtbot, tmp_path):
+    watchdog = StallWatchdog(tmp_path, threshold_ms=200, interval=20)
+    watchdog.start()
+    try:
+        qtbot.wait(300)
+    finally:
+        watchdog.stop()
+    assert watchdog.stalls == 0
+    assert watchdog.reports == []
+    assert not list(tmp_path.iterdir())